@@ -33,9 +33,17 @@ SET row_security = off;
 
 SET default_table_access_method = heap;
 
+-- Trigram similarity and indexes for the catalog part search
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
 
+
+DROP TABLE IF EXISTS public.schema_migration;
 DROP TABLE IF EXISTS public.serialized_part;
+DROP TABLE IF EXISTS public.serialized_part_key;
 DROP TABLE IF EXISTS public.jis_part;
+DROP TABLE IF EXISTS public.jis_part_key;
+DROP FUNCTION IF EXISTS public.maintain_serialized_part_key();
+DROP FUNCTION IF EXISTS public.maintain_jis_part_key();
 DROP TABLE IF EXISTS public.batch_business_partner;
 DROP TABLE IF EXISTS public.batch;
 DROP TABLE IF EXISTS public.partner_catalog_part;
@@ -79,11 +87,16 @@ CREATE TABLE public.catalog_part (
 	category character varying,
 	bpns character varying,
     description character varying,
-    materials json,
-    width json,
-    height json,
-    length json,
-    weight json
+    materials jsonb,
+    width jsonb,
+    height jsonb,
+    length jsonb,
+    weight jsonb,
+    status smallint DEFAULT 0 NOT NULL,
+    width_mm double precision GENERATED ALWAYS AS (CASE width ->> 'unit' WHEN 'mm' THEN (width ->> 'value')::double precision WHEN 'cm' THEN (width ->> 'value')::double precision * 10 WHEN 'm' THEN (width ->> 'value')::double precision * 1000 END) STORED,
+    height_mm double precision GENERATED ALWAYS AS (CASE height ->> 'unit' WHEN 'mm' THEN (height ->> 'value')::double precision WHEN 'cm' THEN (height ->> 'value')::double precision * 10 WHEN 'm' THEN (height ->> 'value')::double precision * 1000 END) STORED,
+    length_mm double precision GENERATED ALWAYS AS (CASE length ->> 'unit' WHEN 'mm' THEN (length ->> 'value')::double precision WHEN 'cm' THEN (length ->> 'value')::double precision * 10 WHEN 'm' THEN (length ->> 'value')::double precision * 1000 END) STORED,
+    weight_kg double precision GENERATED ALWAYS AS (CASE weight ->> 'unit' WHEN 'g' THEN (weight ->> 'value')::double precision * 0.001 WHEN 'kg' THEN (weight ->> 'value')::double precision END) STORED
 );
 
 CREATE TABLE public.data_exchange_agreement (
@@ -154,23 +167,98 @@ CREATE TABLE public.twin_registration (
     dtr_registered boolean DEFAULT false NOT NULL
 );
 
+-- The instance level parts are range partitioned by month: JIS parts by their JIS call date (the current time if
+-- not given), serialized parts by their creation date. The monthly partitions (<table>_YYYY_MM) are created ahead
+-- of time and detached and dropped beyond the retention by the backend (see managers/metadata_database/partitioning.py).
+-- There is no default partition, as it would prevent detaching partitions concurrently (PostgreSQL 14 or later).
 CREATE TABLE public.jis_part (
     id integer NOT NULL,
     partner_catalog_part_id integer NOT NULL,
     jis_number character varying NOT NULL,
     parent_order_number character varying,
-    jis_call_date timestamp without time zone,
+    jis_call_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
     twin_id integer
-);
+) PARTITION BY RANGE (jis_call_date);
 
 CREATE TABLE public.serialized_part (
     id integer NOT NULL,
     partner_catalog_part_id integer NOT NULL,
     part_instance_id character varying NOT NULL,
     van character varying,
+    twin_id integer,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+) PARTITION BY RANGE (created_date);
+
+-- Unique constraints of partitioned tables are only enforced within a partition: the natural keys and the twins of
+-- the instance level parts are kept unique across all partitions by these (unpartitioned) key tables, maintained by
+-- triggers of the part tables. A writer may claim the keys of new parts beforehand (INSERT ... ON CONFLICT DO NOTHING,
+-- without part ID); a claim is taken over by the part inserted for it.
+CREATE TABLE public.jis_part_key (
+    partner_catalog_part_id integer NOT NULL,
+    jis_number character varying NOT NULL,
+    jis_part_id integer,
     twin_id integer
 );
 
+CREATE TABLE public.serialized_part_key (
+    partner_catalog_part_id integer NOT NULL,
+    part_instance_id character varying NOT NULL,
+    serialized_part_id integer,
+    twin_id integer
+);
+
+CREATE FUNCTION public.maintain_jis_part_key() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM public.jis_part_key
+            WHERE partner_catalog_part_id = OLD.partner_catalog_part_id AND jis_number = OLD.jis_number;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO public.jis_part_key AS k (partner_catalog_part_id, jis_number, jis_part_id, twin_id)
+            VALUES (NEW.partner_catalog_part_id, NEW.jis_number, NEW.id, NEW.twin_id)
+            ON CONFLICT (partner_catalog_part_id, jis_number) DO UPDATE
+            SET jis_part_id = EXCLUDED.jis_part_id, twin_id = EXCLUDED.twin_id
+            WHERE k.jis_part_id IS NULL;
+        IF NOT FOUND THEN
+            RAISE unique_violation USING
+                MESSAGE = 'duplicate key value violates unique constraint "pk_jis_part_key"',
+                DETAIL = format('Key (partner_catalog_part_id, jis_number)=(%s, %s) already exists.', NEW.partner_catalog_part_id, NEW.jis_number),
+                TABLE = 'jis_part_key',
+                CONSTRAINT = 'pk_jis_part_key';
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE FUNCTION public.maintain_serialized_part_key() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM public.serialized_part_key
+            WHERE partner_catalog_part_id = OLD.partner_catalog_part_id AND part_instance_id = OLD.part_instance_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO public.serialized_part_key AS k (partner_catalog_part_id, part_instance_id, serialized_part_id, twin_id)
+            VALUES (NEW.partner_catalog_part_id, NEW.part_instance_id, NEW.id, NEW.twin_id)
+            ON CONFLICT (partner_catalog_part_id, part_instance_id) DO UPDATE
+            SET serialized_part_id = EXCLUDED.serialized_part_id, twin_id = EXCLUDED.twin_id
+            WHERE k.serialized_part_id IS NULL;
+        IF NOT FOUND THEN
+            RAISE unique_violation USING
+                MESSAGE = 'duplicate key value violates unique constraint "pk_serialized_part_key"',
+                DETAIL = format('Key (partner_catalog_part_id, part_instance_id)=(%s, %s) already exists.', NEW.partner_catalog_part_id, NEW.part_instance_id),
+                TABLE = 'serialized_part_key',
+                CONSTRAINT = 'pk_serialized_part_key';
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
 ALTER TABLE public.batch ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
     SEQUENCE NAME public.batch_id_seq
     START WITH 1
@@ -301,8 +389,12 @@ ALTER TABLE ONLY public.data_exchange_contract
 ALTER TABLE ONLY public.enablement_service_stack
     ADD CONSTRAINT pk_enablement_service_stack PRIMARY KEY (id);
 
-ALTER TABLE ONLY public.jis_part
-    ADD CONSTRAINT pk_jis_part PRIMARY KEY (id);
+-- Primary keys of partitioned tables contain the partition key
+ALTER TABLE public.jis_part
+    ADD CONSTRAINT pk_jis_part PRIMARY KEY (id, jis_call_date);
+
+ALTER TABLE ONLY public.jis_part_key
+    ADD CONSTRAINT pk_jis_part_key PRIMARY KEY (partner_catalog_part_id, jis_number);
 
 ALTER TABLE ONLY public.legal_entity
     ADD CONSTRAINT pk_legal_entity PRIMARY KEY (id);
@@ -310,8 +402,11 @@ ALTER TABLE ONLY public.legal_entity
 ALTER TABLE ONLY public.partner_catalog_part
     ADD CONSTRAINT pk_partner_catalog_part PRIMARY KEY (id);
 
-ALTER TABLE ONLY public.serialized_part
-    ADD CONSTRAINT pk_serialized_part PRIMARY KEY (id);
+ALTER TABLE public.serialized_part
+    ADD CONSTRAINT pk_serialized_part PRIMARY KEY (id, created_date);
+
+ALTER TABLE ONLY public.serialized_part_key
+    ADD CONSTRAINT pk_serialized_part_key PRIMARY KEY (partner_catalog_part_id, part_instance_id);
 
 ALTER TABLE ONLY public.twin
     ADD CONSTRAINT pk_twin PRIMARY KEY (id);
@@ -350,10 +445,11 @@ ALTER TABLE ONLY public.data_exchange_agreement
 ALTER TABLE ONLY public.enablement_service_stack
     ADD CONSTRAINT uk_enablement_service_stack_name UNIQUE (name);
 
-ALTER TABLE ONLY public.jis_part
-    ADD CONSTRAINT uk_jis_part_partner_catalog_part_id_jis_number UNIQUE (jis_number, partner_catalog_part_id);
-ALTER TABLE ONLY public.jis_part
-    ADD CONSTRAINT uk_jis_part_twin_id UNIQUE (twin_id);
+-- A JIS part and its twin are in at most one key
+ALTER TABLE ONLY public.jis_part_key
+    ADD CONSTRAINT uk_jis_part_key_jis_part_id UNIQUE (jis_part_id);
+ALTER TABLE ONLY public.jis_part_key
+    ADD CONSTRAINT uk_jis_part_key_twin_id UNIQUE (twin_id);
 
 ALTER TABLE ONLY public.legal_entity
     ADD CONSTRAINT uk_legal_entity_bpnl UNIQUE (bpnl);
@@ -361,10 +457,11 @@ ALTER TABLE ONLY public.legal_entity
 ALTER TABLE ONLY public.partner_catalog_part
     ADD CONSTRAINT uk_partner_catalog_part_business_partner_id_catalog_part_id UNIQUE (business_partner_id, catalog_part_id);
 
-ALTER TABLE ONLY public.serialized_part
-    ADD CONSTRAINT uk_serialized_part_partner_catalog_part_id_part_instance_id UNIQUE (part_instance_id, partner_catalog_part_id);
-ALTER TABLE ONLY public.serialized_part
-    ADD CONSTRAINT uk_serialized_part_twin_id UNIQUE (twin_id);
+-- A serialized part and its twin are in at most one key
+ALTER TABLE ONLY public.serialized_part_key
+    ADD CONSTRAINT uk_serialized_part_key_serialized_part_id UNIQUE (serialized_part_id);
+ALTER TABLE ONLY public.serialized_part_key
+    ADD CONSTRAINT uk_serialized_part_key_twin_id UNIQUE (twin_id);
 
 ALTER TABLE ONLY public.twin
     ADD CONSTRAINT uk_twin_global_id UNIQUE (global_id);
@@ -385,6 +482,15 @@ CREATE INDEX idx_business_partner_name ON public.business_partner USING btree (n
 
 CREATE INDEX idx_catalog_part_legal_entitiy_id ON public.catalog_part USING btree (legal_entity_id);
 CREATE INDEX idx_catalog_part_manufacturer_part_id ON public.catalog_part USING btree (manufacturer_part_id) WITH (deduplicate_items='true');
+CREATE INDEX idx_catalog_part_status_id ON public.catalog_part USING btree (status, id);
+CREATE INDEX idx_catalog_part_materials ON public.catalog_part USING gin (materials jsonb_path_ops);
+CREATE INDEX idx_catalog_part_width_mm ON public.catalog_part USING btree (width_mm);
+CREATE INDEX idx_catalog_part_height_mm ON public.catalog_part USING btree (height_mm);
+CREATE INDEX idx_catalog_part_length_mm ON public.catalog_part USING btree (length_mm);
+CREATE INDEX idx_catalog_part_weight_kg ON public.catalog_part USING btree (weight_kg);
+CREATE INDEX idx_catalog_part_name_trgm ON public.catalog_part USING gin (name public.gin_trgm_ops);
+CREATE INDEX idx_catalog_part_manufacturer_part_id_trgm ON public.catalog_part USING gin (manufacturer_part_id public.gin_trgm_ops);
+CREATE INDEX idx_catalog_part_category_trgm ON public.catalog_part USING gin (category public.gin_trgm_ops);
 
 CREATE INDEX idx_enablement_service_stack_legal_entity_id ON public.enablement_service_stack USING btree (legal_entity_id);
 
@@ -392,20 +498,23 @@ CREATE INDEX idx_jis_part_jis_number ON public.jis_part USING btree (jis_number)
 CREATE INDEX idx_jis_part_parent_order_number ON public.jis_part USING btree (parent_order_number) WITH (deduplicate_items='true');
 CREATE INDEX idx_jis_part_jis_call_date ON public.jis_part USING btree (jis_call_date);
 CREATE INDEX idx_jis_part_partner_catalog_part_id ON public.jis_part USING btree (partner_catalog_part_id);
+CREATE INDEX idx_jis_part_twin_id ON public.jis_part USING btree (twin_id);
 
 CREATE INDEX idx_legal_entity_bpnl ON public.legal_entity USING btree (bpnl) WITH (deduplicate_items='true');
 
 CREATE INDEX idx_partner_catalog_part_business_partner_id ON public.partner_catalog_part USING btree (business_partner_id);
 CREATE INDEX idx_partner_catalog_part_catalog_part_id ON public.partner_catalog_part USING btree (catalog_part_id);
 CREATE INDEX idx_partner_catalog_part_customer_part_id ON public.partner_catalog_part USING btree (customer_part_id) WITH (deduplicate_items='true');
+CREATE INDEX idx_partner_catalog_part_customer_part_id_trgm ON public.partner_catalog_part USING gin (customer_part_id public.gin_trgm_ops);
 
 CREATE INDEX idx_serialized_part_part_instance_id ON public.serialized_part USING btree (part_instance_id) WITH (deduplicate_items='true');
 CREATE INDEX idx_serialized_part_partner_catalog_part_id ON public.serialized_part USING btree (partner_catalog_part_id);
 CREATE INDEX idx_serialized_part_van ON public.serialized_part USING btree (van) WITH (deduplicate_items='true');
+CREATE INDEX idx_serialized_part_twin_id ON public.serialized_part USING btree (twin_id);
 
 CREATE INDEX idx_twin_aspect_registration_created_date ON public.twin_aspect_registration USING btree (created_date) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_aspect_registration_modified_date ON public.twin_aspect_registration USING btree (modified_date) WITH (deduplicate_items='true');
-CREATE INDEX idx_twin_aspect_registration_status ON public.twin_aspect_registration USING btree (status);
+CREATE INDEX idx_twin_aspect_registration_pending ON public.twin_aspect_registration USING btree (enablement_service_stack_id, modified_date) WHERE (status < 3);
 CREATE INDEX idx_twin_aspect_registration_registration_mode ON public.twin_aspect_registration USING btree (registration_mode);
 
 CREATE INDEX idx_twin_aspect_semantic_id ON public.twin_aspect USING btree (semantic_id) WITH (deduplicate_items='true');
@@ -415,9 +524,9 @@ CREATE INDEX idx_twin_created_date ON public.twin USING btree (created_date) WIT
 CREATE INDEX idx_twin_modified_date ON public.twin USING btree (modified_date) WITH (deduplicate_items='true');
 
 CREATE INDEX idx_twin_exchange_data_exchange_agreement_id ON public.twin_exchange USING btree (data_exchange_agreement_id);
-CREATE INDEX idx_twin_exchange_twin_id ON public.twin_exchange USING btree (twin_id);
+CREATE INDEX idx_twin_exchange_twin_id_data_exchange_agreement_id ON public.twin_exchange USING btree (twin_id, data_exchange_agreement_id);
 
-CREATE INDEX idx_twin_registration_dtr_registered ON public.twin_registration USING btree (dtr_registered);
+CREATE INDEX idx_twin_registration_twin_id_dtr_registered ON public.twin_registration USING btree (twin_id, dtr_registered);
 
 
 ALTER TABLE ONLY public.batch
@@ -439,9 +548,9 @@ ALTER TABLE ONLY public.data_exchange_contract
 ALTER TABLE ONLY public.enablement_service_stack
     ADD CONSTRAINT fk_enablement_service_stack_legal_entity_id FOREIGN KEY (legal_entity_id) REFERENCES public.legal_entity(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
-ALTER TABLE ONLY public.jis_part
+ALTER TABLE public.jis_part
     ADD CONSTRAINT fk_jis_part_partner_catalog_part_id FOREIGN KEY (partner_catalog_part_id) REFERENCES public.partner_catalog_part(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
-ALTER TABLE ONLY public.jis_part
+ALTER TABLE public.jis_part
     ADD CONSTRAINT fk_jis_part_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 ALTER TABLE ONLY public.partner_catalog_part
@@ -449,11 +558,16 @@ ALTER TABLE ONLY public.partner_catalog_part
 ALTER TABLE ONLY public.partner_catalog_part
     ADD CONSTRAINT fk_partner_catalog_part_catalog_part_id FOREIGN KEY (catalog_part_id) REFERENCES public.catalog_part(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
-ALTER TABLE ONLY public.serialized_part
+ALTER TABLE public.serialized_part
     ADD CONSTRAINT fk_serialized_part_partner_catalog_part_id FOREIGN KEY (partner_catalog_part_id) REFERENCES public.partner_catalog_part(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
-ALTER TABLE ONLY public.serialized_part
+ALTER TABLE public.serialized_part
     ADD CONSTRAINT fk_serialized_part_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
+CREATE TRIGGER trg_jis_part_key AFTER INSERT OR DELETE OR UPDATE OF partner_catalog_part_id, jis_number, twin_id ON public.jis_part
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_jis_part_key();
+CREATE TRIGGER trg_serialized_part_key AFTER INSERT OR DELETE OR UPDATE OF partner_catalog_part_id, part_instance_id, twin_id ON public.serialized_part
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_serialized_part_key();
+
 ALTER TABLE ONLY public.twin_aspect
     ADD CONSTRAINT fk_twin_aspect_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
@@ -482,4 +596,17 @@ ALTER SEQUENCE public.legal_entity_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.part_share_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.serialized_part_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.twin_aspect_id_seq RESTART WITH 1;
-ALTER SEQUENCE public.twin_twin_id_seq RESTART WITH 1;
\ No newline at end of file
+ALTER SEQUENCE public.twin_twin_id_seq RESTART WITH 1;
+-- Versioned migrations applied by the backend (see ichub-backend/migrations); this schema already contains the listed versions
+CREATE TABLE public.schema_migration (
+    version integer NOT NULL,
+    description character varying NOT NULL,
+    checksum character varying NOT NULL,
+    applied_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    CONSTRAINT pk_schema_migration PRIMARY KEY (version)
+);
+
+INSERT INTO public.schema_migration (version, description, checksum) VALUES
+    (1, 'baseline', '8f8c4c9b4a21b4126020690c9015b553ed5d5ebffc733e48f0e8aea803265adb'),
+    (2, 'performance indexes', '7ab8d19f58a44d0e23868d544540b10803c0d4b7bfba0e616adbb68e4ffebe65'),
+    (3, 'instance part keys', 'aa557c3e249b3e37e24c86c9df5f4f229b06c5ec682071968bb2f72b284412d4');
@@ -0,0 +1,122 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Benchmark of the read paths of the catalog part listing.
+
+Compares, per catalog part, reading the listing through the ORM (LIST loading profile, hydrated
+CatalogPart instances mapped to the response model) with the Core read path (plain list records
+mapped directly to the response model), in time per row and peak memory (tracemalloc).
+Runs against an in-memory SQLite database, so that the Python-side overhead dominates.
+
+Usage (from the ichub-backend directory):
+    python -m benchmarks.catalog_part_listing [--parts 100000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session
+
+from managers.metadata_database.repositories import CatalogPartRepository, LoadingProfile
+from models.metadata_database.models import CatalogPart, LegalEntity
+from services.part_management_service import PartManagementService
+
+def _seed(session: Session, parts: int) -> None:
+    legal_entity = LegalEntity(bpnl="BPNL00000000BENCH")
+    session.add(legal_entity)
+    session.flush()
+    rows = [{
+        "legal_entity_id": legal_entity.id,
+        "manufacturer_part_id": f"MPI-{i:07d}",
+        "name": f"Catalog part {i}",
+        "category": "bench",
+        "description": "A catalog part seeded by the benchmark " * 4,
+        "materials": [{"name": "aluminium", "share": 60}, {"name": "steel", "share": 40}],
+        "width": {"value": i % 1000, "unit": "mm"},
+        "weight": {"value": i % 50, "unit": "kg"},
+        "status": i % 4,
+    } for i in range(parts)]
+    session.execute(insert(CatalogPart), rows)
+    session.commit()
+
+def _read_paths(session: Session) -> Dict[str, Callable[[], List[object]]]:
+    """Per read path: a callable reading the whole listing and mapping it to the response model."""
+    repository = CatalogPartRepository(session)
+
+    def orm() -> List[object]:
+        rows = repository.find_by_manufacturer_id_manufacturer_part_id(None, None, profile=LoadingProfile.LIST)
+        items = [PartManagementService._to_simple_catalog_part_read(db_catalog_part, status) for db_catalog_part, status in rows]
+        # The instances stay in the identity map of the session until it is cleared
+        session.expunge_all()
+        return items
+
+    def records() -> List[object]:
+        return [PartManagementService._record_to_simple_catalog_part_read(record) for record in repository.find_list_records()]
+
+    return {"ORM (LIST profile)": orm, "Core list records": records}
+
+def _timed(call: Callable[[], List[object]]) -> float:
+    """Return the time in seconds of one call."""
+    gc.collect()
+    start = perf_counter()
+    call()
+    return perf_counter() - start
+
+def _peak_memory(call: Callable[[], List[object]], expected: int) -> int:
+    """Return the peak traced memory in bytes of one call."""
+    gc.collect()
+    tracemalloc.start()
+    items = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(items) == expected, f"read {len(items)} of {expected} catalog parts"
+    return peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parts", type=int, default=100000, help="Number of catalog parts to list.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per read path, the fastest one is reported.")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        _seed(session, args.parts)
+        print(f"{'read path':<20} {'us/row':>8} {'total s':>8} {'peak MB':>8} {'speedup':>8}")
+        baseline = None
+        for read_path, call in _read_paths(session).items():
+            # tracemalloc slows down allocations, so time and memory are measured in separate runs
+            call()
+            elapsed = min(_timed(call) for _ in range(args.repeat))
+            peak = _peak_memory(call, args.parts)
+            baseline = baseline or elapsed
+            print(f"{read_path:<20} {elapsed / args.parts * 1e6:>8.2f} {elapsed:>8.2f} {peak / 2**20:>8.1f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
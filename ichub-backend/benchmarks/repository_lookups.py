@@ -0,0 +1,145 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Microbenchmark of the hot point lookups of the metadata database repositories.
+
+Compares, per lookup, a statement built on every call (as the repositories used to do),
+a `lambda_stmt` and the pre-built statement with bound parameters used by the repositories.
+Runs against an in-memory SQLite database, so that the Python-side overhead dominates.
+
+Usage (from the ichub-backend directory):
+    python -m benchmarks.repository_lookups [--iterations 5000]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, Dict
+from uuid import uuid4
+
+from sqlalchemy import create_engine, lambda_stmt
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, select
+
+from managers.metadata_database.repositories import (
+    BusinessPartnerRepository,
+    LegalEntityRepository,
+    TwinAspectRepository,
+    TwinExchangeRepository,
+    TwinRegistrationRepository,
+    TwinRepository,
+)
+from models.metadata_database.models import (
+    BusinessPartner,
+    DataExchangeAgreement,
+    EnablementServiceStack,
+    LegalEntity,
+    Twin,
+    TwinAspect,
+    TwinExchange,
+    TwinRegistration,
+)
+
+def _seed(session: Session) -> Dict[str, object]:
+    legal_entity = LegalEntity(bpnl="BPNL00000000BENCH")
+    business_partner = BusinessPartner(name="bench", bpnl="BPNL0000000PARTNER")
+    twin = Twin(global_id=uuid4(), dtr_aas_id=uuid4())
+    session.add_all([legal_entity, business_partner, twin])
+    session.flush()
+    agreement = DataExchangeAgreement(name="default", business_partner_id=business_partner.id)
+    stack = EnablementServiceStack(name="bench", legal_entity_id=legal_entity.id)
+    aspect = TwinAspect(twin_id=twin.id, semantic_id="urn:bench#Aspect", submodel_id=uuid4())
+    session.add_all([agreement, stack, aspect])
+    session.flush()
+    session.add_all([
+        TwinExchange(twin_id=twin.id, data_exchange_agreement_id=agreement.id),
+        TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id),
+    ])
+    session.commit()
+    return {"bpnl": legal_entity.bpnl, "partner_bpnl": business_partner.bpnl, "global_id": twin.global_id,
+            "twin_id": twin.id, "semantic_id": aspect.semantic_id, "dea_id": agreement.id, "ess_id": stack.id}
+
+def _lookups(session: Session, k: Dict[str, object]) -> Dict[str, Dict[str, Callable[[], object]]]:
+    """Per lookup: the variants to compare, each a callable executing the lookup once."""
+    # lambda_stmt tracks plain closure variables as bound parameters
+    bpnl, partner_bpnl, global_id = k["bpnl"], k["partner_bpnl"], k["global_id"]
+    twin_id, semantic_id, dea_id, ess_id = k["twin_id"], k["semantic_id"], k["dea_id"], k["ess_id"]
+    return {
+        "LegalEntityRepository.get_by_bpnl": {
+            "select per call": lambda: session.scalars(select(LegalEntity).where(LegalEntity.bpnl == bpnl)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(LegalEntity).where(LegalEntity.bpnl == bpnl))).first(),
+            "pre-built": lambda: LegalEntityRepository(session).get_by_bpnl(bpnl),
+        },
+        "BusinessPartnerRepository.get_by_bpnl": {
+            "select per call": lambda: session.scalars(select(BusinessPartner).where(BusinessPartner.bpnl == partner_bpnl)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(BusinessPartner).where(BusinessPartner.bpnl == partner_bpnl))).first(),
+            "pre-built": lambda: BusinessPartnerRepository(session).get_by_bpnl(partner_bpnl),
+        },
+        "TwinRepository.find_by_global_id": {
+            "select per call": lambda: session.scalars(select(Twin).where(Twin.global_id == global_id)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(Twin).where(Twin.global_id == global_id))).first(),
+            "pre-built": lambda: TwinRepository(session).find_by_global_id(global_id),
+        },
+        "TwinAspectRepository.get_by_twin_id_semantic_id": {
+            "select per call": lambda: session.scalars(select(TwinAspect).where(TwinAspect.twin_id == twin_id).where(TwinAspect.semantic_id == semantic_id)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(TwinAspect).where(TwinAspect.twin_id == twin_id).where(TwinAspect.semantic_id == semantic_id))).first(),
+            "pre-built": lambda: TwinAspectRepository(session).get_by_twin_id_semantic_id(twin_id, semantic_id),
+        },
+        "TwinExchangeRepository.get_by_twin_id_data_exchange_agreement_id": {
+            "select per call": lambda: session.scalars(select(TwinExchange).where(TwinExchange.twin_id == twin_id).where(TwinExchange.data_exchange_agreement_id == dea_id)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(TwinExchange).where(TwinExchange.twin_id == twin_id).where(TwinExchange.data_exchange_agreement_id == dea_id))).first(),
+            "pre-built": lambda: TwinExchangeRepository(session).get_by_twin_id_data_exchange_agreement_id(twin_id, dea_id),
+        },
+        "TwinRegistrationRepository.get_by_twin_id_enablement_service_stack_id": {
+            "select per call": lambda: session.scalars(select(TwinRegistration).where(TwinRegistration.twin_id == twin_id).where(TwinRegistration.enablement_service_stack_id == ess_id)).first(),
+            "lambda_stmt": lambda: session.scalars(lambda_stmt(lambda: select(TwinRegistration).where(TwinRegistration.twin_id == twin_id).where(TwinRegistration.enablement_service_stack_id == ess_id))).first(),
+            "pre-built": lambda: TwinRegistrationRepository(session).get_by_twin_id_enablement_service_stack_id(twin_id, ess_id),
+        },
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Number of executions per lookup and variant.")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        keys = _seed(session)
+        print(f"{'lookup':<70} {'variant':<16} {'us/call':>9} {'speedup':>8}")
+        for lookup, variants in _lookups(session, keys).items():
+            baseline = None
+            for variant, call in variants.items():
+                # Warm up the compiled statement cache before measuring
+                assert call() is not None, f"{lookup} ({variant}) did not find the seeded row"
+                for _ in range(100):
+                    call()
+                start = perf_counter()
+                for _ in range(args.iterations):
+                    call()
+                per_call = (perf_counter() - start) / args.iterations * 1e6
+                baseline = baseline or per_call
+                print(f"{lookup:<70} {variant:<16} {per_call:>9.1f} {baseline / per_call:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
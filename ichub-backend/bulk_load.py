@@ -0,0 +1,85 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Command line entry point bulk loading instance level parts with their twins from CSV extracts (e.g. of a MES)
+into the metadata database, reporting the throughput in rows per second.
+
+Example:
+    python bulk_load.py serialized-part extract.csv --delimiter ";"
+
+The first line of the extract names the columns:
+    serialized-part: manufacturerId, manufacturerPartId, businessPartnerName, partInstanceId[, van]
+    jis-part: manufacturerId, manufacturerPartId, businessPartnerName, jisNumber[, parentOrderNumber, jisCallDate]
+    batch: manufacturerId, manufacturerPartId, batchId[, businessPartnerName]
+Optionally the twins of the parts are given by globalId and dtrAasId, otherwise they are generated.
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+## Import paths
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.dont_write_bytecode = True
+
+from managers.config.log_manager import LoggingManager
+from managers.config.config_manager import ConfigManager
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk load instance level parts with their twins from a CSV extract.")
+    parser.add_argument("part_type", choices=["serialized-part", "jis-part", "batch"], help="The type of the parts in the extract.")
+    parser.add_argument("file", help="The CSV extract, '-' reads it from the standard input.")
+    parser.add_argument("--delimiter", default=",", help="The delimiter of the CSV extract (default: ',').")
+    parser.add_argument("--encoding", default="utf-8", help="The encoding of the CSV extract (default: utf-8).")
+    parser.add_argument("--no-twins", action="store_true", help="Load the parts without creating twins for them.")
+    parser.add_argument("--chunk-size", type=int, help="The number of rows sent to the database by one COPY statement.")
+    args = parser.parse_args()
+
+    LoggingManager.init_logging()
+    ConfigManager.load_config()
+
+    # Imported after loading the configuration, which is read when the database is initialized
+    from models.services.part_management import InstancePartType
+    from services.part_management_service import PartManagementService
+
+    source = sys.stdin if args.file == "-" else open(args.file, newline="", encoding=args.encoding)
+    try:
+        result = PartManagementService().load_instance_parts(
+            InstancePartType(args.part_type), csv.DictReader(source, delimiter=args.delimiter),
+            create_twins=not args.no_twins, **({"chunk_size": args.chunk_size} if args.chunk_size else {}))
+    except ValueError as e:
+        print(f"Bulk load failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    print(result.model_dump_json(by_alias=True, indent=2))
+    print(f"Loaded {result.parts_created} parts of type {args.part_type} ({result.twins_created} twins) from {result.rows_read} rows, "
+          f"skipped {result.rows_skipped}, unresolved {result.rows_unresolved}: "
+          f"{result.rows_per_second} rows/s (copy {result.copy_seconds} s, merge {result.merge_seconds} s)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
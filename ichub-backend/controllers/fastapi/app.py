@@ -22,16 +22,27 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Header, Body
 from fastapi.responses import JSONResponse
 
 from services.submodel_dispatcher_service import SubmodelNotSharedWithBusinessPartnerError
 
 from tools.submodel_type_util import InvalidSemanticIdError
-from tools import InvalidUUIDError
+from tools import InvalidUUIDError, InvalidCursorError
 
 from tractusx_sdk.dataspace.tools import op
 
+from database import create_embedded_database, get_pool_statistics, get_query_statistics, query_scope, query_statistics, QueryScope
+from managers.config.config_manager import ConfigManager
+from managers.metadata_database.advisory_locks import AdvisoryLockTimeoutError
+from managers.metadata_database.change_feed import start_change_feed
+from managers.metadata_database.migrations import apply_migrations_on_startup
+from managers.metadata_database.partitioning import start_partition_maintenance
+from managers.metadata_database.reference_cache import get_reference_cache_statistics
+from warmup import get_warmup_status, start_warmup
+
 from .routers import (
     part_management,
     partner_management,
@@ -68,7 +79,23 @@ tags_metadata = [
     }
 ]
 
-app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Prepares the metadata database: creates the tables of an embedded (SQLite) database or applies the
+    pending schema migrations (PostgreSQL), and starts the background tasks (maintenance of the partitions
+    of the instance level parts, listener of the change feed invalidating the caches on the writes of other replicas).
+    Then warms up the database pools, the reference data cache and the remote connections in the background,
+    the backend reports ready (/health/ready) once done.
+    """
+    create_embedded_database()
+    apply_migrations_on_startup()
+    start_partition_maintenance()
+    start_change_feed()
+    start_warmup()
+    yield
+
+app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata, lifespan=lifespan)
 
 ## Include here all the routers for the application.
 app.include_router(part_management.router)
@@ -78,6 +105,36 @@ app.include_router(submodel_dispatcher.router)
 app.include_router(sharing_handler.router)
 app.include_router(social_network.router)
 
+# Expose the statements executed for a request in a Server-Timing response header
+db_queries_response_header = bool(ConfigManager.get_config("database.instrumentation.responseHeader", default=False))
+
+@app.middleware("http")
+async def database_query_instrumentation(request: Request, call_next):
+    """
+    Attributes the database statements executed while handling a request to the request,
+    aggregated per endpoint (method and route path) in the database query statistics.
+
+    The request is recorded once its response body was sent, so that the statements of streamed
+    responses (e.g. exports) count as well; the Server-Timing header only covers those before the body.
+    """
+    # The endpoint runs in a copy of the context, it keeps attributing its statements to the scope after the exit
+    with query_scope(f"{request.method} {request.url.path}", record=False) as scope:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        # Aggregate by route template (not by the concrete path, which contains IDs)
+        scope.name = f"{request.method} {route.path}" if route is not None else "<unmatched>"
+    if db_queries_response_header:
+        response.headers["Server-Timing"] = f'db;dur={scope.duration * 1000:.3f};desc="{scope.statements} queries"'
+    response.body_iterator = _record_after_body(response.body_iterator, scope)
+    return response
+
+async def _record_after_body(body_iterator, scope: QueryScope):
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    finally:
+        query_statistics.record_scope(scope)
+
 @app.exception_handler(SubmodelNotSharedWithBusinessPartnerError)
 async def submodel_not_shared_with_business_partner_exception_handler(
         request: Request,
@@ -108,6 +165,26 @@ async def invalid_uuid_error_exception_handler(
     """
     return JSONResponse(status_code=422, content={"detail": str(exc)})
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_error_exception_handler(
+    request: Request,
+    exc: InvalidCursorError) -> JSONResponse:
+    """
+    Custom exception handler for InvalidCursorError.
+    Returns a 400 Bad Request with the error message.
+    """
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+@app.exception_handler(AdvisoryLockTimeoutError)
+async def advisory_lock_timeout_error_exception_handler(
+    request: Request,
+    exc: AdvisoryLockTimeoutError) -> JSONResponse:
+    """
+    Custom exception handler for AdvisoryLockTimeoutError.
+    Returns a 409 Conflict with the error message, the request can be retried.
+    """
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
 
 @app.get("/health")
 def check_health():
@@ -120,4 +197,45 @@ def check_health():
     return {
         "status": "RUNNING",
         "timestamp": op.timestamp() 
-    }
\ No newline at end of file
+    }
+
+@app.get("/health/ready")
+def check_readiness():
+    """
+    Retrieves whether the server is ready to serve requests, i.e. its warm-up at startup has completed
+
+    Returns:
+        response: :obj:`status and duration of the warm-up steps` (503 Service Unavailable until ready)
+    """
+    status = get_warmup_status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+@app.get("/health/database-pool")
+def check_database_pool():
+    """
+    Retrieves the live statistics of the metadata database connection pool
+
+    Returns:
+        response: :obj:`checked out and overflow connections, waits and checkout latency histogram`
+    """
+    return get_pool_statistics()
+
+@app.get("/health/database-queries")
+def check_database_queries():
+    """
+    Retrieves the statistics of the statements executed on the metadata database
+
+    Returns:
+        response: :obj:`statement counts and durations per endpoint and per service method, slow statements`
+    """
+    return get_query_statistics()
+
+@app.get("/health/reference-data-cache")
+def check_reference_data_cache():
+    """
+    Retrieves the statistics of the reference data cache (legal entities, business partners, enablement service stacks and data exchange agreements)
+
+    Returns:
+        response: :obj:`cached entries, hits, misses, evictions and invalidations per model`
+    """
+    return get_reference_cache_statistics()
@@ -20,24 +20,90 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Body, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 
+from managers.metadata_database import RepositoryManager, get_repository_manager
 from services.part_management_service import PartManagementService
-from models.services.part_management import CatalogPartRead, CatalogPartCreate, CatalogPartReadWithStatus,SimpleCatalogPartReadWithStatus
+from models.services.part_management import CatalogPartRead, CatalogPartCreate, CatalogPartReadWithStatus, SimpleCatalogPartReadWithStatus, CatalogPartFilter, SerializedPartCreate, SerializedPartRead, SerializedPartDelete
+from tools.cursor_tools import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from tools.export_tools import NDJSON_MEDIA_TYPE, to_ndjson
 
 router = APIRouter(prefix="/part-management", tags=["Part Management"])
 part_management_service = PartManagementService()
 
+MAX_SEARCH_QUERY_LENGTH = 200
+
+# Number of serialized parts accepted by one bulk creation request
+MAX_SERIALIZED_PARTS_PER_REQUEST = 10000
+
 
 @router.get("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartReadWithStatus)
 async def part_management_get_catalog_part(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartReadWithStatus]:
-    return part_management_service.get_catalog_part(manufacturer_id, manufacturer_part_id)
+    return await part_management_service.get_catalog_part_async(manufacturer_id, manufacturer_part_id)
 
 @router.get("/catalog-part", response_model=List[SimpleCatalogPartReadWithStatus])
-async def part_management_get_catalog_parts() -> List[SimpleCatalogPartReadWithStatus]:
-    return part_management_service.get_simple_catalog_parts()
+async def part_management_get_catalog_parts(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The maximum number of catalog parts to return."),
+    cursor: Optional[str] = Query(default=None, description=f"The cursor of the page to return, as received in the {NEXT_CURSOR_HEADER} header of the previous page."),
+    status: Optional[int] = Query(default=None, ge=0, le=3, description="Only return the catalog parts with this status (0: draft, 1: pending, 2: registered, 3: shared)."),
+    filters: CatalogPartFilter = Depends()
+    ) -> List[SimpleCatalogPartReadWithStatus]:
+    page = await part_management_service.get_simple_catalog_parts_async(limit=limit, cursor=cursor, status=status, filters=filters)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+@router.get("/catalog-part/search", response_model=List[SimpleCatalogPartReadWithStatus])
+async def part_management_search_catalog_parts(
+    response: Response,
+    q: str = Query(min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH, description="The text to search for in the name, manufacturer part ID, category and customer part IDs of the catalog parts."),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The maximum number of catalog parts to return."),
+    cursor: Optional[str] = Query(default=None, description=f"The cursor of the page to return, as received in the {NEXT_CURSOR_HEADER} header of the previous page.")
+    ) -> List[SimpleCatalogPartReadWithStatus]:
+    page = await part_management_service.search_catalog_parts_async(q, limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+@router.get("/catalog-part/export", response_class=StreamingResponse)
+async def part_management_export_catalog_parts() -> StreamingResponse:
+    """Export all catalog parts (with details) as newline delimited JSON, streamed while they are read from the database."""
+    return StreamingResponse(to_ndjson(part_management_service.export_catalog_parts()), media_type=NDJSON_MEDIA_TYPE)
 
 @router.post("/catalog-part", response_model=CatalogPartReadWithStatus)
-async def part_management_create_catalog_part(catalog_part_create: CatalogPartCreate) -> CatalogPartReadWithStatus:
-    return part_management_service.create_catalog_part(catalog_part_create)
+def part_management_create_catalog_part(catalog_part_create: CatalogPartCreate, repo: RepositoryManager = Depends(get_repository_manager)) -> CatalogPartReadWithStatus:
+    return part_management_service.create_catalog_part(catalog_part_create, repo=repo)
+
+@router.get("/serialized-part", response_model=List[SerializedPartRead])
+async def part_management_get_serialized_parts(
+    response: Response,
+    manufacturer_id: Optional[str] = Query(default=None, alias="manufacturerId", description="Only return the serialized parts of this manufacturer."),
+    manufacturer_part_id: Optional[str] = Query(default=None, alias="manufacturerPartId", description="Only return the serialized parts of this catalog part."),
+    part_instance_id: Optional[str] = Query(default=None, alias="partInstanceId", description="Only return the serialized parts with this part instance ID."),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The maximum number of serialized parts to return."),
+    cursor: Optional[str] = Query(default=None, description=f"The cursor of the page to return, as received in the {NEXT_CURSOR_HEADER} header of the previous page.")
+    ) -> List[SerializedPartRead]:
+    page = await part_management_service.get_serialized_parts_async(manufacturer_id, manufacturer_part_id, part_instance_id, limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+# The writes of serialized parts run synchronous database code: declared without async, FastAPI runs them
+# in its thread pool instead of blocking the event loop
+@router.post("/serialized-part", response_model=SerializedPartRead)
+def part_management_create_serialized_part(serialized_part_create: SerializedPartCreate, repo: RepositoryManager = Depends(get_repository_manager)) -> SerializedPartRead:
+    return part_management_service.create_serialized_part(serialized_part_create, repo=repo)
+
+@router.post("/serialized-part/bulk", response_model=List[SerializedPartRead])
+def part_management_create_serialized_parts(
+    serialized_part_creates: List[SerializedPartCreate] = Body(min_length=1, max_length=MAX_SERIALIZED_PARTS_PER_REQUEST, description="The serialized parts to create, each with a new twin (all or none)."),
+    repo: RepositoryManager = Depends(get_repository_manager)
+    ) -> List[SerializedPartRead]:
+    return part_management_service.create_serialized_parts(serialized_part_creates, repo=repo)
+
+@router.delete("/serialized-part", status_code=204)
+def part_management_delete_serialized_part(serialized_part_delete: SerializedPartDelete, repo: RepositoryManager = Depends(get_repository_manager)) -> None:
+    part_management_service.delete_serialized_part(serialized_part_delete, repo=repo)
@@ -20,26 +20,35 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query, Response
 from typing import Optional, List
 
+from managers.metadata_database import RepositoryManager, get_repository_manager
 from services.partner_management_service import PartnerManagementService
 from models.services.partner_management import BusinessPartnerRead, BusinessPartnerCreate, DataExchangeAgreementRead
+from tools.cursor_tools import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/partner-management", tags=["Partner Management"])
 partner_management_service = PartnerManagementService()
 
 @router.get("/business-partner", response_model=List[BusinessPartnerRead])
-async def partner_management_get_business_partners() -> List[BusinessPartnerRead]:
-    return partner_management_service.list_business_partners()
+async def partner_management_get_business_partners(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The maximum number of business partners to return."),
+    cursor: Optional[str] = Query(default=None, description=f"The cursor of the page to return, as received in the {NEXT_CURSOR_HEADER} header of the previous page.")
+    ) -> List[BusinessPartnerRead]:
+    page = await partner_management_service.list_business_partners_async(limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 @router.get("/business-partner/{business_partner_number}", response_model=Optional[BusinessPartnerRead])
 async def partner_management_get_business_partner(business_partner_number: str) -> Optional[BusinessPartnerRead]:
-    return partner_management_service.get_business_partner(business_partner_number)
+    return await partner_management_service.get_business_partner_async(business_partner_number)
 
 @router.post("/business-partner", response_model=BusinessPartnerRead)
-async def partner_management_create_business_partner(business_partner_create: BusinessPartnerCreate) -> BusinessPartnerRead:
-    return partner_management_service.create_business_partner(business_partner_create)
+def partner_management_create_business_partner(business_partner_create: BusinessPartnerCreate, repo: RepositoryManager = Depends(get_repository_manager)) -> BusinessPartnerRead:
+    return partner_management_service.create_business_partner(business_partner_create, repo=repo)
 
 @router.get("/business-partner/{business_partner_number}/data-exchange-agreement", response_model=List[DataExchangeAgreementRead])
 async def partner_management_get_data_exchange_agreements(business_partner_number: str) -> List[DataExchangeAgreementRead]:
@@ -20,8 +20,9 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Body, Header
+from fastapi import APIRouter, Body, Depends, Header
 
+from managers.metadata_database import RepositoryManager, get_repository_manager
 from services.sharing_service import SharingService
 from models.services.sharing_management import (
     SharedPartBase,
@@ -33,7 +34,8 @@ router = APIRouter(prefix="/share", tags=["Sharing Functionality"])
 part_sharing_service = SharingService()
 
 @router.post("/catalog-part", response_model=SharedPartBase)
-async def share_catalog_part(catalog_part_to_share: ShareCatalogPart) -> SharedPartBase:
+def share_catalog_part(catalog_part_to_share: ShareCatalogPart, repo: RepositoryManager = Depends(get_repository_manager)) -> SharedPartBase:
     return part_sharing_service.share_catalog_part(
-        catalog_part_to_share=catalog_part_to_share
+        catalog_part_to_share=catalog_part_to_share,
+        repo=repo
     )
\ No newline at end of file
@@ -20,33 +20,52 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Body, Header
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional, Dict
 from uuid import UUID
 
+from managers.metadata_database import RepositoryManager, get_repository_manager
 from services.twin_management_service import TwinManagementService
 from models.services.twin_management import (
     TwinRead, TwinAspectRead, TwinAspectCreate,
     CatalogPartTwinRead, CatalogPartTwinDetailsRead,
     CatalogPartTwinCreate, CatalogPartTwinShare
 )
+from tools.cursor_tools import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from tools.export_tools import NDJSON_MEDIA_TYPE, to_ndjson
 
 router = APIRouter(prefix="/twin-management", tags=["Twin Management"])
 twin_management_service = TwinManagementService()
 
 @router.get("/catalog-part-twin", response_model=List[CatalogPartTwinRead])
-async def twin_management_get_catalog_part_twins(include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
-    return twin_management_service.get_catalog_part_twins(include_data_exchange_agreements=include_data_exchange_agreements)
+async def twin_management_get_catalog_part_twins(
+    response: Response,
+    include_data_exchange_agreements: bool = False,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="The maximum number of catalog part twins to return."),
+    cursor: Optional[str] = Query(default=None, description=f"The cursor of the page to return, as received in the {NEXT_CURSOR_HEADER} header of the previous page.")
+    ) -> List[CatalogPartTwinRead]:
+    page = await twin_management_service.get_catalog_part_twins_async(
+        include_data_exchange_agreements=include_data_exchange_agreements, limit=limit, cursor=cursor)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+@router.get("/catalog-part-twin/export", response_class=StreamingResponse)
+async def twin_management_export_catalog_part_twins(include_data_exchange_agreements: bool = False) -> StreamingResponse:
+    """Export all catalog part twins as newline delimited JSON, streamed while they are read from the database."""
+    return StreamingResponse(
+        to_ndjson(twin_management_service.export_catalog_part_twins(include_data_exchange_agreements=include_data_exchange_agreements)),
+        media_type=NDJSON_MEDIA_TYPE)
 
 @router.get("/catalog-part-twin/{global_id}", response_model=List[CatalogPartTwinDetailsRead])
 async def twin_management_get_catalog_part_twin(global_id: UUID) -> List[CatalogPartTwinDetailsRead]:
-    return twin_management_service.get_catalog_part_twin_details_id(global_id)
+    return await twin_management_service.get_catalog_part_twin_details_id_async(global_id)
 
 @router.get("/catalog-part-twin/{manufacturerId}/{manufacturerPartId}", response_model=List[CatalogPartTwinDetailsRead])
 async def twin_management_get_catalog_part_twin_from_manufacturer(manufacturerId: str, manufacturerPartId: str) -> List[CatalogPartTwinDetailsRead]:
-    return twin_management_service.get_catalog_part_twin_details(manufacturerId, manufacturerPartId)
+    return await twin_management_service.get_catalog_part_twin_details_async(manufacturerId, manufacturerPartId)
 
 @router.post("/catalog-part-twin", response_model=TwinRead)
-async def twin_management_create_catalog_part_twin(catalog_part_twin_create: CatalogPartTwinCreate) -> TwinRead:
-    return twin_management_service.create_catalog_part_twin(catalog_part_twin_create)
+def twin_management_create_catalog_part_twin(catalog_part_twin_create: CatalogPartTwinCreate, repo: RepositoryManager = Depends(get_repository_manager)) -> TwinRead:
+    return twin_management_service.create_catalog_part_twin(catalog_part_twin_create, repo=repo)
@@ -20,25 +20,666 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import re
+from bisect import bisect_left
+from contextlib import AsyncExitStack, ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction, isfunction, isgeneratorfunction
+from itertools import count
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, List, Optional
+
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlmodel import SQLModel, create_engine, text
 from tools import env_tools
 
+logger = LoggingManager.get_logger(__name__)
+
+# Upper bounds (in milliseconds) of the checkout latency histogram buckets
+CHECKOUT_LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+class PoolStatistics:
+    """
+    Thread safe collector for the statistics of the database connection pool.
+    Counters are updated by the instrumented pool and the pool events, the
+    current pool state (checked out, overflow...) is read live from the pool.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.waits = 0
+            self.wait_time_total = 0.0
+            self.checkout_time_total = 0.0
+            self.checkout_time_max = 0.0
+            self.checkout_histogram = [0] * (len(CHECKOUT_LATENCY_BUCKETS_MS) + 1)
+
+    def record_checkout(self, duration: float, waited: bool) -> None:
+        duration_ms = duration * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_time_total += duration
+            self.checkout_time_max = max(self.checkout_time_max, duration)
+            self.checkout_histogram[bisect_left(CHECKOUT_LATENCY_BUCKETS_MS, duration_ms)] += 1
+            if waited:
+                self.waits += 1
+                self.wait_time_total += duration
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        """Return the collected statistics together with the live state of the given pool."""
+        with self._lock:
+            histogram = {f"le_{bound}ms": count for bound, count in zip(CHECKOUT_LATENCY_BUCKETS_MS, self.checkout_histogram)}
+            histogram["le_inf"] = self.checkout_histogram[-1]
+            result: Dict[str, Any] = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "waits": self.waits,
+                "waitTimeTotalMs": round(self.wait_time_total * 1000, 3),
+                "checkoutLatencyAvgMs": round(self.checkout_time_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "checkoutLatencyMaxMs": round(self.checkout_time_max * 1000, 3),
+                "checkoutLatencyHistogram": histogram,
+            }
+
+        result["pool"] = pool.status()
+        if isinstance(pool, QueuePool):
+            result.update({
+                "size": pool.size(),
+                "checkedIn": pool.checkedin(),
+                "checkedOut": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "maxOverflow": getattr(pool, "configured_max_overflow", None),
+            })
+        return result
+
+pool_statistics = PoolStatistics()
+async_pool_statistics = PoolStatistics()
+
+# Async drivers used for the async engine, by backend name of the configured connection string
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Queue pool measuring how long it takes to hand out a connection.
+    A checkout is counted as a wait if no idle connection was available and
+    the overflow was already exhausted at the moment the request was made.
+    """
+
+    statistics = pool_statistics
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        # Reported by the pool statistics (-1: unlimited), QueuePool keeps it private
+        self.configured_max_overflow = -1 if pool_size == 0 else max_overflow
+
+    def _do_get(self):
+        max_overflow = self.configured_max_overflow
+        waited = self.checkedin() == 0 and max_overflow > -1 and self.overflow() >= max_overflow
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.statistics.record_checkout(perf_counter() - start, waited)
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Instrumented queue pool for the async engine."""
+
+    statistics = async_pool_statistics
+
+def _instrumented_poolclass(poolclass, statistics: PoolStatistics):
+    """Derive an instrumented pool class recording into the given statistics (one per engine)."""
+    return type(poolclass.__name__, (poolclass,), {"statistics": statistics})
+
+# Name of the shared-cache in-memory database an in-memory SQLite connection string is mapped to
+SQLITE_MEMORY_DATABASE = "ichub"
+
+def _is_sqlite_memory(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+def _to_embedded_dsn(dsn: str) -> str:
+    """
+    Map an in-memory SQLite connection string (e.g. `sqlite://`) to a named shared-cache in-memory database,
+    so that all connections of the pools (sync and async engine) work on the same database instead of one
+    private database each. All other connection strings are returned unchanged.
+    """
+    url = make_url(dsn)
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        return dsn
+    return url.set(database=f"file:{SQLITE_MEMORY_DATABASE}", query={"mode": "memory", "cache": "shared", "uri": "true"}).render_as_string()
+
+def _build_engine_kwargs(dsn: str, pool_config: Dict[str, Any], poolclass=InstrumentedQueuePool) -> Dict[str, Any]:
+    """Translate the `database.pool` configuration into `create_engine` keyword arguments."""
+    engine_kwargs: Dict[str, Any] = {
+        "poolclass": poolclass,
+        "pool_size": int(pool_config.get("size", 5)),
+        "max_overflow": int(pool_config.get("maxOverflow", 10)),
+        "pool_timeout": float(pool_config.get("timeout", 30)),
+        "pool_recycle": int(pool_config.get("recycle", -1)),
+        "pool_pre_ping": bool(pool_config.get("prePing", False)),
+        "pool_use_lifo": bool(pool_config.get("useLifo", False)),
+    }
+
+    url = make_url(dsn)
+    if url.get_backend_name() == "sqlite":
+        # Connections are handed out to other threads by the pool (and by aiosqlite to its worker thread)
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory(url):
+            # An in-memory database only lives as long as one of its connections is open
+            engine_kwargs["pool_recycle"] = -1
+
+    statement_timeout = int(pool_config.get("statementTimeout", 0))
+    if statement_timeout > 0:
+        if url.get_backend_name() == "postgresql" and url.get_driver_name() == "asyncpg":
+            engine_kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(statement_timeout)}}
+        elif url.get_backend_name() == "postgresql":
+            engine_kwargs["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+        else:
+            logger.warning("The database.pool.statementTimeout setting is only supported for PostgreSQL and will be ignored.")
+
+    return engine_kwargs
+
+db_sqlite_config = ConfigManager.get_config("database.sqlite", default={}) or {}
+
+def _sqlite_pragmas(sqlite_config: Dict[str, Any]) -> List[str]:
+    """Translate the `database.sqlite` configuration into the PRAGMA statements run on every new connection."""
+    return [
+        f"PRAGMA journal_mode = {sqlite_config.get('journalMode', 'WAL')}",
+        f"PRAGMA synchronous = {sqlite_config.get('synchronous', 'NORMAL')}",
+        f"PRAGMA busy_timeout = {int(sqlite_config.get('busyTimeout', 5000))}",
+        # A negative cache size is in KiB instead of pages
+        f"PRAGMA cache_size = {-abs(int(sqlite_config.get('cacheSize', 20000)))}",
+        f"PRAGMA mmap_size = {int(sqlite_config.get('mmapSize', 268435456))}",
+        f"PRAGMA foreign_keys = {'ON' if sqlite_config.get('foreignKeys', True) else 'OFF'}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+
+def _register_sqlite_events(target_engine) -> None:
+    """Tune every new connection of a SQLite engine (no-op for other databases)."""
+    if target_engine.dialect.name != "sqlite":
+        return
+    pragmas = _sqlite_pragmas(db_sqlite_config)
+
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            # In-memory databases keep their journal in memory, the journal mode is ignored for them
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    event.listen(target_engine, "connect", set_pragmas)
+
+def _register_pool_events(target_engine, statistics: PoolStatistics) -> None:
+    event.listen(target_engine, "connect", lambda dbapi_connection, connection_record: statistics.record_connect())
+    event.listen(target_engine, "checkin", lambda dbapi_connection, connection_record: statistics.record_checkin())
+    event.listen(target_engine, "invalidate", lambda dbapi_connection, connection_record, exception: statistics.record_invalidation())
+
+class QueryScope:
+    """Statements executed within one scope (e.g. one request)."""
+
+    __slots__ = ("name", "statements", "duration")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.statements = 0
+        self.duration = 0.0
+
+    def record(self, duration: float) -> None:
+        self.statements += 1
+        self.duration += duration
+
+class QueryStatistics:
+    """
+    Thread safe collector for the SQL statements executed on the metadata database, attributed to
+    the request (see `query_scope`) and the service method (see `instrument_queries`) issuing them.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements = 0
+            self.duration = 0.0
+            self.slow_statements = 0
+            self.requests: Dict[str, List[float]] = {}
+            self.services: Dict[str, List[float]] = {}
+
+    def record_statement(self, service_method: Optional[str], duration: float, slow: bool) -> None:
+        with self._lock:
+            self.statements += 1
+            self.duration += duration
+            self.slow_statements += slow
+            # statements, duration, max duration of a statement
+            entry = self.services.setdefault(service_method or "<unattributed>", [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+
+    def record_scope(self, scope: QueryScope) -> None:
+        with self._lock:
+            # requests, statements, duration, max statements of a request
+            entry = self.requests.setdefault(scope.name, [0, 0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += scope.statements
+            entry[2] += scope.duration
+            entry[3] = max(entry[3], scope.statements)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "statements": self.statements,
+                "timeTotalMs": round(self.duration * 1000, 3),
+                "slowStatements": self.slow_statements,
+                "requests": {
+                    name: {
+                        "requests": requests,
+                        "statements": statements,
+                        "statementsPerRequestAvg": round(statements / requests, 2),
+                        "statementsPerRequestMax": statements_max,
+                        "timeTotalMs": round(duration * 1000, 3),
+                        "timePerRequestAvgMs": round(duration * 1000 / requests, 3),
+                    }
+                    for name, (requests, statements, duration, statements_max) in self.requests.items()
+                },
+                "services": {
+                    name: {
+                        "statements": statements,
+                        "timeTotalMs": round(duration * 1000, 3),
+                        "timeMaxMs": round(duration_max * 1000, 3),
+                    }
+                    for name, (statements, duration, duration_max) in self.services.items()
+                },
+            }
+
+query_statistics = QueryStatistics()
+
+_current_query_scope: ContextVar[Optional[QueryScope]] = ContextVar("current_query_scope", default=None)
+_current_service_method: ContextVar[Optional[str]] = ContextVar("current_service_method", default=None)
+
+db_instrumentation_config = ConfigManager.get_config("database.instrumentation", default={}) or {}
+# Statements taking longer (in milliseconds) are logged once with their plan, 0 disables it
+slow_query_threshold = float(db_instrumentation_config.get("slowQueryThreshold", 0)) / 1000
+explain_slow_queries = bool(db_instrumentation_config.get("explainSlowQueries", True))
+
+# Slow statements already logged, bounded so that a flood of distinct statements cannot exhaust the memory
+MAX_LOGGED_SLOW_QUERIES = 1000
+DATA_MODIFYING_STATEMENT = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+_logged_slow_queries: set = set()
+
+class query_scope:
+    """
+    Context manager attributing the statements executed within it to a scope, e.g. a request.
+    The scope is recorded in the query statistics on exit, unless `record` is False: then the owner
+    records it later with `query_statistics.record_scope` (e.g. after streaming a response body).
+    """
+
+    def __init__(self, name: str, record: bool = True):
+        self.scope = QueryScope(name)
+        self._record = record
+
+    def __enter__(self) -> QueryScope:
+        self._token = _current_query_scope.set(self.scope)
+        return self.scope
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _current_query_scope.reset(self._token)
+        if self._record or exc_type is not None:
+            query_statistics.record_scope(self.scope)
+
+def instrument_queries(cls):
+    """Class decorator attributing the statements executed by the public methods of a service to these methods."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not isfunction(member):
+            continue
+        setattr(cls, name, _attribute_queries(member, f"{cls.__name__}.{name}"))
+    return cls
+
+def _attribute_queries(method: Callable, service_method: str) -> Callable:
+    if iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            token = _current_service_method.set(service_method)
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                _current_service_method.reset(token)
+        return async_wrapper
+
+    if isgeneratorfunction(method):
+        # Streaming methods are resumed step by step, possibly from different threads or contexts
+        # (e.g. a StreamingResponse), so the service method is set around every single step
+        @wraps(method)
+        def generator_wrapper(*args, **kwargs):
+            generator = method(*args, **kwargs)
+            try:
+                while True:
+                    token = _current_service_method.set(service_method)
+                    try:
+                        item = next(generator)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        _current_service_method.reset(token)
+                    yield item
+            finally:
+                token = _current_service_method.set(service_method)
+                try:
+                    generator.close()
+                finally:
+                    _current_service_method.reset(token)
+        return generator_wrapper
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        token = _current_service_method.set(service_method)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _current_service_method.reset(token)
+    return wrapper
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_start = perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    duration = perf_counter() - context._query_start
+    slow = 0 < slow_query_threshold <= duration
+    query_statistics.record_statement(_current_service_method.get(), duration, slow)
+    scope = _current_query_scope.get()
+    if scope is not None:
+        scope.record(duration)
+    if slow and statement not in _logged_slow_queries and len(_logged_slow_queries) < MAX_LOGGED_SLOW_QUERIES:
+        _logged_slow_queries.add(statement)
+        plan = _explain(conn, statement, parameters) if explain_slow_queries and not executemany else None
+        logger.warning(
+            f"Slow database query ({duration * 1000:.1f} ms) in {_current_service_method.get() or 'unknown service method'}:\n{statement}"
+            + (f"\nQuery plan:\n{plan}" if plan else "")
+        )
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    """Capture the plan of a (slow) statement on the same connection, within its transaction."""
+    if conn.dialect.name != "postgresql":
+        return None
+    # EXPLAIN ANALYZE executes the statement again, which is only done for queries (no data modifying CTEs)
+    analyze = statement.lstrip().upper().startswith(("SELECT", "WITH")) and not DATA_MODIFYING_STATEMENT.search(statement)
+    cursor = conn.connection.cursor()
+    try:
+        # Rolling back to the savepoint keeps the transaction usable if the EXPLAIN fails (e.g. statement timeout)
+        cursor.execute("SAVEPOINT ichub_explain")
+        try:
+            cursor.execute(f"EXPLAIN ({'ANALYZE, BUFFERS' if analyze else 'COSTS'}) {statement}", parameters)
+            return "\n".join(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            logger.warning(f"Failed to capture the plan of a slow database query: {e}")
+            return None
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT ichub_explain")
+    finally:
+        cursor.close()
+
+def _register_query_events(target_engine) -> None:
+    event.listen(target_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target_engine, "after_cursor_execute", _after_cursor_execute)
+
+def get_query_statistics() -> Dict[str, Any]:
+    """Return the statistics of the statements executed on the metadata database."""
+    return query_statistics.snapshot()
+
+def _to_async_dsn(dsn: str) -> str:
+    """Derive the connection string of the async engine from the configured (sync) connection string."""
+    url = make_url(dsn)
+    backend_name = url.get_backend_name()
+    if backend_name not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver available for the database backend '{backend_name}'.")
+    return url.set(drivername=f"{backend_name}+{ASYNC_DRIVERS[backend_name]}").render_as_string(hide_password=False)
+
 base_dsn = ConfigManager.get_config("database.connectionString", default={})
 
 # Substitute the environment variables in the connection string if available
-connection_string = env_tools.substitute_env_vars(string=base_dsn) 
+connection_string = _to_embedded_dsn(env_tools.substitute_env_vars(string=base_dsn))
 
-db_echo = ConfigManager.get_config("database.echo", default={False})
+db_echo = ConfigManager.get_config("database.echo", default=False)
 
-engine = create_engine(str(connection_string), echo=db_echo)
+db_pool_config = ConfigManager.get_config("database.pool", default={}) or {}
 
-logger = LoggingManager.get_logger(__name__)
+engine = create_engine(str(connection_string), echo=db_echo, **_build_engine_kwargs(str(connection_string), db_pool_config))
+_register_sqlite_events(engine)
+_register_pool_events(engine, pool_statistics)
+_register_query_events(engine)
+
+# The async engine is created on first use, so that the async driver is only required when it is actually used
+_async_engine: Optional[AsyncEngine] = None
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async engine for the metadata database, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        async_connection_string = _to_async_dsn(str(connection_string))
+        _async_engine = create_async_engine(
+            async_connection_string, echo=db_echo,
+            **_build_engine_kwargs(async_connection_string, db_pool_config, poolclass=InstrumentedAsyncAdaptedQueuePool))
+        _register_sqlite_events(_async_engine.sync_engine)
+        _register_pool_events(_async_engine.sync_engine, async_pool_statistics)
+        _register_query_events(_async_engine.sync_engine)
+    return _async_engine
+
+# Replication lag of a replica in seconds. Without pending WAL to replay a replica is up to date,
+# even if the last replayed transaction is old (no writes on the primary since then)
+REPLICATION_LAG_QUERIES = {
+    "postgresql": text(
+        "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+}
+
+class Replica:
+    """A read replica of the metadata database with its own engines, pool statistics and replication lag."""
+
+    def __init__(self, dsn: str, pool_config: Dict[str, Any]):
+        url = make_url(dsn)
+        self.name = url.render_as_string(hide_password=True)
+        self.dsn = dsn
+        self.pool_config = pool_config
+        self.statistics = PoolStatistics()
+        self.async_statistics = PoolStatistics()
+        self.engine = create_engine(dsn, echo=db_echo, **_build_engine_kwargs(
+            dsn, pool_config, poolclass=_instrumented_poolclass(InstrumentedQueuePool, self.statistics)))
+        _register_sqlite_events(self.engine)
+        _register_pool_events(self.engine, self.statistics)
+        _register_query_events(self.engine)
+        self._async_engine: Optional[AsyncEngine] = None
+        # None as long as the lag is unknown (not yet checked or replica unreachable)
+        self.lag: Optional[float] = None
+
+    def get_async_engine(self) -> AsyncEngine:
+        """Return the async engine of the replica, creating it on first use."""
+        if self._async_engine is None:
+            async_dsn = _to_async_dsn(self.dsn)
+            self._async_engine = create_async_engine(async_dsn, echo=db_echo, **_build_engine_kwargs(
+                async_dsn, self.pool_config, poolclass=_instrumented_poolclass(InstrumentedAsyncAdaptedQueuePool, self.async_statistics)))
+            _register_sqlite_events(self._async_engine.sync_engine)
+            _register_pool_events(self._async_engine.sync_engine, self.async_statistics)
+            _register_query_events(self._async_engine.sync_engine)
+        return self._async_engine
+
+    def load(self) -> int:
+        """Number of connections currently checked out from the pools of the replica."""
+        load = self.engine.pool.checkedout()
+        if self._async_engine is not None:
+            load += self._async_engine.pool.checkedout()
+        return load
+
+    def check_lag(self) -> None:
+        query = REPLICATION_LAG_QUERIES.get(self.engine.dialect.name)
+        try:
+            with self.engine.connect() as conn:
+                self.lag = float(conn.execute(query).scalar()) if query is not None else 0.0
+        except Exception as e:
+            logger.warning(f"Failed to check the replication lag of the database replica {self.name}: {e}")
+            self.lag = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        result = {"name": self.name, "lagSeconds": self.lag, **self.statistics.snapshot(self.engine.pool)}
+        if self._async_engine is not None:
+            result["async"] = self.async_statistics.snapshot(self._async_engine.pool)
+        return result
+
+class ReplicaRouter:
+    """
+    Chooses the replica for read-only sessions, either round-robin or the least loaded one.
+
+    Staleness guard: the replication lag of the replicas is checked in the background every
+    `check_interval` seconds; replicas lagging more than `max_lag` seconds behind the primary
+    (or with unknown lag, e.g. unreachable) are skipped. Without a fresh replica `select`
+    returns None and the primary has to be used.
+    """
+
+    STRATEGIES = ("roundRobin", "leastLoaded")
+
+    def __init__(self, replicas: List[Replica], strategy: str = "roundRobin", max_lag: float = 10, check_interval: float = 5):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown database replica strategy '{strategy}', expected one of {', '.join(self.STRATEGIES)}.")
+        self.replicas = replicas
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._counter = count()
+        self._lock = Lock()
+        self._monitor: Optional[Thread] = None
+
+    def select(self) -> Optional[Replica]:
+        self._ensure_monitor()
+        fresh = [replica for replica in self.replicas if replica.lag is not None and replica.lag <= self.max_lag]
+        if not fresh:
+            return None
+        if self.strategy == "leastLoaded":
+            return min(fresh, key=lambda replica: replica.load())
+        with self._lock:
+            index = next(self._counter)
+        return fresh[index % len(fresh)]
+
+    def check_lag(self) -> None:
+        for replica in self.replicas:
+            replica.check_lag()
+
+    def _ensure_monitor(self) -> None:
+        # Started on first use, so that no replica is contacted by processes not serving reads
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._monitor = Thread(target=self._monitor_lag, name="database-replica-monitor", daemon=True)
+            self._monitor.start()
+
+    def _monitor_lag(self) -> None:
+        while True:
+            self.check_lag()
+            sleep(self.check_interval)
+
+db_replicas_config = ConfigManager.get_config("database.replicas", default={}) or {}
+
+replica_router: Optional[ReplicaRouter] = None
+if db_replicas_config.get("connectionStrings"):
+    replica_router = ReplicaRouter(
+        replicas=[
+            Replica(str(env_tools.substitute_env_vars(string=replica_dsn)), db_pool_config)
+            for replica_dsn in db_replicas_config["connectionStrings"]
+        ],
+        strategy=db_replicas_config.get("strategy", "roundRobin"),
+        max_lag=float(db_replicas_config.get("maxLagSeconds", 10)),
+        check_interval=float(db_replicas_config.get("lagCheckInterval", 5)),
+    )
+
+def get_read_engine():
+    """Return the engine for read-only sessions: a fresh replica if configured and available, the primary otherwise."""
+    replica = replica_router.select() if replica_router is not None else None
+    return replica.engine if replica is not None else engine
+
+def get_async_read_engine() -> AsyncEngine:
+    """Async variant of `get_read_engine`."""
+    replica = replica_router.select() if replica_router is not None else None
+    return replica.get_async_engine() if replica is not None else get_async_engine()
+
+def get_pool_statistics() -> Dict[str, Any]:
+    """Return the live statistics of the database connection pools."""
+    result = pool_statistics.snapshot(engine.pool)
+    if _async_engine is not None:
+        result["async"] = async_pool_statistics.snapshot(_async_engine.pool)
+    if replica_router is not None:
+        result["replicas"] = [replica.snapshot() for replica in replica_router.replicas]
+    return result
+
+def prefill_pools(connections: int) -> int:
+    """
+    Open up to `connections` connections (at most the size of the pool) in the pools of the primary and of
+    the read replicas, so that the first requests do not pay for establishing them. Returns the number of
+    connections held by the pools.
+    """
+    engines = [engine] + ([replica.engine for replica in replica_router.replicas] if replica_router is not None else [])
+    opened = 0
+    for target_engine in engines:
+        # Held until all are open, a connection returned before would be handed out again
+        with ExitStack() as stack:
+            for _ in range(min(connections, target_engine.pool.size())):
+                stack.enter_context(target_engine.connect())
+                opened += 1
+    return opened
+
+async def prefill_async_pools(connections: int) -> int:
+    """Async variant of `prefill_pools`, creating the async engines (must run on the event loop serving the requests)."""
+    engines = [get_async_engine()] + ([replica.get_async_engine() for replica in replica_router.replicas] if replica_router is not None else [])
+    opened = 0
+    for async_engine in engines:
+        async with AsyncExitStack() as stack:
+            for _ in range(min(connections, async_engine.pool.size())):
+                await stack.enter_async_context(async_engine.connect())
+                opened += 1
+    return opened
 
 def create_db_and_tables() -> None:
     SQLModel.metadata.create_all(engine)
 
+def create_embedded_database() -> None:
+    """
+    Create the missing tables of an embedded (SQLite) metadata database at startup. The schema of a
+    PostgreSQL database is managed separately (see docs/database) and left untouched.
+    """
+    if engine.dialect.name == "sqlite":
+        create_db_and_tables()
+        logger.info(f"Embedded SQLite metadata database ready ({engine.url.render_as_string(hide_password=True)}).")
+
 def connect_and_test():
     try:
         with engine.connect() as conn:
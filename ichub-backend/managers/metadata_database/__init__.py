@@ -26,13 +26,15 @@ __author__ = 'Eclipse Tractus-X Contributors'
 __license__ = "Apache License, Version 2.0"
 
 
-from .manager import RepositoryManager, RepositoryManagerFactory
+from .manager import RepositoryManager, RepositoryManagerFactory, AsyncRepositoryManager, AsyncRepositoryManagerFactory, get_repository_manager
 
 from .repositories import (
     BusinessPartnerRepository,
     CatalogPartRepository,
     DataExchangeAgreementRepository,
     LegalEntityRepository,
-    PartnerCatalogPartRepository
+    LoadingProfile,
+    PartnerCatalogPartRepository,
+    SerializedPartRepository
 )
 
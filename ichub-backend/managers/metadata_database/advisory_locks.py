@@ -0,0 +1,132 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Keyed locks held until the end of the transaction of a session, serializing create paths
+(e.g. the twin of a catalog part) across all backend replicas.
+
+On PostgreSQL a lock is a transaction level advisory lock (`pg_try_advisory_xact_lock`) on a 64 bit key
+derived from a namespace and the parts of the key. It is released by the commit or rollback, so a waiting
+transaction sees everything the winner created once it holds the lock. Other databases (SQLite) only serve
+a single backend process, there a striped process-local lock is used instead.
+
+Waiting is bounded: if a lock cannot be acquired within the timeout an `AdvisoryLockTimeoutError` is raised.
+It blocks the calling thread, so locks are only acquired outside of the event loop (e.g. in the endpoints
+declared without async, which FastAPI runs in its thread pool).
+"""
+
+import asyncio
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic, sleep
+from typing import Set
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session, SessionTransaction
+
+from managers.config.log_manager import LoggingManager
+
+logger = LoggingManager.get_logger(__name__)
+
+# Namespaces of the locks, the key parts follow the natural key of the locked entity
+CATALOG_PART_LOCK = "catalog-part"
+"""Lock of a catalog part, keyed by manufacturer ID and manufacturer part ID (its twin, sharing and the deletion of its serialized parts)."""
+
+ENABLEMENT_SERVICE_STACK_LOCK = "enablement-service-stack"
+"""Lock of the enablement service stack of a manufacturer, keyed by manufacturer ID."""
+
+ADVISORY_LOCK_TIMEOUT = 30.0
+"""Seconds to wait for a lock held by another transaction, long enough for the remote registrations of the winner."""
+
+# Delays between the attempts to acquire a lock held by another transaction
+_RETRY_DELAY_MIN = 0.01
+_RETRY_DELAY_MAX = 0.2
+
+# Process-local locks for the databases without advisory locks; keys share a stripe on hash collisions
+_LOCAL_LOCK_STRIPES = 64
+_local_locks = [Lock() for _ in range(_LOCAL_LOCK_STRIPES)]
+
+# Key of the session info: stripes of the process-local locks held by the current transaction
+_HELD_LOCAL_LOCKS = "advisory_locks_held"
+
+_TRY_ADVISORY_XACT_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+class AdvisoryLockTimeoutError(TimeoutError):
+    """The lock is held by another transaction for longer than the timeout."""
+
+def advisory_lock_key(namespace: str, *parts: str) -> int:
+    """Derive the (signed) 64 bit key of a lock, the same in every backend process."""
+    digest = blake2b("\x1f".join((namespace, *map(str, parts))).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+def acquire_advisory_lock(session: Session, namespace: str, *parts: str, timeout: float = ADVISORY_LOCK_TIMEOUT) -> None:
+    """
+    Acquire the lock of the key within the transaction of the session, waiting up to `timeout` seconds
+    for another transaction holding it. A lock already held by the transaction is acquired again immediately.
+    """
+    if _is_event_loop_thread():
+        raise RuntimeError(f"The {namespace} lock must not be acquired on the event loop, waiting for it would block all requests.")
+
+    key = advisory_lock_key(namespace, *parts)
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        acquire = lambda: bool(connection.scalar(_TRY_ADVISORY_XACT_LOCK, {"key": key}))
+    else:
+        acquire = lambda: _try_local_lock(session, key % _LOCAL_LOCK_STRIPES)
+
+    if acquire():
+        return
+
+    start = monotonic()
+    delay = _RETRY_DELAY_MIN
+    while monotonic() - start < timeout:
+        sleep(delay)
+        if acquire():
+            logger.debug(f"Acquired the {namespace} lock of {parts} after waiting {monotonic() - start:.3f} s.")
+            return
+        delay = min(delay * 2, _RETRY_DELAY_MAX)
+    raise AdvisoryLockTimeoutError(f"The {namespace} {'/'.join(map(str, parts))} is being modified by another request, please retry.")
+
+def _is_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def _try_local_lock(session: Session, stripe: int) -> bool:
+    held: Set[int] = session.info.setdefault(_HELD_LOCAL_LOCKS, set())
+    if stripe in held:
+        return True
+    # Not reentrant, as the transaction may end in another thread than the one which acquired the lock
+    if _local_locks[stripe].acquire(blocking=False):
+        held.add(stripe)
+        return True
+    return False
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_local_locks(session: Session, transaction: SessionTransaction) -> None:
+    # Savepoints end within the transaction, the locks are held until the end of the outermost transaction
+    if transaction.parent is not None:
+        return
+    for stripe in session.info.pop(_HELD_LOCAL_LOCKS, ()):
+        _local_locks[stripe].release()
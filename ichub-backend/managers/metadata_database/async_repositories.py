@@ -0,0 +1,326 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 DRÄXLMAIER Group
+# (represented by Lisa Dräxlmaier GmbH)
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Async variants of the repositories in `repositories.py`, working on an `AsyncSession`.
+The statements are shared with the sync repositories wherever possible. As lazy loading
+is not possible with an async session, the read methods eagerly load all relationships
+their callers navigate.
+"""
+
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import TypeVar, Type, List, Optional, Generic, Any, Awaitable, Callable, Hashable, Tuple
+from uuid import UUID
+
+from managers.metadata_database.repositories import (
+    BaseRepository,
+    BusinessPartnerRepository,
+    CatalogPartListRecord,
+    CatalogPartRepository,
+    LegalEntityRepository,
+    LoadingProfile,
+    SerializedPartRecord,
+    SerializedPartRepository,
+    TwinAspectRegistrationRepository,
+    TwinAspectRepository,
+    TwinExchangeRepository,
+    TwinRegistrationRepository,
+    TwinRepository,
+    supports_trigram_search,
+)
+from managers.metadata_database.reference_cache import CACHED_MODELS, reference_data_cache
+from models.services.part_management import CatalogPartFilter
+from models.metadata_database.models import (
+    BusinessPartner,
+    CatalogPart,
+    DataExchangeAgreement,
+    EnablementServiceStack,
+    LegalEntity,
+    PartnerCatalogPart,
+    SerializedPart,
+    Twin,
+    TwinAspect,
+    TwinAspectRegistration,
+    TwinExchange,
+    TwinRegistration,
+)
+
+ModelType = TypeVar("ModelType", bound=SQLModel)
+
+class AsyncBaseRepository(Generic[ModelType]):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def __init_subclass__(cls) -> None:
+        # Fetch the model type from the first argument of the generic class
+
+        # pylint: disable=no-member
+        cls._type = cls.__orig_bases__[0].__args__[0]  # type: ignore
+
+    @classmethod
+    def get_type(cls) -> Type[ModelType]:
+        return cls._type  # type: ignore
+
+    def create(self, obj_in: ModelType) -> ModelType:
+        self._session.add(obj_in)
+        return obj_in
+
+    async def find_by_id(self, obj_id: int) -> Optional[ModelType]:
+        stmt = select(self.get_type()).where(
+            self.get_type().id == obj_id)  # type: ignore
+        return (await self._session.scalars(stmt)).first()
+
+    async def find_all(self, offset: Optional[int] = None, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ModelType]:
+        stmt = BaseRepository.build_find_all_stmt(self.get_type(), offset, limit, after_id)
+        result = (await self._session.scalars(stmt)).unique()
+        return list(result)
+
+    async def update(self, id: int, obj_in: dict) -> Optional[ModelType]:
+        db_obj = await self._session.get(self.get_type(), id)
+        if not db_obj:
+            return None
+        for field, value in obj_in.items():
+            setattr(db_obj, field, value)
+        await self._session.commit()
+        await self._session.refresh(db_obj)
+        return db_obj
+
+    async def commit(self) -> None:
+        await self._session.commit()
+
+    async def add(self, obj: ModelType, *, commit: bool = False) -> ModelType:
+        self._session.add(obj)
+
+        if commit:
+            await self._session.commit()
+            await self._session.refresh(obj)
+        return obj
+
+    async def _first(self, stmt, params: Optional[dict] = None) -> Optional[ModelType]:
+        return (await self._session.scalars(stmt, params)).first()
+
+    async def _all(self, stmt, params: Optional[dict] = None) -> List[ModelType]:
+        return (await self._session.scalars(stmt, params)).all()
+
+    async def _cached(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """See `BaseRepository._cached`."""
+        if self.get_type() not in CACHED_MODELS:
+            return await load()
+        # Cached entities are merged without loading them, so the sync session can be used
+        session = self._session.sync_session
+        result = reference_data_cache.get(session, self.get_type(), key)
+        if result is None:
+            result = await load()
+            reference_data_cache.put(session, self.get_type(), key, result)
+        return result
+
+    async def delete(self, obj_id: int) -> None:
+        obj = await self._session.get(self.get_type(), obj_id)
+        if obj is None:
+            err_msg = f'{self.get_type()} with id {obj_id} not found!'
+            raise ValueError(err_msg)
+        await self.delete_obj(obj)
+
+    async def delete_obj(self, obj: ModelType) -> None:
+        await self._session.delete(obj)
+
+class AsyncBusinessPartnerRepository(AsyncBaseRepository[BusinessPartner]):
+
+    def create_new(self, name: str, bpnl: str) -> BusinessPartner:
+        """Create a new BusinessPartner instance."""
+        business_partner = BusinessPartner(
+            name=name,
+            bpnl=bpnl
+        )
+        self.create(business_partner)
+        return business_partner
+
+    async def get_by_name(self, name: str) -> Optional[BusinessPartner]:
+        stmt = select(BusinessPartner).where(
+            BusinessPartner.name == name)  # type: ignore
+        return await self._cached((("name", name),), lambda: self._first(stmt))
+
+    async def get_by_bpnl(self, bpnl: str) -> Optional[BusinessPartner]:
+        return await self._cached((("bpnl", bpnl),), lambda: self._first(BusinessPartnerRepository.GET_BY_BPNL_STMT, {"bpnl": bpnl}))
+
+class AsyncCatalogPartRepository(AsyncBaseRepository[CatalogPart]):
+
+    async def get_by_legal_entity_id_manufacturer_part_id(self, legal_entity_id: int, manufacturer_part_id: str) -> Optional[CatalogPart]:
+        stmt = select(CatalogPart).where(
+            CatalogPart.legal_entity_id == legal_entity_id).where(
+            CatalogPart.manufacturer_part_id == manufacturer_part_id)
+        return (await self._session.scalars(stmt)).first()
+
+    async def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> List[tuple[CatalogPart, int]]:
+        """
+        Find catalog parts by manufacturer ID and manufacturer part ID.
+        See `CatalogPartRepository.find_by_manufacturer_id_manufacturer_part_id`.
+
+        Lazy loading is not available on an async session, so only the relationships
+        of the given loading `profile` may be accessed on the result.
+        """
+        stmt = CatalogPartRepository.build_find_by_manufacturer_id_manufacturer_part_id_stmt(
+            manufacturer_id, manufacturer_part_id, profile, after_id, limit, status, filters
+        )
+        return (await self._session.exec(stmt)).all()
+
+    async def find_list_records(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> List[CatalogPartListRecord]:
+        """Find catalog parts as plain list records. See `CatalogPartRepository.find_list_records`."""
+        stmt = CatalogPartRepository.build_find_list_records_stmt(manufacturer_id, manufacturer_part_id, after_id, limit, status, filters)
+        connection = await self._session.connection()
+        return [CatalogPartListRecord(*row) for row in await connection.execute(stmt)]
+
+    async def search(self, query: str, manufacturer_id: Optional[str] = None, profile: LoadingProfile = LoadingProfile.LIST,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None) -> List[tuple[CatalogPart, int, float]]:
+        """Search catalog parts. See `CatalogPartRepository.search`."""
+        trigram = await self._session.run_sync(lambda session: supports_trigram_search(session.connection()))
+        stmt = CatalogPartRepository.build_search_stmt(query, trigram, manufacturer_id, profile, after, limit)
+        return (await self._session.exec(stmt)).all()
+
+    async def search_list_records(self, query: str, manufacturer_id: Optional[str] = None,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None) -> List[CatalogPartListRecord]:
+        """Search catalog parts as plain list records. See `CatalogPartRepository.search_list_records`."""
+        connection = await self._session.connection()
+        trigram = await connection.run_sync(supports_trigram_search)
+        stmt = CatalogPartRepository.build_search_list_records_stmt(query, trigram, manufacturer_id, after, limit)
+        return [CatalogPartListRecord(*row) for row in await connection.execute(stmt)]
+
+class AsyncDataExchangeAgreementRepository(AsyncBaseRepository[DataExchangeAgreement]):
+    async def get_by_business_partner_id(self, business_partner_id: int) -> List[DataExchangeAgreement]:
+        stmt = select(DataExchangeAgreement).where(
+            DataExchangeAgreement.business_partner_id == business_partner_id  # type: ignore
+        )
+        return await self._cached((("business_partner_id", business_partner_id),), lambda: self._all(stmt))
+
+class AsyncLegalEntityRepository(AsyncBaseRepository[LegalEntity]):
+
+    async def get_by_bpnl(self, bpnl: str) -> Optional[LegalEntity]:
+        return await self._cached((("bpnl", bpnl),), lambda: self._first(LegalEntityRepository.GET_BY_BPNL_STMT, {"bpnl": bpnl}))
+
+class AsyncPartnerCatalogPartRepository(AsyncBaseRepository[PartnerCatalogPart]):
+    async def get_by_catalog_part_id_business_partner_id(self, catalog_part_id: int, business_partner_id: int) -> Optional[PartnerCatalogPart]:
+        stmt = select(PartnerCatalogPart).where(
+            PartnerCatalogPart.catalog_part_id == catalog_part_id).where(
+            PartnerCatalogPart.business_partner_id == business_partner_id)
+        return (await self._session.scalars(stmt)).first()
+
+    def create_new(self, catalog_part_id: int, business_partner_id: int, customer_part_id: str) -> PartnerCatalogPart:
+        """Create a new PartnerCatalogPart instance."""
+        partner_catalog_part = PartnerCatalogPart(
+            catalog_part_id=catalog_part_id,
+            business_partner_id=business_partner_id,
+            customer_part_id=customer_part_id,
+        )
+        self.create(partner_catalog_part)
+        return partner_catalog_part
+
+class AsyncEnablementServiceStackRepository(AsyncBaseRepository[EnablementServiceStack]):
+    async def get_by_name(self, name: str, join_legal_entity: bool = False) -> Optional[EnablementServiceStack]:
+        stmt = select(EnablementServiceStack).where(
+            EnablementServiceStack.name == name)  # type: ignore
+
+        if join_legal_entity:
+            stmt = stmt.join(LegalEntity, LegalEntity.id == EnablementServiceStack.legal_entity_id)
+
+        return await self._cached((("name", name),), lambda: self._first(stmt))
+
+    async def find_by_legal_entity_bpnl(self, legal_entity_bpnl: str) -> List[EnablementServiceStack]:
+        stmt = select(EnablementServiceStack).join(
+            LegalEntity, LegalEntity.id == EnablementServiceStack.legal_entity_id).where(
+            LegalEntity.bpnl == legal_entity_bpnl)
+        return await self._cached((("legal_entity.bpnl", legal_entity_bpnl),), lambda: self._all(stmt))
+
+class AsyncSerializedPartRepository(AsyncBaseRepository[SerializedPart]):
+    async def find_records(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            part_instance_id: Optional[str] = None, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[SerializedPartRecord]:
+        """Find serialized parts as plain records. See `SerializedPartRepository.find_records`."""
+        stmt = SerializedPartRepository.build_find_records_stmt(manufacturer_id, manufacturer_part_id, part_instance_id, after_id, limit)
+        connection = await self._session.connection()
+        return [SerializedPartRecord(*row) for row in await connection.execute(stmt)]
+
+class AsyncTwinRepository(AsyncBaseRepository[Twin]):
+    async def find_by_global_id(self, global_id: UUID) -> Optional[Twin]:
+        return (await self._session.scalars(TwinRepository.FIND_BY_GLOBAL_ID_STMT, {"global_id": global_id})).first()
+
+    async def find_catalog_part_twins(self,
+            manufacturer_id: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            global_id: Optional[UUID] = None,
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None) -> List[Twin]:
+        """
+        Find catalog part twins. See `TwinRepository.find_catalog_part_twins`.
+
+        Lazy loading is not available on an async session, so only the relationships
+        of the given loading `profile` may be accessed on the result.
+        """
+        stmt = TwinRepository.build_find_catalog_part_twins_stmt(
+            manufacturer_id, manufacturer_part_id, global_id, profile, after_id, limit)
+
+        return (await self._session.scalars(stmt)).all()
+
+class AsyncTwinAspectRepository(AsyncBaseRepository[TwinAspect]):
+    async def get_by_twin_id_semantic_id(self, twin_id: int, semantic_id: str, include_registrations: bool = False) -> Optional[TwinAspect]:
+        """Retrieve a TwinAspect by its submodel_id."""
+        stmt = (TwinAspectRepository.GET_BY_TWIN_ID_SEMANTIC_ID_WITH_REGISTRATIONS_STMT if include_registrations
+                else TwinAspectRepository.GET_BY_TWIN_ID_SEMANTIC_ID_STMT)
+        return (await self._session.scalars(stmt, {"twin_id": twin_id, "semantic_id": semantic_id})).first()
+
+class AsyncTwinAspectRegistrationRepository(AsyncBaseRepository[TwinAspectRegistration]):
+    async def get_by_twin_aspect_id_enablement_service_stack_id(
+        self, twin_aspect_id: int, enablement_service_stack_id: int
+    ) -> Optional[TwinAspectRegistration]:
+        """Retrieve a TwinAspectRegistration by twin_aspect_id and enablement_service_stack_id."""
+        return (await self._session.scalars(TwinAspectRegistrationRepository.GET_BY_TWIN_ASPECT_ID_ENABLEMENT_SERVICE_STACK_ID_STMT, {
+            "twin_aspect_id": twin_aspect_id, "enablement_service_stack_id": enablement_service_stack_id})).first()
+
+class AsyncTwinExchangeRepository(AsyncBaseRepository[TwinExchange]):
+    async def get_by_twin_id_data_exchange_agreement_id(self, twin_id: int, data_exchange_agreement_id: int) -> Optional[TwinExchange]:
+        return (await self._session.scalars(TwinExchangeRepository.GET_BY_TWIN_ID_DATA_EXCHANGE_AGREEMENT_ID_STMT, {
+            "twin_id": twin_id, "data_exchange_agreement_id": data_exchange_agreement_id})).first()
+
+    async def find_by_global_id_business_partner_number(self, global_id: UUID, business_partner_number: str) -> Optional[TwinExchange]:
+        stmt = select(TwinExchange).join(
+            Twin, TwinExchange.twin_id == Twin.id
+        ).join(
+            DataExchangeAgreement, TwinExchange.data_exchange_agreement_id == DataExchangeAgreement.id
+        ).join(
+            BusinessPartner, BusinessPartner.id == DataExchangeAgreement.business_partner_id
+        ).where(
+            Twin.global_id == global_id,
+            BusinessPartner.bpnl == business_partner_number
+        )
+        return (await self._session.scalars(stmt)).first()
+
+class AsyncTwinRegistrationRepository(AsyncBaseRepository[TwinRegistration]):
+    async def get_by_twin_id_enablement_service_stack_id(self, twin_id: int, enablement_service_stack_id: int) -> Optional[TwinRegistration]:
+        return (await self._session.scalars(TwinRegistrationRepository.GET_BY_TWIN_ID_ENABLEMENT_SERVICE_STACK_ID_STMT, {
+            "twin_id": twin_id, "enablement_service_stack_id": enablement_service_stack_id})).first()
@@ -0,0 +1,300 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+"""
+Bulk loading of instance level parts (serialized parts, JIS parts and batches) with their twins
+from extracts (e.g. of a MES), bypassing the ORM.
+
+The rows are streamed into a temporary staging table with PostgreSQL `COPY FROM STDIN` and then merged
+into the part and twin tables by a few set-based statements: the rows are resolved to their (partner)
+catalog part, parts which already exist or are repeated within the extract are skipped, and the twins
+(with their global ID and AAS ID, generated by the database unless given) and parts are inserted at once.
+The keys of serialized and JIS parts are claimed in their key tables first (`INSERT ... ON CONFLICT DO NOTHING`),
+so that parts created concurrently by other transactions are skipped as well instead of being duplicated.
+The staging tables live until the end of the transaction, i.e. one load per transaction.
+"""
+
+import csv
+from datetime import datetime
+from io import StringIO
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from managers.metadata_database.change_feed import record_changes
+from managers.metadata_database.partitioning import PARTITION_KEYS, create_partitions
+from models.services.part_management import InstancePartType
+
+# Number of rows sent to the database by one COPY statement
+COPY_CHUNK_SIZE = 10000
+
+# Number of line numbers of unresolved rows reported
+MAX_REPORTED_LINES = 100
+
+class SourceColumn(NamedTuple):
+    """A column of the extract (CSV header) and the column of the staging table it is loaded into."""
+    header: str
+    column: str
+    sql_type: str
+    required: bool = False
+    # SQL expression stored in the part table if the extract has no value (instead of NULL)
+    default: Optional[str] = None
+
+class PartLoadSpec(NamedTuple):
+    """How the rows of one instance part type are staged and merged."""
+    table: str
+    columns: Tuple[SourceColumn, ...]
+    # Column of the part table referencing the catalog part (batches) or partner catalog part (serialized and JIS parts)
+    owner_column: str
+    # Column identifying the part per owner
+    key_column: str
+    # Table keeping the (owner, key) unique across the partitions of the part table, if partitioned
+    key_table: Optional[str] = None
+
+_MANUFACTURER_COLUMNS = (
+    SourceColumn("manufacturerId", "manufacturer_id", "text", required=True),
+    SourceColumn("manufacturerPartId", "manufacturer_part_id", "text", required=True),
+)
+
+_TWIN_COLUMNS = (
+    SourceColumn("globalId", "global_id", "uuid"),
+    SourceColumn("dtrAasId", "aas_id", "uuid"),
+)
+
+PART_LOAD_SPECS: Dict[InstancePartType, PartLoadSpec] = {
+    InstancePartType.SERIALIZED_PART: PartLoadSpec(
+        table="serialized_part",
+        columns=_MANUFACTURER_COLUMNS + (
+            SourceColumn("businessPartnerName", "business_partner_name", "text", required=True),
+            SourceColumn("partInstanceId", "part_instance_id", "text", required=True),
+            SourceColumn("van", "van", "text"),
+        ) + _TWIN_COLUMNS,
+        owner_column="partner_catalog_part_id",
+        key_column="part_instance_id",
+        key_table="serialized_part_key",
+    ),
+    InstancePartType.JIS_PART: PartLoadSpec(
+        table="jis_part",
+        columns=_MANUFACTURER_COLUMNS + (
+            SourceColumn("businessPartnerName", "business_partner_name", "text", required=True),
+            SourceColumn("jisNumber", "jis_number", "text", required=True),
+            SourceColumn("parentOrderNumber", "parent_order_number", "text"),
+            SourceColumn("jisCallDate", "jis_call_date", "timestamp", default="now() AT TIME ZONE 'utc'"),
+        ) + _TWIN_COLUMNS,
+        owner_column="partner_catalog_part_id",
+        key_column="jis_number",
+        key_table="jis_part_key",
+    ),
+    InstancePartType.BATCH: PartLoadSpec(
+        table="batch",
+        columns=_MANUFACTURER_COLUMNS + (
+            SourceColumn("batchId", "batch_id", "text", required=True),
+            # Optional: the business partner the batch is (partly) delivered to, one row per partner
+            SourceColumn("businessPartnerName", "business_partner_name", "text"),
+        ) + _TWIN_COLUMNS,
+        owner_column="catalog_part_id",
+        key_column="batch_id",
+    ),
+}
+
+# Columns of the staging table which are not written to the part table
+_NON_PART_COLUMNS = {"manufacturer_id", "manufacturer_part_id", "business_partner_name", "global_id", "aas_id"}
+
+def _validate(value: Optional[str], column: SourceColumn, line: int) -> Optional[str]:
+    # Validated here, so that a malformed row is reported by its line in the extract
+    value = value.strip() if value is not None else ""
+    if not value:
+        if column.required:
+            raise ValueError(f"Line {line}: the column '{column.header}' is required.")
+        return None
+    try:
+        if column.sql_type == "uuid":
+            UUID(value)
+        elif column.sql_type == "timestamp":
+            datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Line {line}: invalid value '{value}' in the column '{column.header}'.") from None
+    return value
+
+class InstancePartLoader:
+    """Loads instance level parts with their twins through a staging table (PostgreSQL only)."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def stage(self, part_type: InstancePartType, rows: Iterable[Dict[str, Optional[str]]],
+              first_line: int = 2, chunk_size: int = COPY_CHUNK_SIZE) -> int:
+        """
+        Stream the rows (e.g. of a `csv.DictReader`, keyed by the CSV header) into the staging table.
+        Rows are numbered starting with `first_line` (the line after the CSV header by default).
+
+        Returns:
+            The number of staged rows.
+        """
+        connection = self._session.connection()
+        if connection.dialect.name != "postgresql":
+            raise ValueError("The bulk loading of parts requires a PostgreSQL database.")
+        spec = PART_LOAD_SPECS[part_type]
+
+        # The statement timeout configured for the API requests does not apply to bulk loads
+        self._session.execute(text("SET LOCAL statement_timeout = 0"))
+        self._session.execute(text("DROP TABLE IF EXISTS ichub_load_staging"))
+        self._session.execute(text(
+            "CREATE TEMPORARY TABLE ichub_load_staging (line bigint NOT NULL, "
+            + ", ".join(f"{column.column} {column.sql_type}" for column in spec.columns)
+            + ") ON COMMIT DROP"
+        ))
+        copy_statement = f"COPY ichub_load_staging (line, {', '.join(column.column for column in spec.columns)}) FROM STDIN WITH (FORMAT csv)"
+
+        cursor = connection.connection.cursor()
+        try:
+            staged = 0
+            buffer = StringIO()
+            writer = csv.writer(buffer)
+            for line, row in enumerate(rows, start=first_line):
+                writer.writerow([line] + [_validate(row.get(column.header), column, line) for column in spec.columns])
+                staged += 1
+                if staged % chunk_size == 0:
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_statement, buffer)
+                    buffer.seek(0)
+                    buffer.truncate()
+            if buffer.tell():
+                buffer.seek(0)
+                cursor.copy_expert(copy_statement, buffer)
+        finally:
+            cursor.close()
+
+        # Temporary tables are not analyzed automatically, the merge relies on their statistics
+        self._session.execute(text("ANALYZE ichub_load_staging"))
+        return staged
+
+    def merge(self, part_type: InstancePartType, create_twins: bool = True) -> Dict[str, object]:
+        """
+        Merge the staged rows into the part (and twin) tables.
+
+        Returns:
+            The numbers of created parts and twins, of skipped and unresolved rows and the first unresolved lines.
+        """
+        spec = PART_LOAD_SPECS[part_type]
+        part_columns = [column.column for column in spec.columns if column.column not in _NON_PART_COLUMNS]
+        part_values = [f"COALESCE(r.{column.column}, {column.default}) AS {column.column}" if column.default else f"r.{column.column}"
+                       for column in spec.columns if column.column in part_columns]
+
+        # Resolve the (partner) catalog part of every row
+        if spec.owner_column == "partner_catalog_part_id":
+            owner_join = (
+                "JOIN public.business_partner bp ON bp.name = s.business_partner_name "
+                "JOIN public.partner_catalog_part pcp ON pcp.business_partner_id = bp.id AND pcp.catalog_part_id = cp.id"
+            )
+            owner_id = "pcp.id"
+        else:
+            # A given business partner has to exist, it is mapped to the batch afterwards
+            owner_join = (
+                "LEFT JOIN public.business_partner bp ON bp.name = s.business_partner_name "
+                "WHERE s.business_partner_name IS NULL OR bp.id IS NOT NULL"
+            )
+            owner_id = "cp.id"
+        self._session.execute(text(
+            "CREATE TEMPORARY TABLE ichub_load_resolved ON COMMIT DROP AS "
+            f"SELECT s.*, {owner_id} AS owner_id, bp.id AS business_partner_id FROM ichub_load_staging s "
+            "JOIN public.legal_entity le ON le.bpnl = s.manufacturer_id "
+            "JOIN public.catalog_part cp ON cp.legal_entity_id = le.id AND cp.manufacturer_part_id = s.manufacturer_part_id "
+            f"{owner_join}"
+        ))
+        self._session.execute(text("ANALYZE ichub_load_resolved"))
+        rows_staged = self._session.execute(text("SELECT count(*) FROM ichub_load_staging")).scalar_one()
+        rows_resolved = self._session.execute(text("SELECT count(*) FROM ichub_load_resolved")).scalar_one()
+        unresolved_lines: List[int] = list(self._session.execute(text(
+            "SELECT s.line FROM ichub_load_staging s WHERE NOT EXISTS (SELECT 1 FROM ichub_load_resolved r WHERE r.line = s.line) "
+            "ORDER BY s.line LIMIT :limit"
+        ), {"limit": MAX_REPORTED_LINES}).scalars())
+
+        # One new part per owner and key (the first row wins), unless the part already exists
+        self._session.execute(text(
+            "CREATE TEMPORARY TABLE ichub_load_pending ON COMMIT DROP AS "
+            f"SELECT DISTINCT ON (r.owner_id, r.{spec.key_column}) r.line, r.owner_id, "
+            + "".join(f"{value}, " for value in part_values)
+            + "COALESCE(r.global_id, gen_random_uuid()) AS global_id, COALESCE(r.aas_id, gen_random_uuid()) AS aas_id "
+            "FROM ichub_load_resolved r "
+            f"WHERE NOT EXISTS (SELECT 1 FROM public.{spec.table} p WHERE p.{spec.owner_column} = r.owner_id AND p.{spec.key_column} = r.{spec.key_column}) "
+            f"ORDER BY r.owner_id, r.{spec.key_column}, r.line"
+        ))
+        if spec.key_table:
+            # Claim the keys (in a stable order, against deadlocks with concurrent loads): keys claimed or created
+            # meanwhile by other transactions are not returned and their rows are skipped
+            self._session.execute(text(
+                f"WITH claimed AS (INSERT INTO public.{spec.key_table} ({spec.owner_column}, {spec.key_column}) "
+                f"SELECT owner_id, {spec.key_column} FROM ichub_load_pending ORDER BY owner_id, {spec.key_column} "
+                f"ON CONFLICT DO NOTHING RETURNING {spec.owner_column}, {spec.key_column}) "
+                "DELETE FROM ichub_load_pending p WHERE NOT EXISTS "
+                f"(SELECT 1 FROM claimed c WHERE c.{spec.owner_column} = p.owner_id AND c.{spec.key_column} = p.{spec.key_column})"
+            ))
+
+        if spec.table in PARTITION_KEYS:
+            # There is no default partition: the partitions of the months of the new parts have to exist
+            # (e.g. for JIS call dates beyond the months created ahead by the partition maintenance)
+            partition_key = PARTITION_KEYS[spec.table]
+            months = self._session.execute(text(
+                f"SELECT DISTINCT date_trunc('month', {partition_key})::date FROM ichub_load_pending"
+            )).scalars().all() if partition_key in part_columns else [datetime.utcnow().date()]
+            create_partitions(self._session.connection(), spec.table, months)
+
+        insert_columns = f"{spec.owner_column}, {', '.join(part_columns)}"
+        if create_twins:
+            parts_created = self._session.execute(text(
+                "WITH twins AS (INSERT INTO public.twin (global_id, aas_id) SELECT global_id, aas_id FROM ichub_load_pending ORDER BY line RETURNING id, global_id) "
+                f"INSERT INTO public.{spec.table} ({insert_columns}, twin_id) "
+                f"SELECT p.owner_id, {', '.join(f'p.{column}' for column in part_columns)}, t.id FROM ichub_load_pending p JOIN twins t ON t.global_id = p.global_id"
+            )).rowcount
+        else:
+            parts_created = self._session.execute(text(
+                f"INSERT INTO public.{spec.table} ({insert_columns}) "
+                f"SELECT p.owner_id, {', '.join(f'p.{column}' for column in part_columns)} FROM ichub_load_pending p ORDER BY p.line"
+            )).rowcount
+
+        if part_type == InstancePartType.BATCH:
+            # Map the (new and existing) batches to the business partners given for them
+            self._session.execute(text(
+                "INSERT INTO public.batch_business_partner (batch_id, business_partner_id) "
+                "SELECT DISTINCT b.id, r.business_partner_id FROM ichub_load_resolved r "
+                "JOIN public.batch b ON b.catalog_part_id = r.owner_id AND b.batch_id = r.batch_id "
+                "WHERE r.business_partner_id IS NOT NULL "
+                "ON CONFLICT DO NOTHING"
+            ))
+            record_changes(self._session, "batch_business_partner")
+
+        if parts_created:
+            record_changes(self._session, spec.table)
+            if create_twins:
+                record_changes(self._session, "twin")
+
+        return {
+            "parts_created": parts_created,
+            "twins_created": parts_created if create_twins else 0,
+            "rows_skipped": rows_resolved - parts_created,
+            "rows_unresolved": rows_staged - rows_resolved,
+            "unresolved_lines": unresolved_lines,
+        }
@@ -0,0 +1,218 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Feed of the changes written to the metadata database, for the invalidation of the process-local
+caches across all backend replicas (PostgreSQL `LISTEN`/`NOTIFY`).
+
+Every transaction writing entities (ORM flushes and the Core writes of the repositories, see `record_changes`)
+sends a notification per changed entity type on the channel `ichub_changes` just before it commits. The payload
+is a JSON object with the origin process, the entity type (table name) and the primary keys of the changed rows
+(`null` if unknown or too many, i.e. any row of the type). PostgreSQL only delivers notifications when the
+transaction commits, so rolled back writes are never announced.
+
+A background listener per process (see `start_change_feed`) consumes the notifications of the other processes
+and dispatches them to the callbacks registered with `register_change_listener`. After (re)connecting it
+dispatches a change of every registered entity type, as notifications might have been missed meanwhile.
+The process itself is not notified: its caches are invalidated by the writing session directly.
+"""
+
+import json
+import select
+from itertools import chain
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from uuid import uuid4
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from database import engine
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+
+logger = LoggingManager.get_logger(__name__)
+
+CHANNEL = "ichub_changes"
+
+PROCESS_ID = uuid4().hex
+"""Origin of the notifications of this process."""
+
+# Up to this number of primary keys are sent per entity type, more changed rows are sent as a change of any row
+MAX_NOTIFIED_KEYS = 100
+
+# Seconds between the checks of the listening connection while no notifications arrive
+_POLL_INTERVAL = 5
+
+# Keys of the session info: changed primary keys (None: any) per entity type in the current transaction
+_CHANGES = "change_feed_changes"
+
+change_feed_config = ConfigManager.get_config("database.changeFeed", default={}) or {}
+change_feed_enabled = bool(change_feed_config.get("enabled", True))
+
+_NOTIFY = text("SELECT pg_notify(:channel, :payload)")
+
+ChangeListener = Callable[[str, Optional[List[Any]]], None]
+"""Callback for the changes of an entity type, with the primary keys of the changed rows (None: any row)."""
+
+_listeners_lock = Lock()
+_listeners: List[Tuple[frozenset, ChangeListener]] = []
+
+def register_change_listener(entity_types: Iterable[Union[type, str]], listener: ChangeListener) -> None:
+    """Register a callback for the changes of the entity types (models or table names) written by other processes."""
+    with _listeners_lock:
+        _listeners.append((frozenset(map(_entity_type, entity_types)), listener))
+
+def record_changes(session: Session, entity_type: Union[type, str], keys: Optional[Iterable[Any]] = None) -> None:
+    """
+    Record rows of an entity type (model or table name) written with a Core statement (bypassing the ORM flush),
+    to be announced when the transaction of the session commits. Without keys any row of the type may have changed.
+    """
+    _record(session, _entity_type(entity_type), None if keys is None else list(keys))
+
+def _entity_type(entity_type: Union[type, str]) -> str:
+    return entity_type if isinstance(entity_type, str) else entity_type.__tablename__
+
+def _record(session: Session, entity_type: str, keys: Optional[List[Any]]) -> None:
+    changes: Dict[str, Optional[Set[Any]]] = session.info.setdefault(_CHANGES, {})
+    if keys is None or (entity_type in changes and changes[entity_type] is None):
+        changes[entity_type] = None
+        return
+    changed_keys = changes.setdefault(entity_type, set())
+    changed_keys.update(keys)
+    if len(changed_keys) > MAX_NOTIFIED_KEYS:
+        changes[entity_type] = None
+
+def _primary_key(obj: Any) -> Any:
+    values = inspect(obj).mapper.primary_key_from_instance(obj)
+    return values[0] if len(values) == 1 else values
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed(session: Session, flush_context) -> None:
+    modified = (obj for obj in session.dirty if session.is_modified(obj, include_collections=False))
+    for obj in chain(session.new, modified, session.deleted):
+        _record(session, obj.__tablename__, [_primary_key(obj)])
+
+@event.listens_for(Session, "before_commit")
+def _notify_changes(session: Session) -> None:
+    if not change_feed_enabled or session.get_bind().dialect.name != "postgresql":
+        return
+    # The commit flushes the pending changes after this event, flush them now to announce them as well
+    session.flush()
+    changes = session.info.pop(_CHANGES, None)
+    if not changes:
+        return
+    connection = session.connection()
+    for entity_type, keys in changes.items():
+        payload = json.dumps({"origin": PROCESS_ID, "type": entity_type, "keys": None if keys is None else sorted(keys, key=str)}, default=str)
+        connection.execute(_NOTIFY, {"channel": CHANNEL, "payload": payload})
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_changes(session: Session, transaction) -> None:
+    # Rolled back (or ended without commit); savepoints end within the transaction
+    if transaction.parent is None:
+        session.info.pop(_CHANGES, None)
+
+def dispatch(entity_type: str, keys: Optional[List[Any]]) -> None:
+    """Hand a change to the callbacks registered for its entity type."""
+    with _listeners_lock:
+        listeners = [listener for entity_types, listener in _listeners if entity_type in entity_types]
+    for listener in listeners:
+        try:
+            listener(entity_type, keys)
+        except Exception as e:
+            logger.warning(f"Failed to handle the change of {entity_type} by {listener}: {e}")
+
+def _dispatch_all() -> None:
+    with _listeners_lock:
+        entity_types = set(chain.from_iterable(entity_types for entity_types, _ in _listeners))
+    for entity_type in entity_types:
+        dispatch(entity_type, None)
+
+def _dispatch_notification(payload: str) -> None:
+    try:
+        change = json.loads(payload)
+    except ValueError:
+        logger.warning(f"Ignoring the malformed notification on {CHANNEL}: {payload[:200]}")
+        return
+    if change.get("origin") != PROCESS_ID:
+        dispatch(change["type"], change.get("keys"))
+
+_listener_lock = Lock()
+_listener_thread: Optional[Thread] = None
+# Set while the listener is connected (after its caches were invalidated for the changes possibly missed)
+_listening = Event()
+
+def start_change_feed() -> None:
+    """Start listening for the changes of other processes in the background, unless disabled or not applicable (not PostgreSQL)."""
+    global _listener_thread
+    if not change_feed_enabled or engine.dialect.name != "postgresql":
+        return
+    if engine.dialect.driver != "psycopg2":
+        logger.warning(f"The change feed is not supported with the {engine.dialect.driver} driver, caches of other processes are only refreshed after their TTL.")
+        return
+    reconnect_delay = float(change_feed_config.get("reconnectDelay", 5))
+    with _listener_lock:
+        if _listener_thread is not None:
+            return
+        _listener_thread = Thread(target=_listen, args=(reconnect_delay,), name="database-change-listener", daemon=True)
+        _listener_thread.start()
+
+def wait_for_change_feed(timeout: float) -> bool:
+    """
+    Wait up to `timeout` seconds until the listener is connected, so that caches loaded afterwards are not
+    invalidated by its (re)connection. Returns immediately if no listener was started; False on timeout.
+    """
+    if _listener_thread is None:
+        return True
+    return _listening.wait(timeout)
+
+def _listen(reconnect_delay: float) -> None:
+    while True:
+        connection = None
+        try:
+            # A dedicated connection outside the pool, it is blocked by the listener for the lifetime of the process
+            cargs, cparams = engine.dialect.create_connect_args(engine.url)
+            connection = engine.dialect.connect(*cargs, **cparams)
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            logger.info(f"Listening for the changes of other processes on {CHANNEL}.")
+            _dispatch_all()
+            _listening.set()
+            while True:
+                # Polls the connection even without notifications, which fails once it is lost
+                select.select([connection], [], [], _POLL_INTERVAL)
+                connection.poll()
+                while connection.notifies:
+                    _dispatch_notification(connection.notifies.pop(0).payload)
+        except Exception as e:
+            _listening.clear()
+            logger.warning(f"Lost the connection listening on {CHANNEL}, reconnecting in {reconnect_delay} s: {e}")
+        finally:
+            if connection is not None:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+        sleep(reconnect_delay)
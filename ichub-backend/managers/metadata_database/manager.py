@@ -22,8 +22,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional
+from sqlalchemy import event
 from sqlmodel import Session
-from database import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from database import engine, get_async_engine, get_async_read_engine, get_read_engine
 
 class RepositoryManager:
     """Repository manager for managing repositories and handling the session."""
@@ -36,11 +40,13 @@ class RepositoryManager:
         self._enablement_service_stack_repository = None
         self._legal_entity_repository = None
         self._partner_catalog_part_repository = None
+        self._serialized_part_repository = None
         self._twin_repository = None
         self._twin_aspect_repository = None
         self._twin_aspect_registration_repository = None
         self._twin_exchange_repository = None
         self._twin_registration_repository = None
+        self._instance_part_loader = None
 
     # Context Manager Methods
     def __enter__(self):
@@ -70,10 +76,22 @@ class RepositoryManager:
         """Manually close the session."""
         self._session.close()
 
+    def flush(self):
+        """Write the pending changes to the database (assigning generated IDs) without committing the transaction."""
+        self._session.flush()
+
     def refresh(self, obj):
         """Refresh the state of an instance from the database."""
         self._session.refresh(obj)
 
+    def advisory_lock(self, namespace: str, *key: str, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the lock of the key (e.g. manufacturer ID and manufacturer part ID), held until the end of
+        the transaction. On PostgreSQL the lock is shared by all backend replicas (see `advisory_locks`).
+        """
+        from managers.metadata_database.advisory_locks import ADVISORY_LOCK_TIMEOUT, acquire_advisory_lock
+        acquire_advisory_lock(self._session, namespace, *key, timeout=ADVISORY_LOCK_TIMEOUT if timeout is None else timeout)
+
     # Lazy Initialization of Repositories
     @property
     def business_partner_repository(self):
@@ -123,6 +141,14 @@ class RepositoryManager:
             self._partner_catalog_part_repository = PartnerCatalogPartRepository(self._session)
         return self._partner_catalog_part_repository
     
+    @property
+    def serialized_part_repository(self):
+        """Lazy initialization of the serialized part repository."""
+        if self._serialized_part_repository is None:
+            from managers.metadata_database.repositories import SerializedPartRepository
+            self._serialized_part_repository = SerializedPartRepository(self._session)
+        return self._serialized_part_repository
+
     @property
     def twin_repository(self):
         """Lazy initialization of the twin repository."""
@@ -163,11 +189,219 @@ class RepositoryManager:
             self._twin_registration_repository = TwinRegistrationRepository(self._session)
         return self._twin_registration_repository
 
+    @property
+    def instance_part_loader(self):
+        """Lazy initialization of the bulk loader of instance level parts."""
+        if self._instance_part_loader is None:
+            from managers.metadata_database.bulk_loader import InstancePartLoader
+            self._instance_part_loader = InstancePartLoader(self._session)
+        return self._instance_part_loader
+
+def _refuse_flush(session: Session, flush_context, instances) -> None:
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("Changes cannot be written through a read-only repository manager.")
+
+def _guard_read_only(session: Session) -> None:
+    """Prevent writes through a read-only session, which might be bound to a read replica."""
+    event.listen(session, "before_flush", _refuse_flush)
+
 class RepositoryManagerFactory:
     """Factory class for creating repository managers."""
 
     @staticmethod
-    def create() -> RepositoryManager:
-        """Create or return the singleton instance of RepositoryManager."""
-        session = Session(engine)
-        return RepositoryManager(session)
\ No newline at end of file
+    def create(read_only: bool = False) -> RepositoryManager:
+        """
+        Create a new RepositoryManager with its own session.
+
+        Read-only repository managers are bound to a read replica of the database if configured
+        (see `database.replicas`), falling back to the primary. They refuse to flush any changes.
+        """
+        # Entities stay usable after the commit (e.g. to build the response) without being reloaded
+        session = Session(get_read_engine() if read_only else engine, expire_on_commit=False)
+        if read_only:
+            _guard_read_only(session)
+        return RepositoryManager(session)
+
+    @staticmethod
+    @contextmanager
+    def use(repo: Optional[RepositoryManager] = None) -> Iterator[RepositoryManager]:
+        """
+        Use the given (ambient) repository manager, or create a new one for the duration of the block.
+
+        An ambient repository manager is committed or rolled back by its owner (e.g. the request scope,
+        see `get_repository_manager`), so nested service calls share its connection and transaction.
+        """
+        if repo is not None:
+            yield repo
+        else:
+            with RepositoryManagerFactory.create() as new_repo:
+                yield new_repo
+
+def get_repository_manager() -> Generator[RepositoryManager, None, None]:
+    """
+    FastAPI dependency providing one repository manager (unit of work) per request:
+    committed when the request was handled successfully, rolled back otherwise.
+    The session is synchronous: endpoints injecting it are declared without async, so that FastAPI
+    runs them in its thread pool instead of blocking the event loop with the database calls.
+    """
+    with RepositoryManagerFactory.create() as repo:
+        yield repo
+
+class AsyncRepositoryManager:
+    """Repository manager for managing async repositories and handling the async session."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._business_partner_repository = None
+        self._catalog_part_repository = None
+        self._data_exchange_agreement_repository = None
+        self._enablement_service_stack_repository = None
+        self._legal_entity_repository = None
+        self._partner_catalog_part_repository = None
+        self._serialized_part_repository = None
+        self._twin_repository = None
+        self._twin_aspect_repository = None
+        self._twin_aspect_registration_repository = None
+        self._twin_exchange_repository = None
+        self._twin_registration_repository = None
+
+    # Async Context Manager Methods
+    async def __aenter__(self):
+        """Enter the context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the context, committing or rolling back the session."""
+        try:
+            if exc_type is None:
+                await self._session.commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+
+    # Manual Session Control
+    async def commit(self):
+        """Manually commit the session."""
+        await self._session.commit()
+
+    async def rollback(self):
+        """Manually roll back the session."""
+        await self._session.rollback()
+
+    async def close(self):
+        """Manually close the session."""
+        await self._session.close()
+
+    async def refresh(self, obj):
+        """Refresh the state of an instance from the database."""
+        await self._session.refresh(obj)
+
+    # Lazy Initialization of Repositories
+    @property
+    def business_partner_repository(self):
+        """Lazy initialization of the async business partner repository."""
+        if self._business_partner_repository is None:
+            from managers.metadata_database.async_repositories import AsyncBusinessPartnerRepository
+            self._business_partner_repository = AsyncBusinessPartnerRepository(self._session)
+        return self._business_partner_repository
+
+    @property
+    def catalog_part_repository(self):
+        """Lazy initialization of the async catalog part repository."""
+        if self._catalog_part_repository is None:
+            from managers.metadata_database.async_repositories import AsyncCatalogPartRepository
+            self._catalog_part_repository = AsyncCatalogPartRepository(self._session)
+        return self._catalog_part_repository
+
+    @property
+    def data_exchange_agreement_repository(self):
+        """Lazy initialization of the async data exchange agreement repository."""
+        if self._data_exchange_agreement_repository is None:
+            from managers.metadata_database.async_repositories import AsyncDataExchangeAgreementRepository
+            self._data_exchange_agreement_repository = AsyncDataExchangeAgreementRepository(self._session)
+        return self._data_exchange_agreement_repository
+
+    @property
+    def enablement_service_stack_repository(self):
+        """Lazy initialization of the async enablement service stack repository."""
+        if self._enablement_service_stack_repository is None:
+            from managers.metadata_database.async_repositories import AsyncEnablementServiceStackRepository
+            self._enablement_service_stack_repository = AsyncEnablementServiceStackRepository(self._session)
+        return self._enablement_service_stack_repository
+
+    @property
+    def legal_entity_repository(self):
+        """Lazy initialization of the async legal entity repository."""
+        if self._legal_entity_repository is None:
+            from managers.metadata_database.async_repositories import AsyncLegalEntityRepository
+            self._legal_entity_repository = AsyncLegalEntityRepository(self._session)
+        return self._legal_entity_repository
+
+    @property
+    def partner_catalog_part_repository(self):
+        """Lazy initialization of the async partner catalog part repository."""
+        if self._partner_catalog_part_repository is None:
+            from managers.metadata_database.async_repositories import AsyncPartnerCatalogPartRepository
+            self._partner_catalog_part_repository = AsyncPartnerCatalogPartRepository(self._session)
+        return self._partner_catalog_part_repository
+
+    @property
+    def serialized_part_repository(self):
+        """Lazy initialization of the async serialized part repository."""
+        if self._serialized_part_repository is None:
+            from managers.metadata_database.async_repositories import AsyncSerializedPartRepository
+            self._serialized_part_repository = AsyncSerializedPartRepository(self._session)
+        return self._serialized_part_repository
+
+    @property
+    def twin_repository(self):
+        """Lazy initialization of the async twin repository."""
+        if self._twin_repository is None:
+            from managers.metadata_database.async_repositories import AsyncTwinRepository
+            self._twin_repository = AsyncTwinRepository(self._session)
+        return self._twin_repository
+
+    @property
+    def twin_aspect_repository(self):
+        """Lazy initialization of the async twin aspect repository."""
+        if self._twin_aspect_repository is None:
+            from managers.metadata_database.async_repositories import AsyncTwinAspectRepository
+            self._twin_aspect_repository = AsyncTwinAspectRepository(self._session)
+        return self._twin_aspect_repository
+
+    @property
+    def twin_aspect_registration_repository(self):
+        """Lazy initialization of the async twin aspect registration repository."""
+        if self._twin_aspect_registration_repository is None:
+            from managers.metadata_database.async_repositories import AsyncTwinAspectRegistrationRepository
+            self._twin_aspect_registration_repository = AsyncTwinAspectRegistrationRepository(self._session)
+        return self._twin_aspect_registration_repository
+
+    @property
+    def twin_exchange_repository(self):
+        """Lazy initialization of the async twin exchange repository."""
+        if self._twin_exchange_repository is None:
+            from managers.metadata_database.async_repositories import AsyncTwinExchangeRepository
+            self._twin_exchange_repository = AsyncTwinExchangeRepository(self._session)
+        return self._twin_exchange_repository
+
+    @property
+    def twin_registration_repository(self):
+        """Lazy initialization of the async twin registration repository."""
+        if self._twin_registration_repository is None:
+            from managers.metadata_database.async_repositories import AsyncTwinRegistrationRepository
+            self._twin_registration_repository = AsyncTwinRegistrationRepository(self._session)
+        return self._twin_registration_repository
+
+class AsyncRepositoryManagerFactory:
+    """Factory class for creating async repository managers."""
+
+    @staticmethod
+    def create(read_only: bool = False) -> AsyncRepositoryManager:
+        """Create a new AsyncRepositoryManager with its own async session (on a read replica if `read_only`)."""
+        # Objects must stay readable after the commit in __aexit__, as lazy loading is not possible in async mode
+        session = AsyncSession(get_async_read_engine() if read_only else get_async_engine(), expire_on_commit=False)
+        if read_only:
+            _guard_read_only(session.sync_session)
+        return AsyncRepositoryManager(session)
\ No newline at end of file
@@ -0,0 +1,185 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Versioned migrations of the PostgreSQL schema of the metadata database.
+
+A migration is a SQL script in the `migrations` directory of the backend, named `<version>_<description>.sql`
+(e.g. `0002_performance_indexes.sql`). Pending migrations are applied in the order of their versions, each in
+its own transaction, and recorded with the checksum of their script in the table `schema_migration`.
+The initial schema (docs/database/Metadata-DDL-public.sql) records the versions it already contains; a database
+created before the migrations were introduced is recorded at the baseline version on its first migration.
+
+`apply_migrations` is serialized across all backend replicas by a session level advisory lock. It runs at
+startup (see `database.migrations.autoApply`) or from the command line (migrate.py). Embedded (SQLite) databases
+are created from the models, which declare the same indexes, and are left untouched.
+
+The schema requires PostgreSQL 14 or later (`MIN_POSTGRESQL_VERSION`), which is checked at startup.
+"""
+
+import re
+from hashlib import sha256
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Connection, Engine, text
+
+from database import engine
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.advisory_locks import advisory_lock_key
+
+logger = LoggingManager.get_logger(__name__)
+
+MIGRATIONS_DIRECTORY = Path(__file__).resolve().parents[2] / "migrations"
+
+BASELINE_VERSION = 1
+"""Version of the schema of the databases created before the migrations were introduced."""
+
+MIN_POSTGRESQL_VERSION = 14
+"""Oldest supported major version of PostgreSQL (partitions are detached concurrently, see partitioning)."""
+
+_SCRIPT_NAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+_MIGRATION_LOCK = "schema-migration"
+
+_CREATE_HISTORY = text(
+    "CREATE TABLE IF NOT EXISTS public.schema_migration ("
+    "version integer NOT NULL, "
+    "description character varying NOT NULL, "
+    "checksum character varying NOT NULL, "
+    "applied_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL, "
+    "CONSTRAINT pk_schema_migration PRIMARY KEY (version))"
+)
+_RECORD = text("INSERT INTO public.schema_migration (version, description, checksum) VALUES (:version, :description, :checksum)")
+
+class Migration(NamedTuple):
+    """A migration script of the schema."""
+    version: int
+    description: str
+    script: str
+
+    @property
+    def checksum(self) -> str:
+        return sha256(self.script.replace("\r\n", "\n").encode("utf-8")).hexdigest()
+
+def load_migrations(directory: Path = MIGRATIONS_DIRECTORY) -> List[Migration]:
+    """Return the migration scripts of the directory in the order of their versions."""
+    migrations: Dict[int, Migration] = {}
+    for path in directory.glob("*.sql"):
+        match = _SCRIPT_NAME.match(path.name)
+        if match is None:
+            raise ValueError(f"Invalid name of the migration script {path.name}, expected <version>_<description>.sql")
+        version = int(match[1])
+        if version in migrations:
+            raise ValueError(f"Several migration scripts have the version {version}")
+        migrations[version] = Migration(version, match[2].replace("_", " "), path.read_text(encoding="utf-8"))
+    return [migrations[version] for version in sorted(migrations)]
+
+def applied_migrations(connection: Connection) -> Dict[int, str]:
+    """Return the checksums of the applied migrations by version (empty if none was recorded yet)."""
+    if connection.scalar(text("SELECT to_regclass('public.schema_migration')")) is None:
+        return {}
+    return dict(connection.execute(text("SELECT version, checksum FROM public.schema_migration")).all())
+
+def check_server_version(target_engine: Engine = engine) -> None:
+    """Raise a RuntimeError if the PostgreSQL server of the database is older than the supported version."""
+    if target_engine.dialect.name != "postgresql":
+        return
+    with target_engine.connect() as connection:
+        version = connection.dialect.server_version_info
+    if version[0] < MIN_POSTGRESQL_VERSION:
+        raise RuntimeError(f"PostgreSQL {'.'.join(map(str, version))} is not supported by the metadata database, "
+                           f"PostgreSQL {MIN_POSTGRESQL_VERSION} or later is required.")
+
+def apply_migrations(target_engine: Engine = engine, target_version: Optional[int] = None) -> List[int]:
+    """
+    Apply the pending migrations (up to the target version, if given) to a PostgreSQL database.
+    Returns the versions of the applied migrations.
+    """
+    if target_engine.dialect.name != "postgresql":
+        return []
+    check_server_version(target_engine)
+    migrations = load_migrations()
+    key = advisory_lock_key(_MIGRATION_LOCK)
+    applied: List[int] = []
+
+    with target_engine.connect() as connection:
+        # Held until released, across the transactions of the migrations; concurrent replicas wait for it
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+        connection.commit()
+        try:
+            history = _prepare_history(connection, migrations)
+            if history is None:
+                logger.warning("The metadata database has no schema yet, create it from docs/database/Metadata-DDL-public.sql.")
+                return applied
+            for migration in migrations:
+                if target_version is not None and migration.version > target_version:
+                    break
+                if migration.version in history:
+                    if history[migration.version] != migration.checksum:
+                        logger.warning(f"The script of the applied migration {migration.version} ({migration.description}) has been changed since.")
+                    continue
+                start = perf_counter()
+                with connection.begin():
+                    # Building indexes on large tables takes longer than the statement timeout of the requests
+                    connection.exec_driver_sql("SET LOCAL statement_timeout = 0")
+                    # Executed without parameters by the driver, so that the script can contain % (e.g. in format())
+                    cursor = connection.connection.cursor()
+                    try:
+                        cursor.execute(migration.script)
+                    finally:
+                        cursor.close()
+                    connection.execute(_RECORD, {"version": migration.version, "description": migration.description, "checksum": migration.checksum})
+                logger.info(f"Applied the migration {migration.version} ({migration.description}) of the metadata database in {perf_counter() - start:.3f} s.")
+                applied.append(migration.version)
+        finally:
+            connection.rollback()
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+            connection.commit()
+    return applied
+
+def _prepare_history(connection: Connection, migrations: List[Migration]) -> Optional[Dict[int, str]]:
+    """
+    Return the applied migrations, creating the history of a database without one (recorded at the baseline).
+    None if the database has no schema yet.
+    """
+    with connection.begin():
+        history = applied_migrations(connection)
+        if history:
+            return history
+        if connection.scalar(text("SELECT to_regclass('public.catalog_part')")) is None:
+            return None
+        baseline = next(migration for migration in migrations if migration.version == BASELINE_VERSION)
+        connection.execute(_CREATE_HISTORY)
+        connection.execute(_RECORD, {"version": baseline.version, "description": baseline.description, "checksum": baseline.checksum})
+    logger.info(f"Recorded the schema of the metadata database at the baseline version {BASELINE_VERSION}.")
+    return {baseline.version: baseline.checksum}
+
+def apply_migrations_on_startup() -> None:
+    """Check the version of the database server and apply the pending migrations at startup, unless disabled."""
+    migrations_config = ConfigManager.get_config("database.migrations", default={}) or {}
+    if migrations_config.get("autoApply", True):
+        apply_migrations()
+    else:
+        check_server_version()
@@ -0,0 +1,270 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+"""
+Maintenance of the range partitioned instance level part tables in PostgreSQL: serialized parts are partitioned
+by the month of their creation date, JIS parts by the month of their JIS call date (see the DDL).
+
+Every partitioned table has one partition per month, named `<table>_YYYY_MM`. Queries restricted on the partition
+key (e.g. the recent parts) only scan the partitions of the requested months, and old data is purged by dropping
+the partitions of whole months, without touching other rows. The tables have no default partition, so the
+partition of a month has to exist before its parts are created (the bulk loader creates the partitions of the
+JIS call dates of its rows, which may lie beyond the months created ahead).
+
+`maintain_partitions` creates the partitions of the current and the coming months ahead of time and drops the
+partitions beyond the configured retention (see `database.partitioning`). It is run at startup and periodically
+in the background by the application (see `start_partition_maintenance`). Tables which are not partitioned
+(e.g. on SQLite) are skipped.
+
+Neither step blocks the reads and writes of the parts: a partition is attached with a SHARE UPDATE EXCLUSIVE lock
+of the partitioned table, and detached with `DETACH PARTITION ... CONCURRENTLY` (PostgreSQL 14 or later) before it
+is dropped. Concurrent maintenance runs of several backend processes are serialized by a session level advisory lock.
+"""
+
+import re
+from datetime import date, datetime
+from threading import Lock, Thread
+from time import sleep
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import Connection, Engine, text
+
+from database import engine
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.advisory_locks import advisory_lock_key
+
+logger = LoggingManager.get_logger(__name__)
+
+# Partitioned tables with their partition key
+PARTITION_KEYS: Dict[str, str] = {
+    "serialized_part": "created_date",
+    "jis_part": "jis_call_date",
+}
+
+# Keys of the tables in the `database.partitioning.retentionMonths` configuration
+RETENTION_CONFIG_KEYS: Dict[str, str] = {
+    "serialized_part": "serializedPart",
+    "jis_part": "jisPart",
+}
+
+_MONTHLY_PARTITION = re.compile(r"^(?P<table>[a-z_]+)_(?P<year>\d{4})_(?P<month>\d{2})$")
+
+_MAINTENANCE_LOCK = "partition-maintenance"
+
+def month_start(value: date) -> date:
+    """First day of the month of the given date."""
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month the given number of months after (or before, if negative) the month of the date."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding the rows of the month."""
+    return f"{table}_{month:%Y_%m}"
+
+def _check_table(table: str) -> None:
+    # Table and partition names are part of the DDL statements, only the known tables are accepted
+    if table not in PARTITION_KEYS:
+        raise ValueError(f"The table '{table}' is not partitioned, expected one of {', '.join(PARTITION_KEYS)}.")
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    """Whether the table is a partitioned table in the database of the connection."""
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": f"public.{table}"}
+    ).scalar())
+
+def _monthly_partitions(table: str, names: Iterable[str]) -> Dict[date, str]:
+    partitions = {}
+    for name in names:
+        match = _MONTHLY_PARTITION.match(name)
+        if match and match["table"] == table:
+            partitions[date(int(match["year"]), int(match["month"]), 1)] = name
+    return partitions
+
+def list_partitions(connection: Connection, table: str) -> Dict[date, str]:
+    """The monthly partitions of the table by their month (including the ones pending to be detached)."""
+    return _monthly_partitions(table, connection.execute(
+        text("SELECT c.relname FROM pg_catalog.pg_inherits i JOIN pg_catalog.pg_class c ON c.oid = i.inhrelid "
+             "WHERE i.inhparent = to_regclass(:table)"),
+        {"table": f"public.{table}"}
+    ).scalars())
+
+def _pending_detaches(connection: Connection, table: str) -> List[str]:
+    # Partitions whose concurrent detach was interrupted, it has to be finalized
+    return list(connection.execute(
+        text("SELECT c.relname FROM pg_catalog.pg_inherits i JOIN pg_catalog.pg_class c ON c.oid = i.inhrelid "
+             "WHERE i.inhparent = to_regclass(:table) AND i.inhdetachpending"),
+        {"table": f"public.{table}"}
+    ).scalars())
+
+def _detached_partitions(connection: Connection, table: str) -> Dict[date, str]:
+    # Monthly tables detached but not dropped yet, e.g. if the process stopped in between
+    return _monthly_partitions(table, connection.execute(
+        text("SELECT c.relname FROM pg_catalog.pg_class c "
+             "WHERE c.relnamespace = 'public'::regnamespace AND c.relkind = 'r' AND NOT c.relispartition "
+             "AND starts_with(c.relname, :prefix)"),
+        {"prefix": f"{table}_"}
+    ).scalars())
+
+def create_partitions(connection: Connection, table: str, months: Iterable[date]) -> List[str]:
+    """
+    Create the missing partitions of the table for the months of the given dates, within the transaction of
+    the connection. Attaching a new (empty) partition does not block the reads and writes of the table.
+
+    Returns:
+        The names of the created partitions.
+    """
+    _check_table(table)
+    if not is_partitioned(connection, table):
+        return []
+    existing = list_partitions(connection, table)
+
+    created = []
+    for month in sorted({month_start(value) for value in months}):
+        if month in existing:
+            continue
+        name = partition_name(table, month)
+        # Created detached and attached afterwards: attaching only takes a SHARE UPDATE EXCLUSIVE lock of the table,
+        # creating it as partition (CREATE TABLE ... PARTITION OF) an ACCESS EXCLUSIVE lock
+        connection.execute(text(f"CREATE TABLE public.{name} (LIKE public.{table} INCLUDING DEFAULTS)"))
+        connection.execute(text(
+            f"ALTER TABLE public.{table} ATTACH PARTITION public.{name} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+def drop_partitions(connection: Connection, table: str, before: date) -> List[str]:
+    """
+    Drop the partitions of the table holding only months before the given date. Every partition is first
+    detached concurrently, which waits for the running queries of the table but does not block its reads and
+    writes, then the keys of its parts are removed from the key table (`<table>_key`) and it is dropped as a
+    table of its own.
+
+    `DETACH PARTITION ... CONCURRENTLY` can not run within a transaction: the connection has to be in
+    AUTOCOMMIT mode (see `maintain_partitions`).
+
+    Returns:
+        The names of the dropped partitions.
+    """
+    _check_table(table)
+    if not is_partitioned(connection, table):
+        return []
+    attached = list_partitions(connection, table)
+    pending = set(_pending_detaches(connection, table))
+    dropped = []
+    for month, name in sorted({**_detached_partitions(connection, table), **attached}.items()):
+        if add_months(month, 1) > before:
+            break
+        if name in pending:
+            connection.execute(text(f"ALTER TABLE public.{table} DETACH PARTITION public.{name} FINALIZE"))
+        elif month in attached:
+            connection.execute(text(f"ALTER TABLE public.{table} DETACH PARTITION public.{name} CONCURRENTLY"))
+        # Dropping a table does not fire the triggers maintaining the key table, the keys of its parts are released here
+        connection.execute(text(f"DELETE FROM public.{table}_key k USING public.{name} p WHERE k.{table}_id = p.id"))
+        connection.execute(text(f"DROP TABLE public.{name}"))
+        dropped.append(name)
+    return dropped
+
+def maintain_partitions(target_engine: Optional[Engine] = None, today: Optional[date] = None) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Create the partitions of the current and the next `premakeMonths` months and drop the partitions of the
+    months beyond `retentionMonths` (0 keeps everything) of all partitioned tables. Skipped while another
+    process maintains the partitions.
+
+    Returns:
+        The names of the created and dropped partitions per table.
+    """
+    target_engine = target_engine or engine
+    if target_engine.dialect.name != "postgresql":
+        return {}
+    partitioning_config = ConfigManager.get_config("database.partitioning", default={}) or {}
+    premake_months = int(partitioning_config.get("premakeMonths", 3))
+    retention_config = partitioning_config.get("retentionMonths", {}) or {}
+    current_month = month_start(today or datetime.utcnow().date())
+    key = advisory_lock_key(_MAINTENANCE_LOCK)
+
+    result = {}
+    with target_engine.connect() as connection:
+        # Statements of this connection are committed one by one (required to detach partitions concurrently)
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        if not connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}):
+            logger.debug("The partitions are being maintained by another process.")
+            return result
+        # Detaching waits for the running transactions using the table, longer than the statement timeout of the requests
+        statement_timeout = connection.scalar(text("SHOW statement_timeout"))
+        connection.execute(text("SET statement_timeout = 0"))
+        try:
+            for table in PARTITION_KEYS:
+                if not is_partitioned(connection, table):
+                    continue
+                retention_months = int(retention_config.get(RETENTION_CONFIG_KEYS[table], 0))
+                # Keeps the current month and the given number of months before it
+                cutoff = add_months(current_month, -retention_months) if retention_months > 0 else None
+                with target_engine.begin() as transaction:
+                    created = create_partitions(transaction, table, [add_months(current_month, offset) for offset in range(premake_months + 1)])
+                result[table] = {
+                    "created": created,
+                    "dropped": drop_partitions(connection, table, cutoff) if cutoff is not None else [],
+                }
+                if result[table]["created"] or result[table]["dropped"]:
+                    logger.info(f"Maintained the partitions of {table}: created {result[table]['created']}, dropped {result[table]['dropped']}.")
+        finally:
+            connection.execute(text("SELECT set_config('statement_timeout', :value, false)"), {"value": statement_timeout})
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+    return result
+
+_maintenance_lock = Lock()
+_maintenance_thread: Optional[Thread] = None
+
+def start_partition_maintenance() -> None:
+    """Maintain the partitions now and periodically in the background, unless disabled or not applicable (not PostgreSQL)."""
+    global _maintenance_thread
+    partitioning_config = ConfigManager.get_config("database.partitioning", default={}) or {}
+    if not partitioning_config.get("enabled", True) or engine.dialect.name != "postgresql":
+        return
+    check_interval = float(partitioning_config.get("checkInterval", 3600))
+    with _maintenance_lock:
+        if _maintenance_thread is not None:
+            return
+        # The partition of the current month has to exist before the first parts are created
+        _maintain()
+        _maintenance_thread = Thread(target=_maintain_periodically, args=(check_interval,), name="database-partition-maintenance", daemon=True)
+        _maintenance_thread.start()
+
+def _maintain() -> None:
+    try:
+        maintain_partitions()
+    except Exception as e:
+        logger.warning(f"Failed to maintain the partitions of the metadata database: {e}")
+
+def _maintain_periodically(check_interval: float) -> None:
+    while True:
+        sleep(check_interval)
+        _maintain()
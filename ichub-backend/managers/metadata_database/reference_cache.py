@@ -0,0 +1,241 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Process-local cache of the small, rarely changing reference data of the metadata database
+(legal entities, business partners, enablement service stacks and data exchange agreements).
+
+Entries expire after a TTL and are invalidated per model on every write through a session
+(ORM flushes and the Core writes of the repositories, see `mark_changed`). Entries are only
+published to the process wide cache when the transaction which loaded them commits, so that
+uncommitted rows never become visible to other sessions. Writes of other processes are announced
+by the change feed (PostgreSQL, see `change_feed`); the TTL bounds how long a missed announcement goes unnoticed.
+The cache is loaded at startup by the warm-up of the backend (see `preload_reference_data`).
+"""
+
+from collections import OrderedDict
+from itertools import chain
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from database import get_read_engine
+from managers.config.config_manager import ConfigManager
+from managers.metadata_database.change_feed import register_change_listener
+from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, EnablementServiceStack, LegalEntity
+
+CACHED_MODELS = frozenset({BusinessPartner, DataExchangeAgreement, EnablementServiceStack, LegalEntity})
+
+# Keys of the session info: entries loaded and models changed in the current transaction
+_STAGED_ENTRIES = "reference_cache_staged"
+_CHANGED_MODELS = "reference_cache_changed"
+
+class ReferenceDataCache:
+    """
+    Thread safe, bounded (least recently used entries are evicted first) cache with expiry.
+    An entry holds the result of a lookup (one entity or a list of entities) as detached copies,
+    which are merged into the session of the caller without loading them from the database.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60, enabled: bool = True):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = Lock()
+        self._entries: "OrderedDict[Tuple[type, Hashable], Tuple[float, bool, Tuple[Any, ...]]]" = OrderedDict()
+        self._statistics: Dict[str, Dict[str, int]] = {}
+
+    def get(self, session: Session, model_type: type, key: Hashable) -> Optional[Any]:
+        """Return the cached result of the lookup identified by the key, attached to the session; None if not cached."""
+        if not self.enabled:
+            return None
+        staged = session.info.get(_STAGED_ENTRIES, {}).get((model_type, key))
+        if staged is not None:
+            # Loaded before by the same transaction: the entities are already part of the session
+            self._count(model_type, "hits")
+            return staged
+
+        with self._lock:
+            entry = self._entries.get((model_type, key))
+            if entry is not None and entry[0] < monotonic():
+                del self._entries[(model_type, key)]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end((model_type, key))
+        if entry is None:
+            self._count(model_type, "misses")
+            return None
+
+        self._count(model_type, "hits")
+        _, many, copies = entry
+        entities = [session.merge(copy, load=False) for copy in copies]
+        return entities if many else entities[0]
+
+    def put(self, session: Session, model_type: type, key: Hashable, result: Any) -> None:
+        """Stage the result of a lookup; it is published when the transaction of the session commits."""
+        if not self.enabled or result is None or (isinstance(result, list) and not result):
+            return
+        session.info.setdefault(_STAGED_ENTRIES, {})[(model_type, key)] = result
+
+    def invalidate(self, *model_types: type) -> None:
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._entries if cache_key[0] in model_types]:
+                del self._entries[cache_key]
+        for model_type in model_types:
+            self._count(model_type, "invalidations")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._entries)
+            statistics = {model: dict(counters) for model, counters in self._statistics.items()}
+        for counters in statistics.values():
+            lookups = counters.get("hits", 0) + counters.get("misses", 0)
+            counters["hitRatio"] = round(counters.get("hits", 0) / lookups, 3) if lookups else 0.0
+        return {"enabled": self.enabled, "entries": entries, "maxSize": self.max_size, "ttlSeconds": self.ttl, "models": statistics}
+
+    def _publish(self, staged: Dict[Tuple[type, Hashable], Any], changed: Set[type]) -> None:
+        expires_at = monotonic() + self.ttl
+        for (model_type, key), result in staged.items():
+            # Lookups made before a write of the same transaction might not reflect it
+            if model_type in changed:
+                continue
+            many = isinstance(result, list)
+            copies = tuple(_detached_copy(entity) for entity in (result if many else [result]))
+            if any(copy is None for copy in copies):
+                continue
+            with self._lock:
+                self._entries[(model_type, key)] = (expires_at, many, copies)
+                self._entries.move_to_end((model_type, key))
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._count(model_type, "evictions", locked=True)
+
+    def _count(self, model_type: type, counter: str, locked: bool = False) -> None:
+        if locked:
+            counters = self._statistics.setdefault(model_type.__name__, {})
+            counters[counter] = counters.get(counter, 0) + 1
+            return
+        with self._lock:
+            self._count(model_type, counter, locked=True)
+
+def _detached_copy(entity: Any) -> Optional[Any]:
+    """Copy the column values of an entity into a new detached instance, None if they are not all loaded."""
+    state = inspect(entity)
+    column_keys = [attribute.key for attribute in state.mapper.column_attrs]
+    if state.unloaded.intersection(column_keys):
+        return None
+    copy = state.mapper.class_(**{key: getattr(entity, key) for key in column_keys})
+    make_transient_to_detached(copy)
+    return copy
+
+reference_cache_config = ConfigManager.get_config("database.referenceCache", default={}) or {}
+reference_data_cache = ReferenceDataCache(
+    max_size=int(reference_cache_config.get("maxSize", 1024)),
+    ttl=float(reference_cache_config.get("ttl", 60)),
+    enabled=bool(reference_cache_config.get("enabled", True)),
+)
+
+def _invalidate_notified(entity_type: str, keys) -> None:
+    # Lookups are cached by arbitrary keys (and as lists), so the whole model is invalidated
+    reference_data_cache.invalidate(*(model_type for model_type in CACHED_MODELS if model_type.__tablename__ == entity_type))
+
+register_change_listener(CACHED_MODELS, _invalidate_notified)
+
+def mark_changed(session: Session, model_type: type) -> None:
+    """Invalidate the cached entries of a model written with a Core statement (bypassing the ORM flush)."""
+    _invalidate(session, {model_type}.intersection(CACHED_MODELS))
+
+def _invalidate(session: Session, changed: Iterable[type]) -> None:
+    changed = set(changed)
+    if not changed:
+        return
+    reference_data_cache.invalidate(*changed)
+    session.info.setdefault(_CHANGED_MODELS, set()).update(changed)
+    staged = session.info.get(_STAGED_ENTRIES)
+    if staged:
+        for cache_key in [cache_key for cache_key in staged if cache_key[0] in changed]:
+            del staged[cache_key]
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context) -> None:
+    # Changes of relationship collections only (e.g. a new twin exchange of an agreement) leave the cached columns unchanged
+    modified = (obj for obj in session.dirty if session.is_modified(obj, include_collections=False))
+    _invalidate(session, {type(obj) for obj in chain(session.new, modified, session.deleted)}.intersection(CACHED_MODELS))
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    staged = session.info.pop(_STAGED_ENTRIES, None)
+    changed = session.info.pop(_CHANGED_MODELS, set())
+    if changed:
+        # Again after the commit: concurrent sessions might have cached the previous state in the meantime
+        reference_data_cache.invalidate(*changed)
+    if staged:
+        reference_data_cache._publish(staged, changed)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_STAGED_ENTRIES, None)
+    session.info.pop(_CHANGED_MODELS, None)
+
+def preload_reference_data() -> int:
+    """
+    Load the reference data into the cache (e.g. at startup), keyed as looked up by the repositories,
+    up to the maximum size of the cache. Returns the number of cached lookups.
+    """
+    if not reference_data_cache.enabled:
+        return 0
+    # Lookups by natural key (one entity each) and the agreements by business partner (one list each)
+    lookups = [
+        (LegalEntity, LegalEntity.id, lambda entity: (("bpnl", entity.bpnl),)),
+        (BusinessPartner, BusinessPartner.id, lambda entity: (("bpnl", entity.bpnl),)),
+        (EnablementServiceStack, EnablementServiceStack.id, lambda entity: (("name", entity.name),)),
+        (DataExchangeAgreement, DataExchangeAgreement.business_partner_id, lambda entity: (("business_partner_id", entity.business_partner_id),)),
+    ]
+    with Session(get_read_engine(), expire_on_commit=False) as session, session.begin():
+        for model_type, order, key in lookups:
+            remaining = reference_data_cache.max_size - len(session.info.get(_STAGED_ENTRIES, ()))
+            if remaining <= 0:
+                break
+            results: Dict[Hashable, Any] = {}
+            for entity in session.scalars(select(model_type).order_by(order)):
+                if model_type is DataExchangeAgreement:
+                    results.setdefault(key(entity), []).append(entity)
+                else:
+                    results[key(entity)] = entity
+                if len(results) > remaining:
+                    break
+            for cache_key, result in list(results.items())[:remaining]:
+                reference_data_cache.put(session, model_type, cache_key, result)
+        preloaded = len(session.info.get(_STAGED_ENTRIES, ()))
+    # Published by the commit
+    return preloaded
+
+def get_reference_cache_statistics() -> Dict[str, Any]:
+    """Return the hit and miss statistics of the reference data cache."""
+    return reference_data_cache.snapshot()
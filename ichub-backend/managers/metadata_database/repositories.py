@@ -22,13 +22,27 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from sqlalchemy import case
+from sqlalchemy import and_, or_, bindparam, case, cast, column, exists, func, insert, table, text, tuple_, update, literal, literal_column, union_all, Float, Integer, Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import Boolean
+from sqlalchemy.exc import IntegrityError
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 from sqlmodel import SQLModel, Session, select
-from sqlalchemy.orm import selectinload, aliased
-from typing import TypeVar, Type, List, Optional, Generic
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload, aliased
+from typing import TypeVar, Type, List, Optional, Generic, Dict, Tuple, Any, Sequence, Set, Union, Callable, Hashable, Iterable, Iterator, NamedTuple
+from enum import Enum
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
+from managers.metadata_database.change_feed import record_changes
+from managers.metadata_database.reference_cache import CACHED_MODELS, mark_changed, reference_data_cache
+from managers.metadata_database.sharing_status import refresh_written
+from models.services.part_management import CatalogPartFilter
+from models.services.twin_management import TwinAspectRegistrationStatus
 from models.metadata_database.models import (
     BusinessPartner,
     CatalogPart,
@@ -36,6 +50,7 @@ from models.metadata_database.models import (
     EnablementServiceStack,
     LegalEntity,
     PartnerCatalogPart,
+    SerializedPart,
     Twin,
     TwinAspect,
     TwinAspectRegistration,
@@ -45,6 +60,74 @@ from models.metadata_database.models import (
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+BULK_BATCH_SIZE = 1000
+"""Number of rows sent per multi-row INSERT statement by the bulk methods of the repositories."""
+
+STREAM_BATCH_SIZE = 1000
+"""Number of rows fetched at once from the server-side cursor by the streaming methods of the repositories."""
+
+# Dialects supporting INSERT ... ON CONFLICT; all other dialects use the portable fallback
+_ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Whether the pg_trgm extension is installed, per database URL
+_TRIGRAM_SUPPORT: Dict[str, bool] = {}
+
+def supports_trigram_search(connection: Connection) -> bool:
+    """Whether the database of the connection provides trigram similarity (PostgreSQL with the pg_trgm extension)."""
+    if connection.dialect.name != "postgresql":
+        return False
+    url = str(connection.engine.url)
+    if url not in _TRIGRAM_SUPPORT:
+        _TRIGRAM_SUPPORT[url] = bool(connection.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")))
+    return _TRIGRAM_SUPPORT[url]
+
+class contains_material(FunctionElement):
+    """
+    Whether a materials column contains the material with the given name (and at least the given share in percent).
+    On PostgreSQL this is a containment (@>) served by the GIN index on the column.
+    """
+    type = Boolean()
+    inherit_cache = True
+
+    def __init__(self, column, name: str, min_share: Optional[int] = None):
+        super().__init__(column, literal(name), *(() if min_share is None else (literal(min_share),)))
+
+@compiles(contains_material)
+def _compile_contains_material(element, compiler, **kw):
+    column, name, *min_share = [compiler.process(clause, **kw) for clause in element.clauses]
+    condition = f"json_extract(json_each.value, '$.name') = {name}"
+    if min_share:
+        condition += f" AND json_extract(json_each.value, '$.share') >= {min_share[0]}"
+    return f"EXISTS (SELECT 1 FROM json_each({column}) WHERE {condition})"
+
+@compiles(contains_material, "postgresql")
+def _compile_contains_material_postgresql(element, compiler, **kw):
+    column, name, *min_share = [compiler.process(clause, **kw) for clause in element.clauses]
+    condition = f"{column} @> jsonb_build_array(jsonb_build_object('name', CAST({name} AS TEXT)))"
+    if min_share:
+        # The containment narrows down the rows by the index, the share is checked on the remaining ones
+        condition += (f" AND EXISTS (SELECT 1 FROM jsonb_array_elements({column}) AS material"
+            f" WHERE material ->> 'name' = CAST({name} AS TEXT) AND CAST(material ->> 'share' AS NUMERIC) >= {min_share[0]})")
+    return f"({condition})"
+
+class LoadingProfile(str, Enum):
+    """
+    Named eager-loading profiles for the read paths of the repositories.
+
+    Each profile loads exactly the relationships the corresponding service mapping navigates,
+    so that reading a page of entities takes a constant number of queries instead of one
+    additional lazy load per entity (N+1).
+    """
+    LIST = "list"
+    """Only what is needed to render an entity in a listing, wide (JSON) columns are not loaded."""
+    DETAIL = "detail"
+    """Everything needed to render the full details of an entity."""
+    SHARE = "share"
+    """Everything needed to share an entity with a business partner."""
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, session: Session):
         self._session = session
@@ -68,16 +151,32 @@ class BaseRepository(Generic[ModelType]):
             self.get_type().id == obj_id)  # type: ignore
         return self._session.scalars(stmt).first()
 
-    def find_all(self, offset: Optional[int] = None, limit: Optional[int] = 100) -> List[ModelType]:
-        stmt = select(self.get_type())  # select(Author)
+    def find_all(self, offset: Optional[int] = None, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ModelType]:
+        """
+        Find all entities ordered by id. Pass `after_id` (the id of the last entity of the previous page)
+        and `limit` for keyset pagination. Without a limit all entities are returned.
+        """
+        stmt = self.build_find_all_stmt(self.get_type(), offset, limit, after_id)
+        result = self._session.scalars(stmt).unique()
+        return list(result)
+
+    @staticmethod
+    def build_find_all_stmt(model_type: Type[ModelType], offset: Optional[int] = None, limit: Optional[int] = None, after_id: Optional[int] = None):
+        stmt = select(model_type)  # select(Author)
+
+        # Entities with composite primary keys have no id to order and paginate by
+        if hasattr(model_type, "id"):
+            stmt = stmt.order_by(model_type.id)
+            if after_id is not None:
+                stmt = stmt.where(model_type.id > after_id)
+
         if offset is not None:
             stmt = stmt.offset(offset)
 
         if limit is not None:
             stmt = stmt.limit(limit)
 
-        result = self._session.scalars(stmt).unique()
-        return list(result)
+        return stmt
 
     def update(self, id: int, obj_in: dict) -> Optional[ModelType]:
         db_obj = self._session.get(self.get_type(), id)
@@ -85,8 +184,7 @@ class BaseRepository(Generic[ModelType]):
             return None
         for field, value in obj_in.items():
             setattr(db_obj, field, value)
-        self._session.commit()
-        self._session.refresh(db_obj)
+        self._session.flush()
         return db_obj
 
     def commit(self) -> None:
@@ -110,7 +208,262 @@ class BaseRepository(Generic[ModelType]):
     def delete_obj(self, obj: ModelType) -> None:
         self._session.delete(obj)
 
+    def bulk_insert(self, rows: Sequence[Union[ModelType, Dict[str, Any]]],
+            returning: Optional[Sequence[str]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[Any]:
+        """
+        Insert many rows with multi-row INSERT statements (one per `batch_size` rows).
+
+        The rows can be given as model instances or as dictionaries of column values.
+        Returns the values of the `returning` columns (default: the primary key) of the
+        inserted rows in the order of the given rows; a single column is returned as scalar,
+        several columns as tuples.
+
+        The rows are written with Core statements: they are not added to the session and
+        the transaction is not committed. The stored sharing status of the affected catalog parts is refreshed.
+        """
+        mark_changed(self._session, self.get_type())
+        record_changes(self._session, self.get_type())
+        table = self._table()
+        returning_columns = self._returning_columns(returning)
+        dialect = self._session.get_bind().dialect
+        rows = self._to_rows(rows)
+        result = []
+
+        for batch in self._batches(rows, batch_size):
+            if dialect.insert_executemany_returning_sort_by_parameter_order:
+                stmt = insert(table).returning(*returning_columns, sort_by_parameter_order=True)
+                result.extend(self._result_values(self._session.execute(stmt, batch)))
+            else:
+                for row in batch:
+                    result.extend(self._fallback_insert(row, returning_columns))
+
+        refresh_written(self._session, self.get_type(), rows)
+        return result
+
+    def bulk_upsert(self, rows: Sequence[Union[ModelType, Dict[str, Any]]], conflict_columns: Sequence[str], update_columns: Sequence[str],
+            returning: Optional[Sequence[str]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[Any]:
+        """
+        Insert many rows, updating the `update_columns` of the rows that already exist.
+
+        The `conflict_columns` must be covered by a unique constraint of the table; rows with the same
+        values for them are collapsed beforehand (the last one wins), as PostgreSQL does not allow a
+        single INSERT ... ON CONFLICT DO UPDATE to touch a row twice.
+
+        Returns the values of the `returning` columns (default: the primary key) of all inserted
+        and updated rows, in no particular order. See `bulk_insert`.
+        """
+        mark_changed(self._session, self.get_type())
+        record_changes(self._session, self.get_type())
+        table = self._table()
+        returning_columns = self._returning_columns(returning)
+        rows = list({tuple(row[column] for column in conflict_columns): row for row in self._to_rows(rows)}.values())
+        dialect_insert = self._dialect_insert()
+        result = []
+
+        for batch in self._batches(rows, batch_size):
+            if dialect_insert is None:
+                for row in batch:
+                    result.extend(self._fallback_upsert(row, conflict_columns, update_columns, returning_columns))
+                continue
+
+            stmt = dialect_insert(table)
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={column: stmt.excluded[column] for column in update_columns}
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+            result.extend(self._result_values(self._session.execute(stmt.returning(*returning_columns), batch)))
+
+        refresh_written(self._session, self.get_type(), rows)
+        return result
+
+    def bulk_insert_ignore(self, rows: Sequence[Union[ModelType, Dict[str, Any]]], conflict_columns: Optional[Sequence[str]] = None,
+            returning: Optional[Sequence[str]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[Any]:
+        """
+        Insert many rows, silently skipping the rows violating a unique constraint
+        (only the one on the `conflict_columns`, if given).
+
+        Returns the values of the `returning` columns (default: the primary key) of the rows
+        actually inserted, in no particular order. See `bulk_insert`.
+        """
+        mark_changed(self._session, self.get_type())
+        record_changes(self._session, self.get_type())
+        table = self._table()
+        returning_columns = self._returning_columns(returning)
+        dialect_insert = self._dialect_insert()
+        rows = self._to_rows(rows)
+        result = []
+
+        for batch in self._batches(rows, batch_size):
+            if dialect_insert is None:
+                for row in batch:
+                    try:
+                        with self._session.begin_nested():
+                            result.extend(self._fallback_insert(row, returning_columns))
+                    except IntegrityError:
+                        pass
+                continue
+
+            stmt = dialect_insert(table).on_conflict_do_nothing(index_elements=conflict_columns)
+            result.extend(self._result_values(self._session.execute(stmt.returning(*returning_columns), batch)))
+
+        refresh_written(self._session, self.get_type(), rows)
+        return result
+
+    def _get_or_create(self, values: Dict[str, Any], conflict_columns: Sequence[str]) -> Tuple[ModelType, bool]:
+        """
+        Atomically retrieve the entity matching `values` on the `conflict_columns` (which must be covered
+        by a unique constraint) or create it from `values`. Returns the entity and whether it was created.
+
+        On PostgreSQL this is a single round trip: an INSERT ... ON CONFLICT DO NOTHING RETURNING combined
+        with a SELECT of the existing row. If the row was committed by a concurrent transaction after the
+        statement started, neither part returns it and a fallback SELECT retrieves it.
+        Unlike with the select-then-insert sequence, parallel requests can not run into unique constraint
+        violations. The new row is not committed.
+
+        Reference data (see `CACHED_MODELS`) is served from the reference data cache if possible,
+        which saves the round trip altogether.
+        """
+        cacheable = self.get_type() in CACHED_MODELS
+        key = tuple((column, values[column]) for column in conflict_columns)
+        if cacheable:
+            entity = reference_data_cache.get(self._session, self.get_type(), key)
+            if entity is not None:
+                return entity, False
+
+        entity, created = self._insert_or_select(values, conflict_columns)
+        if created:
+            mark_changed(self._session, self.get_type())
+            record_changes(self._session, self.get_type())
+        elif cacheable:
+            reference_data_cache.put(self._session, self.get_type(), key, entity)
+        return entity, created
+
+    def _insert_or_select(self, values: Dict[str, Any], conflict_columns: Sequence[str]) -> Tuple[ModelType, bool]:
+        model_type = self.get_type()
+        table = self._table()
+        row = self._to_rows([values])[0]
+        condition = and_(*(table.c[column] == row[column] for column in conflict_columns))
+        dialect_insert = self._dialect_insert()
+
+        if dialect_insert is postgresql.insert:
+            inserted = dialect_insert(table).values(row).on_conflict_do_nothing(
+                index_elements=conflict_columns).returning(*table.c).cte("inserted")
+            stmt = union_all(
+                select(*inserted.c, literal(True).label("created")),
+                select(*table.c, literal(False).label("created")).where(condition)
+            )
+            result = self._session.execute(select(model_type, stmt.selected_columns.created).from_statement(stmt)).first()
+            if result:
+                return result[0], result[1]
+        elif dialect_insert is not None:
+            stmt = dialect_insert(model_type).values(row).on_conflict_do_nothing(
+                index_elements=conflict_columns).returning(model_type)
+            entity = self._session.scalars(stmt).first()
+            if entity:
+                return entity, True
+        else:
+            entity = self._session.scalars(select(model_type).where(condition)).first()
+            if entity:
+                return entity, False
+            try:
+                with self._session.begin_nested():
+                    entity = self.create(model_type(**row))
+                return entity, True
+            except IntegrityError:
+                pass
+
+        return self._session.scalars(select(model_type).where(condition)).one(), False
+
+    def _cached(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Serve a lookup of reference data (see `CACHED_MODELS`) identified by the key from the reference
+        data cache, loading and caching it on a miss. Lookups of other models are always loaded.
+        """
+        if self.get_type() not in CACHED_MODELS:
+            return load()
+        result = reference_data_cache.get(self._session, self.get_type(), key)
+        if result is None:
+            result = load()
+            reference_data_cache.put(self._session, self.get_type(), key, result)
+        return result
+
+    def _table(self) -> Table:
+        return self.get_type().__table__  # type: ignore
+
+    def _dialect_insert(self):
+        return _ON_CONFLICT_INSERTS.get(self._session.get_bind().dialect.name)
+
+    def _returning_columns(self, returning: Optional[Sequence[str]]) -> List[Any]:
+        table = self._table()
+        if returning:
+            return [table.c[column] for column in returning]
+        return list(table.primary_key.columns)
+
+    def _to_rows(self, rows: Sequence[Union[ModelType, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Convert the given rows to dictionaries of column values with the same keys (as required
+        for executemany), applying the model defaults and leaving out unset primary keys.
+        """
+        model_type = self.get_type()
+        table = self._table()
+        # Constructing a model instance per dictionary is by far the slowest part of a bulk load,
+        # so the defaults of the model fields are applied directly
+        fields = {name: field for name, field in model_type.model_fields.items() if name in table.c}
+        result = []
+        for row in rows:
+            if isinstance(row, model_type):
+                values = row.model_dump()
+            else:
+                values = {name: row[name] if name in row else self._field_default(field) for name, field in fields.items()}
+            result.append({
+                column.name: values[column.name] for column in table.columns
+                if column.name in values and column.computed is None and not (column.primary_key and values[column.name] is None)
+            })
+        return result
+
+    @staticmethod
+    def _field_default(field: FieldInfo) -> Any:
+        if field.default_factory is not None:
+            return field.default_factory()
+        return None if field.default is PydanticUndefined else field.default
+
+    @staticmethod
+    def _batches(rows: List[Dict[str, Any]], batch_size: int):
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    @staticmethod
+    def _result_values(result) -> List[Any]:
+        return [row[0] if len(row) == 1 else tuple(row) for row in result]
+
+    def _fallback_insert(self, row: Dict[str, Any], returning_columns: List[Any]) -> List[Any]:
+        inserted_primary_key = self._session.execute(insert(self._table()).values(row)).inserted_primary_key
+        return self._select_returning(returning_columns, self._primary_key_condition(inserted_primary_key))
+
+    def _fallback_upsert(self, row: Dict[str, Any], conflict_columns: Sequence[str], update_columns: Sequence[str], returning_columns: List[Any]) -> List[Any]:
+        table = self._table()
+        condition = and_(*(table.c[column] == row[column] for column in conflict_columns))
+        existing = self._select_returning(returning_columns, condition)
+        if not existing:
+            return self._fallback_insert(row, returning_columns)
+        if update_columns:
+            self._session.execute(update(table).where(condition).values({column: row[column] for column in update_columns}))
+            return self._select_returning(returning_columns, condition)
+        return existing
+
+    def _primary_key_condition(self, primary_key: Sequence[Any]):
+        return and_(*(column == value for column, value in zip(self._table().primary_key.columns, primary_key)))
+
+    def _select_returning(self, returning_columns: List[Any], condition) -> List[Any]:
+        return self._result_values(self._session.execute(select(*returning_columns).where(condition)))
+
 class BusinessPartnerRepository(BaseRepository[BusinessPartner]):
+    # Hot lookups are built once with bound parameters, so that neither the statement
+    # nor its cache key have to be rebuilt on every call
+    GET_BY_BPNL_STMT = select(BusinessPartner).where(BusinessPartner.bpnl == bindparam("bpnl"))
 
     def create_new(self, name: str, bpnl: str) -> BusinessPartner:
         """Create a new BusinessPartner instance."""
@@ -121,15 +474,32 @@ class BusinessPartnerRepository(BaseRepository[BusinessPartner]):
         self.create(business_partner)
         return business_partner
 
+    def get_or_create(self, bpnl: str, name: str) -> Tuple[BusinessPartner, bool]:
+        """Atomically retrieve the BusinessPartner with the given BPNL or create it with the given name. Returns the entity and whether it was created."""
+        return self._get_or_create({"bpnl": bpnl, "name": name}, conflict_columns=["bpnl"])
+
     def get_by_name(self, name: str) -> Optional[BusinessPartner]:
         stmt = select(BusinessPartner).where(
             BusinessPartner.name == name)  # type: ignore
-        return self._session.scalars(stmt).first()
+        return self._cached((("name", name),), lambda: self._session.scalars(stmt).first())
 
     def get_by_bpnl(self, bpnl: str) -> Optional[BusinessPartner]:
-        stmt = select(BusinessPartner).where(
-            BusinessPartner.bpnl == bpnl)  # type: ignore
-        return self._session.scalars(stmt).first()
+        return self._cached((("bpnl", bpnl),), lambda: self._session.scalars(self.GET_BY_BPNL_STMT, {"bpnl": bpnl}).first())
+
+class CatalogPartListRecord(NamedTuple):
+    """
+    Row of a catalog part listing read with a Core statement, i.e. without creating ORM instances
+    (no identity map, no attribute instrumentation, no loader options).
+    The score is only set for the records of a search.
+    """
+    id: int
+    manufacturer_id: str
+    manufacturer_part_id: str
+    name: str
+    category: Optional[str]
+    bpns: Optional[str]
+    status: int
+    score: Optional[float] = None
 
 class CatalogPartRepository(BaseRepository[CatalogPart]):
 
@@ -139,60 +509,298 @@ class CatalogPartRepository(BaseRepository[CatalogPart]):
             CatalogPart.manufacturer_part_id == manufacturer_part_id)
         return self._session.scalars(stmt).first()
 
-    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False) -> List[tuple[CatalogPart, int]]:
+    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> List[tuple[CatalogPart, int]]:
         """
         Find catalog parts by manufacturer ID and manufacturer part ID.
         If manufacturer ID is not provided, all catalog parts are returned.
         If manufacturer part ID is not provided, all catalog parts with the given manufacturer ID are returned.
+        If a status or material and dimension filters are provided, only the matching catalog parts are returned.
         
+        The result is ordered by the catalog part ID. For keyset pagination pass the ID of the last catalog part
+        of the previous page as `after_id` together with a `limit`.
+
+        The relationships of the catalog parts are loaded eagerly according to the given loading `profile`.
+
         The result is a list of tuples, where each tuple contains the CatalogPart object and its status.
         """
+        stmt = self.build_find_by_manufacturer_id_manufacturer_part_id_stmt(manufacturer_id, manufacturer_part_id, profile, after_id, limit, status, filters)
+        return self._session.exec(stmt).all()
+
+    def find_list_records(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> List[CatalogPartListRecord]:
+        """
+        Find the catalog parts of `find_by_manufacturer_id_manufacturer_part_id` as plain list records.
+
+        The statement is executed on the connection of the session, bypassing the ORM: use it for listings
+        only, pending changes of the session are not flushed before and the records are not tracked.
+        """
+        stmt = self.build_find_list_records_stmt(manufacturer_id, manufacturer_part_id, after_id, limit, status, filters)
+        return [CatalogPartListRecord(*row) for row in self._session.connection().execute(stmt)]
+
+    def stream_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            profile: LoadingProfile = LoadingProfile.LIST, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[List[tuple[CatalogPart, int]]]:
+        """
+        Stream the catalog parts of `find_by_manufacturer_id_manufacturer_part_id` in batches of `batch_size`
+        (catalog part, status) tuples, fetched from a server-side cursor: the memory used does not depend
+        on the number of catalog parts. Collections of the loading `profile` are loaded per batch.
+        """
+        stmt = self.build_find_by_manufacturer_id_manufacturer_part_id_stmt(manufacturer_id, manufacturer_part_id, profile)
+        # yield_per implies stream_results, i.e. a server-side cursor
+        yield from self._session.exec(stmt.execution_options(yield_per=batch_size)).partitions()
 
-        # Case to determine the status of the catalog part
-        status_expr = case(
-            # 0: no twin at all (draft)
-            (CatalogPart.twin_id.is_(None), 0),
-            # 1: twin exists, but not yet DTR-registered (pending)
-            (TwinRegistration.dtr_registered.is_(False), 1),
-            # 2: DTR-registered but not yet in any TwinExchange row (registered)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_(None)), 2),
-            # 3: DTR-registered AND appears in TwinExchange (shared)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_not(None)), 3),
-            else_=0
-        ).label("status")
+    def search(self, query: str, manufacturer_id: Optional[str] = None, profile: LoadingProfile = LoadingProfile.LIST,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None) -> List[tuple[CatalogPart, int, float]]:
+        """
+        Search the catalog parts whose name, manufacturer part ID, category or one of whose customer part IDs
+        contains the query (case insensitive), optionally only those of the given manufacturer.
+
+        The result is a list of (catalog part, status, score) tuples, best matches (highest score) first.
+        For keyset pagination pass the score and ID of the last catalog part of the previous page as `after`
+        together with a `limit`. See `build_search_stmt` for the scoring.
+        """
+        stmt = self.build_search_stmt(query, supports_trigram_search(self._session.connection()), manufacturer_id, profile, after, limit)
+        return self._session.exec(stmt).all()
+
+    def search_list_records(self, query: str, manufacturer_id: Optional[str] = None,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None) -> List[CatalogPartListRecord]:
+        """Search the catalog parts as plain list records (with their score), see `search` and `find_list_records`."""
+        connection = self._session.connection()
+        stmt = self.build_search_list_records_stmt(query, supports_trigram_search(connection), manufacturer_id, after, limit)
+        return [CatalogPartListRecord(*row) for row in connection.execute(stmt)]
+
+    # Columns rendered by the listings. The description, the materials and dimensions (JSON) and the
+    # generated dimension columns are only loaded by the other profiles, an access would load them lazily
+    LIST_COLUMNS = (
+        CatalogPart.manufacturer_part_id, CatalogPart.legal_entity_id, CatalogPart.twin_id,
+        CatalogPart.name, CatalogPart.category, CatalogPart.bpns,
+    )
+
+    # Columns of a CatalogPartListRecord, in the order of its fields (without the score)
+    LIST_RECORD_COLUMNS = (
+        CatalogPart.id, LegalEntity.bpnl, CatalogPart.manufacturer_part_id,
+        CatalogPart.name, CatalogPart.category, CatalogPart.bpns, CatalogPart.status,
+    )
+
+    # The legal entity is always joined by the statement and therefore populated from the same rows
+    LOADING_PROFILES: Dict[LoadingProfile, Tuple] = {
+        LoadingProfile.LIST: (
+            load_only(*LIST_COLUMNS),
+            contains_eager(CatalogPart.legal_entity),
+        ),
+        LoadingProfile.DETAIL: (
+            contains_eager(CatalogPart.legal_entity),
+            selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+        ),
+        LoadingProfile.SHARE: (
+            contains_eager(CatalogPart.legal_entity),
+            selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+            joinedload(CatalogPart.twin),
+        ),
+    }
 
-        stmt = select(CatalogPart, status_expr).distinct(CatalogPart.id)
+    @classmethod
+    def build_find_by_manufacturer_id_manufacturer_part_id_stmt(cls, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None):
+        """Build the statement selecting catalog parts together with their status (shared by the sync and async repositories)."""
+
+        # The status is maintained with the catalog part (see sharing_status)
+        stmt = select(CatalogPart, CatalogPart.status)
+
+        # Within a unit of work the catalog parts may already be in the session with outdated
+        # relationships (e.g. a partner catalog part added since), so they are populated again
+        stmt = stmt.options(*cls.LOADING_PROFILES[profile]).execution_options(populate_existing=True)
+
+        return cls._apply_find_criteria(stmt, manufacturer_id, manufacturer_part_id, after_id, limit, status, filters)
 
-        stmt = stmt.outerjoin(TwinRegistration, TwinRegistration.twin_id == CatalogPart.twin_id)
-        stmt = stmt.outerjoin(TwinExchange, TwinExchange.twin_id == CatalogPart.twin_id)
+    @classmethod
+    def build_find_list_records_stmt(cls, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            after_id: Optional[int] = None, limit: Optional[int] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None):
+        """Build the Core statement selecting the catalog parts as list records (shared by the sync and async repositories)."""
+        stmt = select(*cls.LIST_RECORD_COLUMNS).select_from(CatalogPart)
+        return cls._apply_find_criteria(stmt, manufacturer_id, manufacturer_part_id, after_id, limit, status, filters)
+
+    @classmethod
+    def _apply_find_criteria(cls, stmt, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str],
+            after_id: Optional[int], limit: Optional[int], status: Optional[int], filters: Optional[CatalogPartFilter]):
+        stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
 
         if manufacturer_id:
-            stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(LegalEntity.bpnl == manufacturer_id)
+            stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
 
         if manufacturer_part_id:
             stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
 
-        if join_partner_catalog_parts:
-            subquery = select(PartnerCatalogPart).join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id).where(PartnerCatalogPart.catalog_part_id == CatalogPart.id).subquery()
-            stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)
+        if status is not None:
+            stmt = stmt.where(CatalogPart.status == status)
 
-        return self._session.exec(stmt).all()
+        if filters is not None:
+            stmt = stmt.where(*cls.build_filter_conditions(filters))
+
+        if after_id is not None:
+            stmt = stmt.where(CatalogPart.id > after_id)
+
+        stmt = stmt.order_by(CatalogPart.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
+
+    @staticmethod
+    def build_filter_conditions(filters: CatalogPartFilter) -> List[Any]:
+        """
+        Build the conditions of the given material and dimension filters. The dimensions are compared with the
+        generated columns holding them in millimetres and kilograms, each of which is indexed.
+        The minimum material share only applies together with a material.
+        """
+        conditions = []
+        if filters.material is not None:
+            conditions.append(contains_material(CatalogPart.materials, filters.material, filters.min_material_share))
+        for column, minimum, maximum in (
+                (CatalogPart.width_mm, filters.min_width, filters.max_width),
+                (CatalogPart.height_mm, filters.min_height, filters.max_height),
+                (CatalogPart.length_mm, filters.min_length, filters.max_length),
+                (CatalogPart.weight_kg, filters.min_weight, filters.max_weight)):
+            if minimum is not None:
+                conditions.append(column >= minimum)
+            if maximum is not None:
+                conditions.append(column <= maximum)
+        return conditions
+
+    @staticmethod
+    def build_ranked_matches(query: str, trigram: bool):
+        """
+        Build the subquery of the IDs of the catalog parts matching the query, together with their score.
+
+        Every searched column is matched on its own with ILIKE (served by a trigram GIN index per column on
+        PostgreSQL) and a catalog part scores with its best matching column. With `trigram` the score is the
+        word similarity of the query to the column value (pg_trgm), otherwise 1 for an exact match,
+        0.75 for a prefix match and 0.5 for any other match.
+        """
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+        def match(key, column):
+            if trigram:
+                score = func.word_similarity(query, column)
+            else:
+                score = cast(case(
+                    (func.lower(column) == query.lower(), 1.0),
+                    (func.lower(column).like(pattern[1:].lower(), escape="\\"), 0.75),
+                    else_=0.5
+                ), Float)
+            return select(key.label("catalog_part_id"), score.label("score")).where(column.ilike(pattern, escape="\\"))
+
+        matches = union_all(
+            match(CatalogPart.id, CatalogPart.name),
+            match(CatalogPart.id, CatalogPart.manufacturer_part_id),
+            match(CatalogPart.id, CatalogPart.category),
+            match(PartnerCatalogPart.catalog_part_id, PartnerCatalogPart.customer_part_id),
+        ).subquery("matches")
+        return select(matches.c.catalog_part_id, func.max(matches.c.score).label("score")).group_by(matches.c.catalog_part_id).subquery("ranked")
+
+    @classmethod
+    def build_search_stmt(cls, query: str, trigram: bool, manufacturer_id: Optional[str] = None,
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None):
+        """
+        Build the statement searching catalog parts (shared by the sync and async repositories).
+        See `build_ranked_matches` for the scoring.
+        """
+        ranked = cls.build_ranked_matches(query, trigram)
+        stmt = select(CatalogPart, CatalogPart.status, ranked.c.score)
+
+        # See build_find_by_manufacturer_id_manufacturer_part_id_stmt
+        stmt = stmt.options(*cls.LOADING_PROFILES[profile]).execution_options(populate_existing=True)
+
+        return cls._apply_search_criteria(stmt, ranked, manufacturer_id, after, limit)
+
+    @classmethod
+    def build_search_list_records_stmt(cls, query: str, trigram: bool, manufacturer_id: Optional[str] = None,
+            after: Optional[Tuple[float, int]] = None, limit: Optional[int] = None):
+        """Build the Core statement searching catalog parts as list records (shared by the sync and async repositories)."""
+        ranked = cls.build_ranked_matches(query, trigram)
+        stmt = select(*cls.LIST_RECORD_COLUMNS, ranked.c.score).select_from(CatalogPart)
+        return cls._apply_search_criteria(stmt, ranked, manufacturer_id, after, limit)
+
+    @staticmethod
+    def _apply_search_criteria(stmt, ranked, manufacturer_id: Optional[str],
+            after: Optional[Tuple[float, int]], limit: Optional[int]):
+        stmt = stmt.join(ranked, ranked.c.catalog_part_id == CatalogPart.id)
+        stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
+
+        if manufacturer_id:
+            stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(or_(ranked.c.score < after_score, and_(ranked.c.score == after_score, CatalogPart.id > after_id)))
+
+        stmt = stmt.order_by(ranked.c.score.desc(), CatalogPart.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
 
 class DataExchangeAgreementRepository(BaseRepository[DataExchangeAgreement]):
     def get_by_business_partner_id(self, business_partner_id: int) -> List[DataExchangeAgreement]:
         stmt = select(DataExchangeAgreement).where(
             DataExchangeAgreement.business_partner_id == business_partner_id  # type: ignore
         )
-        return self._session.scalars(stmt).all()
+        return self._cached((("business_partner_id", business_partner_id),), lambda: self._session.scalars(stmt).all())
+
+    def get_or_create(self, business_partner_id: int, name: str) -> Tuple[DataExchangeAgreement, bool]:
+        """Atomically retrieve the DataExchangeAgreement with the given name for the business partner or create it. Returns the entity and whether it was created."""
+        return self._get_or_create({"business_partner_id": business_partner_id, "name": name}, conflict_columns=["business_partner_id", "name"])
 
 class LegalEntityRepository(BaseRepository[LegalEntity]):
+    GET_BY_BPNL_STMT = select(LegalEntity).where(LegalEntity.bpnl == bindparam("bpnl"))
 
     def get_by_bpnl(self, bpnl: str) -> Optional[LegalEntity]:
-        stmt = select(LegalEntity).where(
-            LegalEntity.bpnl == bpnl)  # type: ignore
-        return self._session.scalars(stmt).first()
+        return self._cached((("bpnl", bpnl),), lambda: self._session.scalars(self.GET_BY_BPNL_STMT, {"bpnl": bpnl}).first())
+
+    def get_or_create(self, bpnl: str) -> Tuple[LegalEntity, bool]:
+        """Atomically retrieve the LegalEntity with the given BPNL or create it. Returns the entity and whether it was created."""
+        return self._get_or_create({"bpnl": bpnl}, conflict_columns=["bpnl"])
+
+class PartnerCatalogPartRecord(NamedTuple):
+    """A partner catalog part resolved by its natural key, with what a part referencing it is rendered with."""
+    id: int
+    customer_part_id: str
+    business_partner_bpnl: str
 
 class PartnerCatalogPartRepository(BaseRepository[PartnerCatalogPart]):
+    def resolve_by_manufacturer_id_manufacturer_part_id_business_partner_name(self, keys: Iterable[Tuple[str, str, str]],
+            batch_size: int = BULK_BATCH_SIZE) -> Dict[Tuple[str, str, str], PartnerCatalogPartRecord]:
+        """
+        Resolve the partner catalog parts identified by (manufacturer ID, manufacturer part ID, business partner name)
+        with one set-based query per `batch_size` distinct keys, instead of one lookup of the legal entity,
+        catalog part, business partner and partner catalog part per key. Keys without partner catalog part
+        are missing from the result.
+        """
+        natural_key = tuple_(LegalEntity.bpnl, CatalogPart.manufacturer_part_id, BusinessPartner.name)
+        stmt = select(
+            LegalEntity.bpnl, CatalogPart.manufacturer_part_id, BusinessPartner.name,
+            PartnerCatalogPart.id, PartnerCatalogPart.customer_part_id, BusinessPartner.bpnl
+        ).select_from(PartnerCatalogPart).join(
+            CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).join(
+            BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id
+        ).where(natural_key.in_(bindparam("keys", expanding=True)))
+
+        result = {}
+        for batch in self._batches(list(set(keys)), batch_size):
+            for manufacturer_id, manufacturer_part_id, business_partner_name, *record in self._session.execute(stmt, {"keys": batch}):
+                result[(manufacturer_id, manufacturer_part_id, business_partner_name)] = PartnerCatalogPartRecord(*record)
+        return result
+
     def get_by_catalog_part_id_business_partner_id(self, catalog_part_id: int, business_partner_id: int) -> Optional[PartnerCatalogPart]:
         stmt = select(PartnerCatalogPart).where(
             PartnerCatalogPart.catalog_part_id == catalog_part_id).where(
@@ -235,8 +843,7 @@ class PartnerCatalogPartRepository(BaseRepository[PartnerCatalogPart]):
         existing = self._session.scalars(stmt).first()
         if existing:
             existing.customer_part_id = customer_part_id
-            self._session.commit()
-            self._session.refresh(existing)
+            self._session.flush()
         return existing
     
 class EnablementServiceStackRepository(BaseRepository[EnablementServiceStack]):
@@ -247,15 +854,21 @@ class EnablementServiceStackRepository(BaseRepository[EnablementServiceStack]):
         if join_legal_entity:
             stmt = stmt.join(LegalEntity, LegalEntity.id == EnablementServiceStack.legal_entity_id)
 
-        return self._session.scalars(stmt).first()
+        return self._cached((("name", name),), lambda: self._session.scalars(stmt).first())
     
     def find_by_legal_entity_bpnl(self, legal_entity_bpnl: str) -> List[EnablementServiceStack]:
         stmt = select(EnablementServiceStack).join(
             LegalEntity, LegalEntity.id == EnablementServiceStack.legal_entity_id).where(
             LegalEntity.bpnl == legal_entity_bpnl)
-        return self._session.scalars(stmt).all()
+        return self._cached((("legal_entity.bpnl", legal_entity_bpnl),), lambda: self._session.scalars(stmt).all())
+
+    def get_or_create(self, name: str, legal_entity_id: int) -> Tuple[EnablementServiceStack, bool]:
+        """Atomically retrieve the EnablementServiceStack with the given name or create it for the legal entity. Returns the entity and whether it was created."""
+        return self._get_or_create({"name": name, "legal_entity_id": legal_entity_id}, conflict_columns=["name"])
 
 class TwinRepository(BaseRepository[Twin]):
+    FIND_BY_GLOBAL_ID_STMT = select(Twin).where(Twin.global_id == bindparam("global_id"))
+
     def create_new(self, global_id: UUID = None, dtr_aas_id: UUID = None):
         """Create a new Twin instance with the given global_id and dtr_aas_id."""
         
@@ -276,24 +889,97 @@ class TwinRepository(BaseRepository[Twin]):
         return twin
     
     def find_by_global_id(self, global_id: UUID) -> Optional[Twin]:
-        stmt = select(Twin).where(
-            Twin.global_id == global_id)
-        return self._session.scalars(stmt).first()
+        return self._session.scalars(self.FIND_BY_GLOBAL_ID_STMT, {"global_id": global_id}).first()
+
+    def create_many(self, count: int, batch_size: int = BULK_BATCH_SIZE) -> List[int]:
+        """
+        Create `count` new twins (with new global IDs and AAS IDs) with multi-row INSERT statements,
+        e.g. for a bulk creation of parts. Returns the IDs of the twins. See `bulk_insert`.
+        """
+        return self.bulk_insert([{} for _ in range(count)], batch_size=batch_size)
+
+    def is_in_use(self, twin_id: int) -> bool:
+        """Whether the twin has aspects, registrations or exchanges, i.e. it has been registered or shared."""
+        return bool(self._session.scalar(select(or_(
+            exists().where(TwinAspect.twin_id == twin_id),
+            exists().where(TwinRegistration.twin_id == twin_id),
+            exists().where(TwinExchange.twin_id == twin_id),
+        ))))
     
     def find_catalog_part_twins(self,
             manufacturer_id: Optional[str] = None,
             manufacturer_part_id: Optional[str] = None,
             global_id: Optional[UUID] = None,
-            include_data_exchange_agreements: bool = False,
-            include_aspects: bool = False,
-            include_registrations: bool = False) -> List[Twin]:
-        
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None) -> List[Twin]:
+        """
+        Find catalog part twins, ordered by the twin ID. For keyset pagination pass the ID
+        of the last twin of the previous page as `after_id` together with a `limit`.
+
+        The relationships of the twins are loaded eagerly according to the given loading `profile`.
+        """
+        stmt = self.build_find_catalog_part_twins_stmt(
+            manufacturer_id, manufacturer_part_id, global_id, profile, after_id, limit)
+
+        return self._session.scalars(stmt).all()
+
+    def stream_catalog_part_twins(self,
+            manufacturer_id: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            profile: LoadingProfile = LoadingProfile.LIST,
+            batch_size: int = STREAM_BATCH_SIZE) -> Iterator[List[Twin]]:
+        """
+        Stream the catalog part twins of `find_catalog_part_twins` in batches of `batch_size` twins,
+        fetched from a server-side cursor: the memory used does not depend on the number of twins.
+        Collections of the loading `profile` are loaded per batch.
+        """
+        stmt = self.build_find_catalog_part_twins_stmt(manufacturer_id, manufacturer_part_id, profile=profile)
+        # yield_per implies stream_results, i.e. a server-side cursor
+        yield from self._session.scalars(stmt.execution_options(yield_per=batch_size)).partitions()
+
+    # Columns rendered by the listings (with and without shares), the asset class and additional context are only loaded for the details
+    LIST_COLUMNS = (Twin.global_id, Twin.aas_id, Twin.created_date, Twin.modified_date)
+
+    # The catalog part and its legal entity are always joined by the statement and therefore populated from the same rows
+    LOADING_PROFILES: Dict[LoadingProfile, Tuple] = {
+        LoadingProfile.LIST: (
+            load_only(*LIST_COLUMNS),
+            contains_eager(Twin.catalog_part).load_only(*CatalogPartRepository.LIST_COLUMNS),
+            contains_eager(Twin.catalog_part).contains_eager(CatalogPart.legal_entity),
+            contains_eager(Twin.catalog_part).selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+        ),
+        LoadingProfile.SHARE: (
+            load_only(*LIST_COLUMNS),
+            contains_eager(Twin.catalog_part).load_only(*CatalogPartRepository.LIST_COLUMNS),
+            contains_eager(Twin.catalog_part).contains_eager(CatalogPart.legal_entity),
+            contains_eager(Twin.catalog_part).selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+            selectinload(Twin.twin_exchanges).joinedload(TwinExchange.data_exchange_agreement).joinedload(DataExchangeAgreement.business_partner),
+        ),
+        LoadingProfile.DETAIL: (
+            contains_eager(Twin.catalog_part).contains_eager(CatalogPart.legal_entity),
+            contains_eager(Twin.catalog_part).selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+            selectinload(Twin.twin_exchanges).joinedload(TwinExchange.data_exchange_agreement).joinedload(DataExchangeAgreement.business_partner),
+            selectinload(Twin.twin_registrations).joinedload(TwinRegistration.enablement_service_stack),
+            selectinload(Twin.twin_aspects).selectinload(TwinAspect.twin_aspect_registrations).joinedload(TwinAspectRegistration.enablement_service_stack),
+        ),
+    }
+
+    @classmethod
+    def build_find_catalog_part_twins_stmt(cls,
+            manufacturer_id: Optional[str] = None,
+            manufacturer_part_id: Optional[str] = None,
+            global_id: Optional[UUID] = None,
+            profile: LoadingProfile = LoadingProfile.LIST,
+            after_id: Optional[int] = None,
+            limit: Optional[int] = None):
+        """Build the statement selecting catalog part twins (shared by the sync and async repositories)."""
+
+        # Each twin belongs to at most one catalog part (unique twin_id), so the joins do not duplicate rows
         stmt = select(Twin).join(
             CatalogPart, CatalogPart.twin_id == Twin.id).join(
             LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id
-        ).distinct()
-
-        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
+        ).options(*cls.LOADING_PROFILES[profile]).execution_options(populate_existing=True)
 
         if manufacturer_id:
             stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
@@ -304,42 +990,135 @@ class TwinRepository(BaseRepository[Twin]):
         if global_id:
             stmt = stmt.where(Twin.global_id == global_id)
 
-        return self._session.scalars(stmt).all()
-    
-    @staticmethod
-    def _apply_subquery_filters(stmt, include_data_exchange_agreements: bool, include_aspects: bool, include_registrations: bool):
-        if include_data_exchange_agreements:
-            subquery = select(TwinExchange).join(
-                DataExchangeAgreement, TwinExchange.data_exchange_agreement_id == DataExchangeAgreement.id
-            ).join(
-                BusinessPartner, BusinessPartner.id == DataExchangeAgreement.business_partner_id
-            ).subquery()
-            stmt = stmt.join(subquery, subquery.c.twin_id == Twin.id, isouter=True)
-
-        if include_registrations:
-            stmt = stmt.options(selectinload(Twin.twin_registrations))
-        
-        if include_aspects:
-            if include_registrations:
-                stmt = stmt.options(selectinload(Twin.twin_aspects).selectinload(TwinAspect.twin_aspect_registrations))
-            else:
-                stmt = stmt.options(selectinload(Twin.twin_aspects))
+        if after_id is not None:
+            stmt = stmt.where(Twin.id > after_id)
+
+        stmt = stmt.order_by(Twin.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-        
         return stmt
 
 
+class SerializedPartRecord(NamedTuple):
+    """
+    Row of a serialized part listing read with a Core statement, i.e. without creating ORM instances
+    (see `CatalogPartListRecord`).
+    """
+    id: int
+    manufacturer_id: str
+    manufacturer_part_id: str
+    part_instance_id: str
+    customer_part_id: str
+    van: Optional[str]
+    business_partner_name: str
+    business_partner_bpnl: str
+
+# Unique (partner catalog part ID, part instance ID) keys of the serialized parts across all partitions (PostgreSQL only),
+# maintained by a trigger of the serialized_part table; a key inserted without part ID is claimed for a part to be created
+_SERIALIZED_PART_KEY = table("serialized_part_key", column("partner_catalog_part_id"), column("part_instance_id"), schema="public")
+
+class SerializedPartRepository(BaseRepository[SerializedPart]):
+    # Columns of a SerializedPartRecord, in the order of its fields
+    RECORD_COLUMNS = (
+        SerializedPart.id, LegalEntity.bpnl, CatalogPart.manufacturer_part_id, SerializedPart.part_instance_id,
+        PartnerCatalogPart.customer_part_id, SerializedPart.van, BusinessPartner.name, BusinessPartner.bpnl,
+    )
+
+    GET_BY_PARTNER_CATALOG_PART_ID_PART_INSTANCE_ID_STMT = select(SerializedPart).where(
+        SerializedPart.partner_catalog_part_id == bindparam("partner_catalog_part_id"),
+        SerializedPart.part_instance_id == bindparam("part_instance_id"))
+
+    def get_by_partner_catalog_part_id_part_instance_id(self, partner_catalog_part_id: int, part_instance_id: str) -> Optional[SerializedPart]:
+        return self._session.scalars(self.GET_BY_PARTNER_CATALOG_PART_ID_PART_INSTANCE_ID_STMT, {
+            "partner_catalog_part_id": partner_catalog_part_id, "part_instance_id": part_instance_id}).first()
+
+    def find_existing(self, keys: Iterable[Tuple[int, str]], batch_size: int = BULK_BATCH_SIZE) -> Set[Tuple[int, str]]:
+        """Return which of the (partner catalog part ID, part instance ID) keys already exist, with one query per `batch_size` keys."""
+        natural_key = tuple_(SerializedPart.partner_catalog_part_id, SerializedPart.part_instance_id)
+        stmt = select(SerializedPart.partner_catalog_part_id, SerializedPart.part_instance_id).where(
+            natural_key.in_(bindparam("keys", expanding=True)))
+
+        existing = set()
+        for batch in self._batches(list(set(keys)), batch_size):
+            existing.update(tuple(row) for row in self._session.execute(stmt, {"keys": batch}))
+        return existing
+
+    def claim_keys(self, keys: Iterable[Tuple[int, str]], batch_size: int = BULK_BATCH_SIZE) -> Set[Tuple[int, str]]:
+        """
+        Claim the (partner catalog part ID, part instance ID) keys for serialized parts to be created in this
+        transaction, and return the claimed ones: keys of existing parts, or claimed by other transactions, are not.
+
+        On PostgreSQL the keys are inserted into the key table with INSERT ... ON CONFLICT DO NOTHING (in a fixed
+        order, against deadlocks), which waits for concurrent transactions claiming the same keys. Elsewhere the
+        keys of existing parts are left out, and the unique constraint of the table rejects concurrent duplicates.
+        """
+        keys = sorted(set(keys))
+        if self._session.get_bind().dialect.name != "postgresql":
+            return set(keys) - self.find_existing(keys, batch_size)
+
+        stmt = postgresql.insert(_SERIALIZED_PART_KEY).on_conflict_do_nothing().returning(
+            _SERIALIZED_PART_KEY.c.partner_catalog_part_id, _SERIALIZED_PART_KEY.c.part_instance_id)
+        claimed = set()
+        for batch in self._batches(keys, batch_size):
+            rows = [{"partner_catalog_part_id": partner_catalog_part_id, "part_instance_id": part_instance_id}
+                for partner_catalog_part_id, part_instance_id in batch]
+            claimed.update(tuple(row) for row in self._session.execute(stmt.values(rows)))
+        return claimed
+
+    def find_records(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            part_instance_id: Optional[str] = None, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[SerializedPartRecord]:
+        """
+        Find serialized parts by manufacturer ID, manufacturer part ID and part instance ID (all optional)
+        as plain records, ordered by the serialized part ID. For keyset pagination pass the ID of the last
+        serialized part of the previous page as `after_id` together with a `limit`.
+
+        The statement is executed on the connection of the session, bypassing the ORM (see `CatalogPartRepository.find_list_records`).
+        """
+        stmt = self.build_find_records_stmt(manufacturer_id, manufacturer_part_id, part_instance_id, after_id, limit)
+        return [SerializedPartRecord(*row) for row in self._session.connection().execute(stmt)]
+
+    @classmethod
+    def build_find_records_stmt(cls, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            part_instance_id: Optional[str] = None, after_id: Optional[int] = None, limit: Optional[int] = None):
+        """Build the Core statement selecting the serialized parts as records (shared by the sync and async repositories)."""
+        stmt = select(*cls.RECORD_COLUMNS).select_from(SerializedPart).join(
+            PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id).join(
+            CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).join(
+            BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id)
+
+        if manufacturer_id:
+            stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+
+        if manufacturer_part_id:
+            stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+
+        if part_instance_id:
+            stmt = stmt.where(SerializedPart.part_instance_id == part_instance_id)
+
+        if after_id is not None:
+            stmt = stmt.where(SerializedPart.id > after_id)
+
+        stmt = stmt.order_by(SerializedPart.id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
+
 class TwinAspectRepository(BaseRepository[TwinAspect]):
+    GET_BY_TWIN_ID_SEMANTIC_ID_STMT = select(TwinAspect).where(
+        TwinAspect.twin_id == bindparam("twin_id"),
+        TwinAspect.semantic_id == bindparam("semantic_id"))
+    GET_BY_TWIN_ID_SEMANTIC_ID_WITH_REGISTRATIONS_STMT = GET_BY_TWIN_ID_SEMANTIC_ID_STMT.options(
+        selectinload(TwinAspect.twin_aspect_registrations))
+
     def get_by_twin_id_semantic_id(self, twin_id: int, semantic_id: str, include_registrations: bool = False) -> Optional[TwinAspect]:
         """Retrieve a TwinAspect by its submodel_id."""
-        stmt = select(TwinAspect).where(TwinAspect.twin_id == twin_id).where(TwinAspect.semantic_id == semantic_id)
-
-        if include_registrations:
-            stmt = stmt.join(
-                TwinAspectRegistration, TwinAspectRegistration.twin_aspect_id == TwinAspect.id, isouter=True
-            )
-
-        return self._session.scalars(stmt).first()
+        stmt = self.GET_BY_TWIN_ID_SEMANTIC_ID_WITH_REGISTRATIONS_STMT if include_registrations else self.GET_BY_TWIN_ID_SEMANTIC_ID_STMT
+        return self._session.scalars(stmt, {"twin_id": twin_id, "semantic_id": semantic_id}).first()
 
     def create_new(self, twin_id: int, semantic_id: str, submodel_id: UUID = None) -> TwinAspect:
         """Create a new TwinAspect instance."""
@@ -358,16 +1137,27 @@ class TwinAspectRepository(BaseRepository[TwinAspect]):
 
 
 class TwinAspectRegistrationRepository(BaseRepository[TwinAspectRegistration]):
+    GET_BY_TWIN_ASPECT_ID_ENABLEMENT_SERVICE_STACK_ID_STMT = select(TwinAspectRegistration).where(
+        TwinAspectRegistration.twin_aspect_id == bindparam("twin_aspect_id"),
+        TwinAspectRegistration.enablement_service_stack_id == bindparam("enablement_service_stack_id"))
+
     def get_by_twin_aspect_id_enablement_service_stack_id(
         self, twin_aspect_id: int, enablement_service_stack_id: int
     ) -> Optional[TwinAspectRegistration]:
         """Retrieve a TwinAspectRegistration by twin_aspect_id and enablement_service_stack_id."""
-        stmt = select(TwinAspectRegistration).where(
-            TwinAspectRegistration.twin_aspect_id == twin_aspect_id
-        ).where(
-            TwinAspectRegistration.enablement_service_stack_id == enablement_service_stack_id
-        )
-        return self._session.scalars(stmt).first()
+        return self._session.scalars(self.GET_BY_TWIN_ASPECT_ID_ENABLEMENT_SERVICE_STACK_ID_STMT, {
+            "twin_aspect_id": twin_aspect_id, "enablement_service_stack_id": enablement_service_stack_id}).first()
+
+    # The status bound is a literal, so that PostgreSQL uses the partial index idx_twin_aspect_registration_pending in generic plans as well
+    FIND_PENDING_STMT = select(TwinAspectRegistration).where(
+        TwinAspectRegistration.enablement_service_stack_id == bindparam("enablement_service_stack_id"),
+        TwinAspectRegistration.status < literal_column(str(TwinAspectRegistrationStatus.DTR_REGISTERED.value))
+    ).order_by(TwinAspectRegistration.modified_date).limit(bindparam("limit", type_=Integer))
+
+    def find_pending(self, enablement_service_stack_id: int, limit: int = 100) -> List[TwinAspectRegistration]:
+        """Retrieve the oldest registrations of the enablement service stack not yet registered in the DTR (e.g. to resume them)."""
+        return list(self._session.scalars(self.FIND_PENDING_STMT, {
+            "enablement_service_stack_id": enablement_service_stack_id, "limit": limit}))
 
     def create_new(
         self,
@@ -389,12 +1179,13 @@ class TwinAspectRegistrationRepository(BaseRepository[TwinAspectRegistration]):
         return twin_aspect_registration
 
 class TwinExchangeRepository(BaseRepository[TwinExchange]):
+    GET_BY_TWIN_ID_DATA_EXCHANGE_AGREEMENT_ID_STMT = select(TwinExchange).where(
+        TwinExchange.twin_id == bindparam("twin_id"),
+        TwinExchange.data_exchange_agreement_id == bindparam("data_exchange_agreement_id"))
+
     def get_by_twin_id_data_exchange_agreement_id(self, twin_id: int, data_exchange_agreement_id: int) -> Optional[Twin]:
-        stmt = select(TwinExchange).where(
-            TwinExchange.twin_id == twin_id).where(
-            TwinExchange.data_exchange_agreement_id == data_exchange_agreement_id
-            )
-        return self._session.scalars(stmt).first()
+        return self._session.scalars(self.GET_BY_TWIN_ID_DATA_EXCHANGE_AGREEMENT_ID_STMT, {
+            "twin_id": twin_id, "data_exchange_agreement_id": data_exchange_agreement_id}).first()
     
     def create_new(self, twin_id: int, data_exchange_agreement_id: int) -> TwinExchange:
         twin_exchange = TwinExchange(
@@ -418,11 +1209,13 @@ class TwinExchangeRepository(BaseRepository[TwinExchange]):
         return self._session.scalars(stmt).first()  
 
 class TwinRegistrationRepository(BaseRepository[TwinRegistration]):
+    GET_BY_TWIN_ID_ENABLEMENT_SERVICE_STACK_ID_STMT = select(TwinRegistration).where(
+        TwinRegistration.twin_id == bindparam("twin_id"),
+        TwinRegistration.enablement_service_stack_id == bindparam("enablement_service_stack_id"))
+
     def get_by_twin_id_enablement_service_stack_id(self, twin_id: int, enablement_service_stack_id: int) -> Optional[TwinRegistration]:
-        stmt = select(TwinRegistration).where(
-            TwinRegistration.twin_id == twin_id).where(
-            TwinRegistration.enablement_service_stack_id == enablement_service_stack_id)
-        return self._session.scalars(stmt).first()
+        return self._session.scalars(self.GET_BY_TWIN_ID_ENABLEMENT_SERVICE_STACK_ID_STMT, {
+            "twin_id": twin_id, "enablement_service_stack_id": enablement_service_stack_id}).first()
     
     def create_new(self, twin_id: int, enablement_service_stack_id: int, dtr_registered: bool = False) -> TwinRegistration:
         twin_registration = TwinRegistration(
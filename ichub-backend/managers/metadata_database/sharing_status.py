@@ -0,0 +1,133 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+"""
+Maintenance of the sharing status stored with every catalog part
+(0: draft, 1: pending, 2: registered, 3: shared).
+
+The status is derived from the twin registrations and twin exchanges of the twin of the catalog part.
+Instead of computing it for every listing, it is recomputed in the database whenever one of its sources
+changes: by the ORM flushes of a session and by the Core writes of the repositories (see `refresh_written`).
+Listing and filtering catalog parts by status thereby becomes a plain (indexed) column access.
+"""
+
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Sequence, Set
+
+from sqlalchemy import case, event, func, inspect, literal, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from managers.metadata_database.change_feed import record_changes
+from models.metadata_database.models import CatalogPart, TwinExchange, TwinRegistration
+
+STATUS_SOURCE_MODELS = frozenset({CatalogPart, TwinExchange, TwinRegistration})
+
+# Number of catalog parts / twins whose status is recomputed by one statement
+REFRESH_BATCH_SIZE = 1000
+
+# Whether the twin of the enclosing registration is exchanged with any business partner
+_TWIN_EXCHANGED = select(literal(1)).where(TwinExchange.twin_id == TwinRegistration.twin_id).limit(1).scalar_subquery()
+
+# The status by the "best" registration of the twin of the catalog_part row of the enclosing statement, NULL without any.
+# Correlated lookups of one row (LIMIT 1) on the indexes idx_twin_registration_twin_id_dtr_registered and
+# idx_twin_exchange_twin_id_data_exchange_agreement_id: unlike EXISTS, PostgreSQL can not plan them as hashed subplans
+# reading the whole tables, so the cost is proportional to the number of catalog parts evaluated.
+_REGISTRATION_STATUS = select(case(
+    # 1: twin exists, but not yet DTR-registered (pending)
+    (TwinRegistration.dtr_registered.is_(False), 1),
+    # 3: DTR-registered AND appears in TwinExchange (shared)
+    (_TWIN_EXCHANGED.is_not(None), 3),
+    # 2: DTR-registered but not yet in any TwinExchange row (registered)
+    else_=2
+)).where(TwinRegistration.twin_id == CatalogPart.twin_id).order_by(TwinRegistration.dtr_registered.desc()).limit(1).scalar_subquery()
+
+# The status of a catalog part, evaluated for the catalog_part row of the enclosing statement
+# (0: no twin at all or no registration of it (draft))
+CATALOG_PART_STATUS = case(
+    (CatalogPart.twin_id.is_(None), 0),
+    else_=func.coalesce(_REGISTRATION_STATUS, 0)
+)
+
+def refresh_catalog_part_status(session: Session, twin_ids: Optional[Iterable[int]] = None,
+        catalog_part_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recompute the stored status of the catalog parts with the given twins or IDs within the transaction
+    of the session (of all catalog parts if neither is given, e.g. to initialize an existing database).
+    Catalog parts loaded into the session get the new status as well. Returns the number of changed catalog parts.
+    """
+    if twin_ids is None and catalog_part_ids is None:
+        return _refresh(session, None)
+
+    twin_ids, catalog_part_ids = list(set(twin_ids or ())), list(set(catalog_part_ids or ()))
+    changed = 0
+    for start in range(0, len(twin_ids), REFRESH_BATCH_SIZE):
+        changed += _refresh(session, CatalogPart.twin_id.in_(twin_ids[start:start + REFRESH_BATCH_SIZE]))
+    for start in range(0, len(catalog_part_ids), REFRESH_BATCH_SIZE):
+        changed += _refresh(session, CatalogPart.id.in_(catalog_part_ids[start:start + REFRESH_BATCH_SIZE]))
+    return changed
+
+def _refresh(session: Session, condition) -> int:
+    # Only the rows whose status actually changes are written
+    stmt = update(CatalogPart.__table__).where(CatalogPart.status != CATALOG_PART_STATUS).values(status=CATALOG_PART_STATUS)
+    if condition is not None:
+        stmt = stmt.where(condition)
+    connection = session.connection()
+    if not connection.dialect.update_returning:
+        changed = connection.execute(stmt).rowcount
+        if changed:
+            record_changes(session, CatalogPart)
+        return changed
+
+    rows = connection.execute(stmt.returning(CatalogPart.id, CatalogPart.status)).all()
+    if rows:
+        record_changes(session, CatalogPart, [catalog_part_id for catalog_part_id, _ in rows])
+    for catalog_part_id, status in rows:
+        catalog_part = session.identity_map.get(identity_key(CatalogPart, catalog_part_id))
+        if catalog_part is not None:
+            set_committed_value(catalog_part, "status", status)
+    return len(rows)
+
+def refresh_written(session: Session, model_type: type, rows: Sequence[Dict[str, Any]]) -> None:
+    """Refresh the status of the catalog parts affected by rows written with a Core statement (bypassing the ORM flush)."""
+    if model_type in STATUS_SOURCE_MODELS:
+        twin_ids = {row["twin_id"] for row in rows if row.get("twin_id") is not None}
+        if twin_ids:
+            refresh_catalog_part_status(session, twin_ids=twin_ids)
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed(session: Session, flush_context) -> None:
+    twin_ids: Set[int] = set()
+    catalog_part_ids: Set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, TwinExchange):
+            twin_ids.add(obj.twin_id)
+        elif isinstance(obj, TwinRegistration):
+            if obj in session.new or obj in session.deleted or inspect(obj).attrs.dtr_registered.history.has_changes():
+                twin_ids.add(obj.twin_id)
+        elif isinstance(obj, CatalogPart) and obj not in session.deleted:
+            if (obj in session.new and obj.twin_id is not None) or inspect(obj).attrs.twin_id.history.has_changes():
+                catalog_part_ids.add(obj.id)
+    if twin_ids or catalog_part_ids:
+        refresh_catalog_part_status(session, twin_ids=twin_ids, catalog_part_ids=catalog_part_ids)
@@ -0,0 +1,73 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+"""
+Command line entry point applying the pending versioned migrations to the PostgreSQL metadata database
+(e.g. before deploying with `database.migrations.autoApply` disabled), or listing their state.
+
+Example:
+    python migrate.py [--status] [--target 2]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+## Import paths
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.dont_write_bytecode = True
+
+from managers.config.log_manager import LoggingManager
+from managers.config.config_manager import ConfigManager
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Apply the pending migrations of the metadata database schema.")
+    parser.add_argument("--status", action="store_true", help="Only list the migrations and whether they are applied.")
+    parser.add_argument("--target", type=int, help="Apply the migrations up to this version only.")
+    args = parser.parse_args()
+
+    LoggingManager.init_logging()
+    ConfigManager.load_config()
+
+    # Imported after loading the configuration, which is read when the database is initialized
+    from database import engine
+    from managers.metadata_database.migrations import applied_migrations, apply_migrations, load_migrations
+
+    if engine.dialect.name != "postgresql":
+        print(f"Migrations only apply to PostgreSQL, the {engine.dialect.name} database is created from the models.", file=sys.stderr)
+        return 1
+
+    if args.status:
+        with engine.connect() as connection:
+            applied = applied_migrations(connection)
+        for migration in load_migrations():
+            state = "pending" if migration.version not in applied else "applied" if applied[migration.version] == migration.checksum else "applied (script changed since)"
+            print(f"{migration.version:>4}  {migration.description:<40} {state}")
+        return 0
+
+    versions = apply_migrations(target_version=args.target)
+    print(f"Applied the migrations {', '.join(map(str, versions))}." if versions else "The schema is up to date.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
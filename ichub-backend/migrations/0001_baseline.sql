@@ -0,0 +1,2 @@
+-- Baseline: the schema of docs/database/Metadata-DDL-public.sql before versioned migrations were introduced.
+-- Nothing is applied, the version is recorded for the databases created from it.
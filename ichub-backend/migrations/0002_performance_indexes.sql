@@ -0,0 +1,16 @@
+-- Indexes of the hot lookups of the sharing status, share and twin registration queries.
+
+-- Sharing status of a catalog part: registrations of its twin by DTR registration state, answered from the index alone.
+-- Supersedes the index on the (never selective) boolean alone.
+CREATE INDEX IF NOT EXISTS idx_twin_registration_twin_id_dtr_registered ON public.twin_registration USING btree (twin_id, dtr_registered);
+DROP INDEX IF EXISTS public.idx_twin_registration_dtr_registered;
+
+-- Sharing status and shares of a twin: its exchanges, answered from the index alone.
+-- Supersedes the index on the twin alone (the primary key leads with the data exchange agreement).
+CREATE INDEX IF NOT EXISTS idx_twin_exchange_twin_id_data_exchange_agreement_id ON public.twin_exchange USING btree (twin_id, data_exchange_agreement_id);
+DROP INDEX IF EXISTS public.idx_twin_exchange_twin_id;
+
+-- Resuming the registrations of twin aspects not yet registered in the DTR (status < 3: DTR_REGISTERED), oldest first.
+-- Only the few pending registrations are indexed; supersedes the index on the status alone.
+CREATE INDEX IF NOT EXISTS idx_twin_aspect_registration_pending ON public.twin_aspect_registration USING btree (enablement_service_stack_id, modified_date) WHERE (status < 3);
+DROP INDEX IF EXISTS public.idx_twin_aspect_registration_status;
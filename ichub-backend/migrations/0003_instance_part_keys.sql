@@ -0,0 +1,178 @@
+-- Unique natural keys and twins of the instance level parts across all monthly partitions, and partitions
+-- which can be detached concurrently (no default partition). Requires PostgreSQL 14 or later.
+--
+-- Fails if the partitions already contain duplicate parts (same partner catalog part and part instance ID),
+-- which the constraints of the partitions could not prevent: these have to be removed before.
+
+-- Serialized parts: the rows of the default partition are moved to monthly partitions, also created for the
+-- current and the next month (the backend maintains the following ones), and the default partition is dropped
+DO $$
+DECLARE
+    month date;
+    name text;
+BEGIN
+    IF to_regclass('public.serialized_part_default') IS NULL THEN
+        RETURN;
+    END IF;
+    FOR month IN
+        SELECT DISTINCT date_trunc('month', created_date)::date FROM public.serialized_part_default
+        UNION SELECT date_trunc('month', now() AT TIME ZONE 'utc')::date
+        UNION SELECT (date_trunc('month', now() AT TIME ZONE 'utc') + interval '1 month')::date
+    LOOP
+        name := 'serialized_part_' || to_char(month, 'YYYY_MM');
+        CONTINUE WHEN to_regclass('public.' || name) IS NOT NULL;
+        EXECUTE format('CREATE TABLE public.%I (LIKE public.serialized_part INCLUDING DEFAULTS)', name);
+        EXECUTE format('WITH moved AS (DELETE FROM public.serialized_part_default WHERE created_date >= %L AND created_date < %L RETURNING *) '
+                       'INSERT INTO public.%I SELECT * FROM moved', month, (month + interval '1 month')::date, name);
+        EXECUTE format('ALTER TABLE public.serialized_part ATTACH PARTITION public.%I FOR VALUES FROM (%L) TO (%L)',
+                       name, month, (month + interval '1 month')::date);
+    END LOOP;
+    ALTER TABLE public.serialized_part DETACH PARTITION public.serialized_part_default;
+    DROP TABLE public.serialized_part_default;
+END
+$$;
+
+ALTER TABLE public.serialized_part DROP CONSTRAINT IF EXISTS uk_serialized_part_partner_catalog_part_id_part_instance_id;
+ALTER TABLE public.serialized_part DROP CONSTRAINT IF EXISTS uk_serialized_part_twin_id;
+CREATE INDEX IF NOT EXISTS idx_serialized_part_twin_id ON public.serialized_part USING btree (twin_id);
+
+CREATE TABLE public.serialized_part_key (
+    partner_catalog_part_id integer NOT NULL,
+    part_instance_id character varying NOT NULL,
+    serialized_part_id integer,
+    twin_id integer,
+    CONSTRAINT pk_serialized_part_key PRIMARY KEY (partner_catalog_part_id, part_instance_id),
+    CONSTRAINT uk_serialized_part_key_serialized_part_id UNIQUE (serialized_part_id),
+    CONSTRAINT uk_serialized_part_key_twin_id UNIQUE (twin_id)
+);
+
+INSERT INTO public.serialized_part_key (partner_catalog_part_id, part_instance_id, serialized_part_id, twin_id)
+    SELECT partner_catalog_part_id, part_instance_id, id, twin_id FROM public.serialized_part;
+
+CREATE FUNCTION public.maintain_serialized_part_key() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM public.serialized_part_key
+            WHERE partner_catalog_part_id = OLD.partner_catalog_part_id AND part_instance_id = OLD.part_instance_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO public.serialized_part_key AS k (partner_catalog_part_id, part_instance_id, serialized_part_id, twin_id)
+            VALUES (NEW.partner_catalog_part_id, NEW.part_instance_id, NEW.id, NEW.twin_id)
+            ON CONFLICT (partner_catalog_part_id, part_instance_id) DO UPDATE
+            SET serialized_part_id = EXCLUDED.serialized_part_id, twin_id = EXCLUDED.twin_id
+            WHERE k.serialized_part_id IS NULL;
+        IF NOT FOUND THEN
+            RAISE unique_violation USING
+                MESSAGE = 'duplicate key value violates unique constraint "pk_serialized_part_key"',
+                DETAIL = format('Key (partner_catalog_part_id, part_instance_id)=(%s, %s) already exists.', NEW.partner_catalog_part_id, NEW.part_instance_id),
+                TABLE = 'serialized_part_key',
+                CONSTRAINT = 'pk_serialized_part_key';
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER trg_serialized_part_key AFTER INSERT OR DELETE OR UPDATE OF partner_catalog_part_id, part_instance_id, twin_id ON public.serialized_part
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_serialized_part_key();
+
+-- JIS parts: partitioned by their JIS call date, which becomes mandatory (the current time if not given) so that
+-- they have a primary key again and no default partition. The table is recreated; the existing parts keep their
+-- call date, those without one get the creation date of their twin (the current time if they have no twin).
+CREATE TEMPORARY TABLE jis_part_rows ON COMMIT DROP AS
+    SELECT j.id, j.partner_catalog_part_id, j.jis_number, j.parent_order_number,
+        COALESCE(j.jis_call_date, t.created_date, now() AT TIME ZONE 'utc') AS jis_call_date, j.twin_id
+    FROM public.jis_part j LEFT JOIN public.twin t ON t.id = j.twin_id;
+
+DROP TABLE public.jis_part;
+
+CREATE TABLE public.jis_part (
+    id integer NOT NULL,
+    partner_catalog_part_id integer NOT NULL,
+    jis_number character varying NOT NULL,
+    parent_order_number character varying,
+    jis_call_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    twin_id integer,
+    CONSTRAINT pk_jis_part PRIMARY KEY (id, jis_call_date),
+    CONSTRAINT fk_jis_part_partner_catalog_part_id FOREIGN KEY (partner_catalog_part_id) REFERENCES public.partner_catalog_part(id) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    CONSTRAINT fk_jis_part_twin_id FOREIGN KEY (twin_id) REFERENCES public.twin(id) ON UPDATE RESTRICT ON DELETE RESTRICT
+) PARTITION BY RANGE (jis_call_date);
+
+ALTER TABLE public.jis_part ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.jis_part_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
+CREATE INDEX idx_jis_part_jis_number ON public.jis_part USING btree (jis_number) WITH (deduplicate_items='true');
+CREATE INDEX idx_jis_part_parent_order_number ON public.jis_part USING btree (parent_order_number) WITH (deduplicate_items='true');
+CREATE INDEX idx_jis_part_jis_call_date ON public.jis_part USING btree (jis_call_date);
+CREATE INDEX idx_jis_part_partner_catalog_part_id ON public.jis_part USING btree (partner_catalog_part_id);
+CREATE INDEX idx_jis_part_twin_id ON public.jis_part USING btree (twin_id);
+
+DO $$
+DECLARE
+    month date;
+    name text;
+BEGIN
+    FOR month IN
+        SELECT DISTINCT date_trunc('month', jis_call_date)::date FROM jis_part_rows
+        UNION SELECT date_trunc('month', now() AT TIME ZONE 'utc')::date
+        UNION SELECT (date_trunc('month', now() AT TIME ZONE 'utc') + interval '1 month')::date
+    LOOP
+        name := 'jis_part_' || to_char(month, 'YYYY_MM');
+        EXECUTE format('CREATE TABLE public.%I (LIKE public.jis_part INCLUDING DEFAULTS)', name);
+        EXECUTE format('ALTER TABLE public.jis_part ATTACH PARTITION public.%I FOR VALUES FROM (%L) TO (%L)',
+                       name, month, (month + interval '1 month')::date);
+    END LOOP;
+END
+$$;
+
+CREATE TABLE public.jis_part_key (
+    partner_catalog_part_id integer NOT NULL,
+    jis_number character varying NOT NULL,
+    jis_part_id integer,
+    twin_id integer,
+    CONSTRAINT pk_jis_part_key PRIMARY KEY (partner_catalog_part_id, jis_number),
+    CONSTRAINT uk_jis_part_key_jis_part_id UNIQUE (jis_part_id),
+    CONSTRAINT uk_jis_part_key_twin_id UNIQUE (twin_id)
+);
+
+CREATE FUNCTION public.maintain_jis_part_key() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM public.jis_part_key
+            WHERE partner_catalog_part_id = OLD.partner_catalog_part_id AND jis_number = OLD.jis_number;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO public.jis_part_key AS k (partner_catalog_part_id, jis_number, jis_part_id, twin_id)
+            VALUES (NEW.partner_catalog_part_id, NEW.jis_number, NEW.id, NEW.twin_id)
+            ON CONFLICT (partner_catalog_part_id, jis_number) DO UPDATE
+            SET jis_part_id = EXCLUDED.jis_part_id, twin_id = EXCLUDED.twin_id
+            WHERE k.jis_part_id IS NULL;
+        IF NOT FOUND THEN
+            RAISE unique_violation USING
+                MESSAGE = 'duplicate key value violates unique constraint "pk_jis_part_key"',
+                DETAIL = format('Key (partner_catalog_part_id, jis_number)=(%s, %s) already exists.', NEW.partner_catalog_part_id, NEW.jis_number),
+                TABLE = 'jis_part_key',
+                CONSTRAINT = 'pk_jis_part_key';
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER trg_jis_part_key AFTER INSERT OR DELETE OR UPDATE OF partner_catalog_part_id, jis_number, twin_id ON public.jis_part
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_jis_part_key();
+
+INSERT INTO public.jis_part (id, partner_catalog_part_id, jis_number, parent_order_number, jis_call_date, twin_id) OVERRIDING SYSTEM VALUE
+    SELECT id, partner_catalog_part_id, jis_number, parent_order_number, jis_call_date, twin_id FROM jis_part_rows;
+
+SELECT setval('public.jis_part_id_seq', max(id)) FROM public.jis_part HAVING max(id) IS NOT NULL;
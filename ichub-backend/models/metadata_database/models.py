@@ -34,7 +34,8 @@ from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field as PydField
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import case, select, exists, Column, JSON, UniqueConstraint, SmallInteger
+from sqlalchemy import case, select, exists, Column, Computed, Float, JSON, UniqueConstraint, SmallInteger, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import aliased
 
@@ -53,6 +54,24 @@ class Material(BaseModel):
     name: str = PydField(description="Name of the material")
     share: int = PydField(description="Share of the material in percent. 0-100")
 
+# JSON documents are stored as JSONB on PostgreSQL, which can be indexed (GIN) and queried server-side
+JSON_DOCUMENT = JSON().with_variant(JSONB(), "postgresql")
+
+# Factors converting measurements to millimetres and kilograms respectively
+LENGTH_TO_MM: Dict[Unit, float] = {Unit.mm: 1, Unit.cm: 10, Unit.m: 1000}
+WEIGHT_TO_KG: Dict[Unit, float] = {Unit.g: 0.001, Unit.kg: 1}
+
+def _normalized_measurement(column: Column, factors: Dict[Unit, float]):
+    """Expression converting the value of a measurement column by the factor of its unit (NULL for any other unit)."""
+    value = column["value"].as_float()
+    return case(*((column["unit"].as_string() == unit.value, value * factor if factor != 1 else value) for unit, factor in factors.items()))
+
+# The measurement columns of the catalog part, referenced by the generated columns with their normalized values
+_CATALOG_PART_WIDTH = Column("width", JSON_DOCUMENT)
+_CATALOG_PART_HEIGHT = Column("height", JSON_DOCUMENT)
+_CATALOG_PART_LENGTH = Column("length", JSON_DOCUMENT)
+_CATALOG_PART_WEIGHT = Column("weight", JSON_DOCUMENT)
+
 class LegalEntity(SQLModel, table=True):
     """
     Holds information about the company offering the parts. 
@@ -175,6 +194,10 @@ class CatalogPart(SQLModel, table=True):
         twin_id (Optional[int]): The ID of the associated twin. 
         category (Optional[str]): The category of the catalog part.
         bpns (Optional[str]): The optional site information (BPNS) of the catalog part. It is a link to a 'site information' of a business partner (s at the end).
+        status (int): The sharing status of the catalog part (0: draft, 1: pending, 2: registered, 3: shared).
+            It is derived from the twin registrations and twin exchanges of the twin and maintained by the system.
+        width_mm, height_mm, length_mm (Optional[float]): The width, height and length in millimetres, generated by the database.
+        weight_kg (Optional[float]): The weight in kilograms, generated by the database.
 
     Relationships:
         legal_entity (LegalEntity): The legal entity that offers this catalog part.
@@ -193,11 +216,20 @@ class CatalogPart(SQLModel, table=True):
     description: Optional[str] = Field(default=None, description="The description of the catalog part.")
     category: Optional[str] = Field(default=None, description="The category of the catalog part.")
     bpns: Optional[str] = Field(default=None, description="The optional site information (BPNS) of the catalog part.")
-    materials: List[Material] = Field(default_factory=list, sa_column=Column(JSON), description="List of materials, e.g. [{'name':'aluminum','share':'20'}]")
-    width: Optional[Measurement] = Field(default=None, sa_column=Column(JSON), description="Width of the part")
-    height: Optional[Measurement] = Field(default=None, sa_column=Column(JSON), description="Height of the part")
-    length: Optional[Measurement] = Field(default=None, sa_column=Column(JSON), description="Length of the part")
-    weight: Optional[Measurement] = Field(default=None, sa_column=Column(JSON), description="Weight of the part")
+    materials: List[Material] = Field(default_factory=list, sa_column=Column(JSON_DOCUMENT), description="List of materials, e.g. [{'name':'aluminum','share':'20'}]")
+    width: Optional[Measurement] = Field(default=None, sa_column=_CATALOG_PART_WIDTH, description="Width of the part")
+    height: Optional[Measurement] = Field(default=None, sa_column=_CATALOG_PART_HEIGHT, description="Height of the part")
+    length: Optional[Measurement] = Field(default=None, sa_column=_CATALOG_PART_LENGTH, description="Length of the part")
+    weight: Optional[Measurement] = Field(default=None, sa_column=_CATALOG_PART_WEIGHT, description="Weight of the part")
+    width_mm: Optional[float] = Field(default=None, description="Width of the part in millimetres (generated).",
+        sa_column=Column(Float, Computed(_normalized_measurement(_CATALOG_PART_WIDTH, LENGTH_TO_MM), persisted=True), index=True))
+    height_mm: Optional[float] = Field(default=None, description="Height of the part in millimetres (generated).",
+        sa_column=Column(Float, Computed(_normalized_measurement(_CATALOG_PART_HEIGHT, LENGTH_TO_MM), persisted=True), index=True))
+    length_mm: Optional[float] = Field(default=None, description="Length of the part in millimetres (generated).",
+        sa_column=Column(Float, Computed(_normalized_measurement(_CATALOG_PART_LENGTH, LENGTH_TO_MM), persisted=True), index=True))
+    weight_kg: Optional[float] = Field(default=None, description="Weight of the part in kilograms (generated).",
+        sa_column=Column(Float, Computed(_normalized_measurement(_CATALOG_PART_WEIGHT, WEIGHT_TO_KG), persisted=True), index=True))
+    status: int = Field(default=0, sa_type=SmallInteger, description="The sharing status of the catalog part (0: draft, 1: pending, 2: registered, 3: shared).")
 
     # Relationships
     legal_entity: LegalEntity = Relationship(back_populates="catalog_parts")
@@ -208,6 +240,10 @@ class CatalogPart(SQLModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("legal_entity_id", "manufacturer_part_id", name="uk_catalog_part_legal_entity_id_manufacturer_part_id"),
+        # Listing catalog parts by status in keyset order
+        Index("idx_catalog_part_status_id", "status", "id"),
+        # Containment (@>) of materials
+        Index("idx_catalog_part_materials", "materials", postgresql_using="gin", postgresql_ops={"materials": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
     )
 
     __tablename__ = "catalog_part"
@@ -287,19 +323,21 @@ class SerializedPart(SQLModel, table=True):
         part_instance_id (str): The part instance ID. 
         van (Optional[str]): The optional VAN (Vehicle Assembly Number). This is the vehicle number given by the Industry Core KIT.
         twin_id (int): The ID of the associated twin. 
+        created_date (datetime): The creation date of the serialized part.
 
     Relationships:
         partner_catalog_part (PartnerCatalogPart): The partner catalog part this serial part is related to.
         twin (Twin): The digital twin associated with this serial part.
 
     Table Name:
-        serialized_part
+        serialized_part (in PostgreSQL range partitioned by month of created_date, see managers.metadata_database.partitioning)
     """
     id: Optional[int] = Field(default=None, primary_key=True)
     partner_catalog_part_id: int = Field(index=True, foreign_key="partner_catalog_part.id", description="The ID of the associated partner catalog part.")
     part_instance_id: str = Field(index=True, description="The part instance ID.")
     van: Optional[str] = Field(index=True, default=None, description="The optional VAN (Vehicle Assembly Number).")
     twin_id: Optional[int] = Field(unique=True, foreign_key="twin.id", description="The ID of the associated twin.")
+    created_date: datetime = Field(default_factory=datetime.utcnow, description="The creation date of the serialized part.")
 
     # Relationships
     partner_catalog_part: PartnerCatalogPart = Relationship(back_populates="serialized_parts")
@@ -324,7 +362,7 @@ class JISPart(SQLModel, table=True):
         partner_catalog_part_id (int): The ID of the associated partner catalog part. 
         jis_number (str): The JIS number. 
         parent_order_number (Optional[str]): The parent order number. 
-        jis_call_date (Optional[datetime]): The JIS call date. 
+        jis_call_date (datetime): The JIS call date (the current time if not given).
         twin_id (int): The ID of the associated twin. 
 
     Relationships:
@@ -332,13 +370,13 @@ class JISPart(SQLModel, table=True):
         twin (Twin): The digital twin associated with this JIS part.
 
     Table Name:
-        jis_part
+        jis_part (in PostgreSQL range partitioned by month of jis_call_date, see managers.metadata_database.partitioning)
     """
     id: Optional[int] = Field(default=None, primary_key=True)
     partner_catalog_part_id: int = Field(index=True, foreign_key="partner_catalog_part.id", description="The ID of the associated partner catalog part.")
     jis_number: str = Field(index=True, description="The JIS number.")
     parent_order_number: Optional[str] = Field(index=True, default=None, description="The parent order number.")
-    jis_call_date: Optional[datetime] = Field(index=True, default=None, description="The JIS call date.")
+    jis_call_date: datetime = Field(index=True, default_factory=datetime.utcnow, description="The JIS call date (the current time if not given).")
     twin_id: Optional[int] = Field(unique=True, foreign_key="twin.id", description="The ID of the associated twin.")
 
     # Relationships
@@ -608,7 +646,7 @@ class TwinAspectRegistration(SQLModel, table=True):
     """
     twin_aspect_id: int = Field(foreign_key="twin_aspect.id", primary_key=True, description="The ID of the associated twin aspect.")
     enablement_service_stack_id: int = Field(foreign_key="enablement_service_stack.id", primary_key=True, description="The ID of the associated enablement service stack.")
-    status: int = Field(index=True, default=0, description="The status of the registration.", sa_type=SmallInteger) # TODO: Use Enum for status
+    status: int = Field(default=0, description="The status of the registration.", sa_type=SmallInteger) # TODO: Use Enum for status
     registration_mode: int = Field(index=True, default=0, description="The registration mode.", sa_type=SmallInteger) # TODO: Use Enum for registration mode
     created_date: datetime = Field(index=True, default_factory=datetime.utcnow, description="The creation date of the registration.")
     modified_date: datetime = Field(index=True, default_factory=datetime.utcnow, description="The last modification date of the registration.")
@@ -617,6 +655,12 @@ class TwinAspectRegistration(SQLModel, table=True):
     twin_aspect: TwinAspect = Relationship(back_populates="twin_aspect_registrations")
     enablement_service_stack: EnablementServiceStack = Relationship(back_populates="twin_aspect_registrations")
 
+    __table_args__ = (
+        # Resuming the registrations not yet registered in the DTR (status < 3: DTR_REGISTERED), oldest first
+        Index("idx_twin_aspect_registration_pending", "enablement_service_stack_id", "modified_date",
+            postgresql_where=text("status < 3"), sqlite_where=text("status < 3")),
+    )
+
     __tablename__ = "twin_aspect_registration"
 
 
@@ -648,6 +692,11 @@ class TwinExchange(SQLModel, table=True):
     twin: Twin = Relationship(back_populates="twin_exchanges")
     data_exchange_agreement: DataExchangeAgreement = Relationship(back_populates="twin_exchanges")
 
+    __table_args__ = (
+        # Exchanges of a twin (sharing status, shares), the primary key leads with the data exchange agreement in PostgreSQL
+        Index("idx_twin_exchange_twin_id_data_exchange_agreement_id", "twin_id", "data_exchange_agreement_id"),
+    )
+
     __tablename__ = "twin_exchange"
 
 
@@ -672,10 +721,15 @@ class TwinRegistration(SQLModel, table=True):
     """
     twin_id: int = Field(foreign_key="twin.id", primary_key=True, description="The ID of the associated twin.")
     enablement_service_stack_id: int = Field(foreign_key="enablement_service_stack.id", primary_key=True, description="The ID of the associated enablement service stack.")
-    dtr_registered: bool = Field(index=True, default=False, description="Whether the twin is registered in the DTR.")
+    dtr_registered: bool = Field(default=False, description="Whether the twin is registered in the DTR.")
 
     # Relationships
     twin: Twin = Relationship(back_populates="twin_registrations")
     enablement_service_stack: EnablementServiceStack = Relationship(back_populates="twin_registrations")
 
+    __table_args__ = (
+        # Registrations of a twin by DTR registration state (sharing status)
+        Index("idx_twin_registration_twin_id_dtr_registered", "twin_id", "dtr_registered"),
+    )
+
     __tablename__ = "twin_registration"
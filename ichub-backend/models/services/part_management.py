@@ -78,6 +78,19 @@ class SimpleCatalogPartReadWithStatus(SimpleCatalogRead):
 class CatalogPartCreate(CatalogPartRead):
     pass
 
+class CatalogPartFilter(BaseModel):
+    """Server-side filters of the catalog part listing on the materials and dimensions of the parts."""
+    material: Optional[str] = Field(description="Only parts containing this material (exact name).", default=None)
+    min_material_share: Optional[int] = Field(alias="minMaterialShare", description="Only parts containing the material with at least this share in percent (requires a material).", default=None, ge=0, le=100)
+    min_width: Optional[float] = Field(alias="minWidth", description="Minimum width of the parts in millimetres.", default=None, ge=0)
+    max_width: Optional[float] = Field(alias="maxWidth", description="Maximum width of the parts in millimetres.", default=None, ge=0)
+    min_height: Optional[float] = Field(alias="minHeight", description="Minimum height of the parts in millimetres.", default=None, ge=0)
+    max_height: Optional[float] = Field(alias="maxHeight", description="Maximum height of the parts in millimetres.", default=None, ge=0)
+    min_length: Optional[float] = Field(alias="minLength", description="Minimum length of the parts in millimetres.", default=None, ge=0)
+    max_length: Optional[float] = Field(alias="maxLength", description="Maximum length of the parts in millimetres.", default=None, ge=0)
+    min_weight: Optional[float] = Field(alias="minWeight", description="Minimum weight of the parts in kilograms.", default=None, ge=0)
+    max_weight: Optional[float] = Field(alias="maxWeight", description="Maximum weight of the parts in kilograms.", default=None, ge=0)
+
 class CatalogPartDelete(CatalogPartBase):
     pass
 
@@ -146,4 +159,25 @@ class JISPartQuery(CatalogPartQuery):
     jis_number: Optional[str] = Field(alias="jisNumber", description="The JIS number of the JIS part.", default=None)
     parent_order_number: Optional[str] = Field(alias="parentOrderNumber", description="The parent order number of the JIS part.", default=None)
     jis_call_date_min: Optional[datetime] = Field(alias="jisCallDate", description="The minimal JIS call date of the JIS part.", default=None)
-    jis_call_date_max: Optional[datetime] = Field(alias="jisCallDate", description="The maximal JIS call date of the JIS part.", default=None)
\ No newline at end of file
+    jis_call_date_max: Optional[datetime] = Field(alias="jisCallDate", description="The maximal JIS call date of the JIS part.", default=None)
+
+class InstancePartType(str, enum.Enum):
+    """The types of instance level parts which can be bulk loaded."""
+
+    SERIALIZED_PART = "serialized-part"
+    JIS_PART = "jis-part"
+    BATCH = "batch"
+
+class InstancePartLoadResult(BaseModel):
+    """The outcome of a bulk load of instance level parts."""
+
+    part_type: InstancePartType = Field(alias="partType", description="The type of the loaded parts.")
+    rows_read: int = Field(alias="rowsRead", description="The number of rows read from the extract.")
+    parts_created: int = Field(alias="partsCreated", description="The number of created parts.")
+    twins_created: int = Field(alias="twinsCreated", description="The number of twins created for the parts.")
+    rows_skipped: int = Field(alias="rowsSkipped", description="The number of rows of parts which already exist or are repeated within the extract.")
+    rows_unresolved: int = Field(alias="rowsUnresolved", description="The number of rows whose manufacturer, catalog part, business partner or partner catalog part does not exist.")
+    unresolved_lines: List[int] = Field(alias="unresolvedLines", description="The line numbers of the first unresolved rows.", default=[])
+    copy_seconds: float = Field(alias="copySeconds", description="The time taken to stream the rows into the database.")
+    merge_seconds: float = Field(alias="mergeSeconds", description="The time taken to merge the rows into the part and twin tables.")
+    rows_per_second: float = Field(alias="rowsPerSecond", description="The number of rows loaded per second.")
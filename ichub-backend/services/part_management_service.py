@@ -22,22 +22,38 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import Dict, List, Optional
-from models.services.part_management import BatchCreate, BatchRead, CatalogPartCreate, CatalogPartDelete, CatalogPartRead, SimpleCatalogPartReadWithStatus,JISPartCreate, JISPartDelete, JISPartRead, PartnerCatalogPartBase, PartnerCatalogPartCreate, PartnerCatalogPartDelete, SerializedPartCreate, SerializedPartDelete, SerializedPartRead, CatalogPartReadWithStatus
+from collections import Counter
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models.services.part_management import BatchCreate, BatchRead, CatalogPartCreate, CatalogPartDelete, CatalogPartRead, SimpleCatalogPartReadWithStatus,JISPartCreate, JISPartDelete, JISPartRead, PartnerCatalogPartBase, PartnerCatalogPartCreate, PartnerCatalogPartDelete, SerializedPartCreate, SerializedPartDelete, SerializedPartRead, CatalogPartReadWithStatus, CatalogPartFilter, InstancePartType, InstancePartLoadResult, SharingStatus
 from models.services.partner_management import BusinessPartnerRead
-from managers.metadata_database.repositories import CatalogPartRepository, BusinessPartnerRepository, LegalEntityRepository, PartnerCatalogPartRepository
-from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory
+from managers.metadata_database.repositories import CatalogPartListRecord, CatalogPartRepository, BusinessPartnerRepository, LegalEntityRepository, LoadingProfile, PartnerCatalogPartRepository, SerializedPartRecord, STREAM_BATCH_SIZE
+from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory, AsyncRepositoryManagerFactory
+from managers.metadata_database.advisory_locks import CATALOG_PART_LOCK
+from managers.metadata_database.bulk_loader import COPY_CHUNK_SIZE
+from database import instrument_queries
 from models.metadata_database.models import CatalogPart, Batch, LegalEntity, SerializedPart, JISPart, PartnerCatalogPart
+from models.services.pagination import Page
 from managers.config.log_manager import LoggingManager
+from tools.cursor_tools import clamp_page_size, decode_id_cursor, decode_ranked_cursor, split_page
 
 logger = LoggingManager.get_logger(__name__)
 
+# Number of keys listed in the error messages of the bulk operations
+MAX_REPORTED_KEYS = 10
+
+def _format_keys(keys: Iterable[Tuple[str, ...]]) -> str:
+    keys = list(keys)
+    formatted = ", ".join("/".join(map(str, key)) for key in keys[:MAX_REPORTED_KEYS])
+    return formatted + (f" and {len(keys) - MAX_REPORTED_KEYS} more" if len(keys) > MAX_REPORTED_KEYS else "")
+
+@instrument_queries
 class PartManagementService():
     """
     Service class for managing parts and their relationships in the system.
     """
 
-    def create_catalog_part(self, catalog_part_create: CatalogPartCreate) -> CatalogPartReadWithStatus:
+    def create_catalog_part(self, catalog_part_create: CatalogPartCreate, repo: Optional[RepositoryManager] = None) -> CatalogPartReadWithStatus:
         """
         Create a new catalog part in the system.
         Optionally also create attached partner catalog parts - i.e. partner specific mappings of the catalog part.
@@ -51,16 +67,12 @@ class PartManagementService():
                 raise ValueError("The share of materials can't be lower than 0%.")
             if total_share > 100:
                 raise ValueError("The total share of materials can't be higher than 100%.")
-        with RepositoryManagerFactory.create() as repos:
+        with RepositoryManagerFactory.use(repo) as repos:
             
-            # First check if the legal entity exists for the given manufacturer ID
-            db_legal_entity = repos.legal_entity_repository.get_by_bpnl(catalog_part_create.manufacturer_id)
-            if not db_legal_entity:
-                logger.warning(f"Legal Entity with manufacturer BPNL '{catalog_part_create.manufacturer_id}' not found. Creating a new one!")
-                db_legal_entity = repos.legal_entity_repository.create(
-                    LegalEntity(bpnl=catalog_part_create.manufacturer_id)
-                )
-                repos.legal_entity_repository.commit()
+            # First retrieve the legal entity for the given manufacturer ID (or create it if not existing)
+            db_legal_entity, created = repos.legal_entity_repository.get_or_create(catalog_part_create.manufacturer_id)
+            if created:
+                logger.warning(f"Legal Entity with manufacturer BPNL '{catalog_part_create.manufacturer_id}' not found. Created a new one!")
             
             if not db_legal_entity:
                 raise ValueError(f"Failed to create or retrieve the legal entity '{catalog_part_create.manufacturer_id}'")
@@ -79,7 +91,7 @@ class PartManagementService():
                     **catalog_part_create.model_dump(by_alias=False)
                 )
                 repos.catalog_part_repository.create(db_catalog_part)
-                repos.catalog_part_repository.commit()
+                repos.flush()
                 
             # Prepare the result object
             result = CatalogPartReadWithStatus(
@@ -155,71 +167,189 @@ class PartManagementService():
         # Logic to delete a catalog part
         pass
 
-    def get_simple_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> List[SimpleCatalogPartReadWithStatus]:
-        with RepositoryManagerFactory.create() as repos:
-            result = []
-            
-            db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+    def get_simple_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> Page[SimpleCatalogPartReadWithStatus]:
+        """
+        Retrieve one page of catalog parts (without details) from the system,
+        optionally only those with the given status and matching the material and dimension filters.
+        Pass the `next` cursor of the returned page to retrieve the following page.
+        """
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[CatalogPartListRecord] = repos.catalog_part_repository.find_list_records(
+                manufacturer_id, manufacturer_part_id,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1,
+                status=status, filters=filters
             )
             
-            if db_catalog_parts:
-                for db_catalog_part, status in db_catalog_parts:
-                    result.append(
-                        SimpleCatalogPartReadWithStatus(
-                            manufacturerId=db_catalog_part.legal_entity.bpnl,
-                            manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                            name=db_catalog_part.name,
-                            category=db_catalog_part.category,
-                            bpns=db_catalog_part.bpns,
-                            status=status
-                        )
-                    )
-            
-            return result
+            records, next_cursor = split_page(records, page_size, key=lambda record: record.id)
+            return Page[SimpleCatalogPartReadWithStatus](
+                items=[self._record_to_simple_catalog_part_read(record) for record in records],
+                next=next_cursor
+            )
 
-    def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> List[CatalogPartReadWithStatus]:
-        with RepositoryManagerFactory.create() as repos:
-            result = []
-            
+    async def get_simple_catalog_parts_async(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None, status: Optional[int] = None,
+            filters: Optional[CatalogPartFilter] = None) -> Page[SimpleCatalogPartReadWithStatus]:
+        """Async variant of `get_simple_catalog_parts` not blocking the event loop during the database round trips."""
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[CatalogPartListRecord] = await repos.catalog_part_repository.find_list_records(
+                manufacturer_id, manufacturer_part_id,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1,
+                status=status, filters=filters
+            )
+
+            records, next_cursor = split_page(records, page_size, key=lambda record: record.id)
+            return Page[SimpleCatalogPartReadWithStatus](
+                items=[self._record_to_simple_catalog_part_read(record) for record in records],
+                next=next_cursor
+            )
+
+    def search_catalog_parts(self, query: str, manufacturer_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[SimpleCatalogPartReadWithStatus]:
+        """
+        Retrieve one page of the catalog parts (without details) whose name, manufacturer part ID, category
+        or customer part IDs contain the query, best matches first.
+        Pass the `next` cursor of the returned page to retrieve the following page.
+        """
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[CatalogPartListRecord] = repos.catalog_part_repository.search_list_records(
+                query, manufacturer_id,
+                after=decode_ranked_cursor(cursor), limit=page_size + 1
+            )
+
+            records, next_cursor = split_page(records, page_size, key=lambda record: [record.score, record.id])
+            return Page[SimpleCatalogPartReadWithStatus](
+                items=[self._record_to_simple_catalog_part_read(record) for record in records],
+                next=next_cursor
+            )
+
+    async def search_catalog_parts_async(self, query: str, manufacturer_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[SimpleCatalogPartReadWithStatus]:
+        """Async variant of `search_catalog_parts` not blocking the event loop during the database round trips."""
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[CatalogPartListRecord] = await repos.catalog_part_repository.search_list_records(
+                query, manufacturer_id,
+                after=decode_ranked_cursor(cursor), limit=page_size + 1
+            )
+
+            records, next_cursor = split_page(records, page_size, key=lambda record: [record.score, record.id])
+            return Page[SimpleCatalogPartReadWithStatus](
+                items=[self._record_to_simple_catalog_part_read(record) for record in records],
+                next=next_cursor
+            )
+
+    def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[CatalogPartReadWithStatus]:
+        """
+        Retrieve one page of catalog parts (with details) from the system.
+        Pass the `next` cursor of the returned page to retrieve the following page.
+        """
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repos:
             db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, profile=LoadingProfile.DETAIL,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1
             )
             
-            if db_catalog_parts:
-                for db_catalog_part, status in db_catalog_parts:
-                    result.append(
-                        CatalogPartReadWithStatus(
-                            manufacturerId=db_catalog_part.legal_entity.bpnl,
-                            manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                            name=db_catalog_part.name,
-                            category=db_catalog_part.category,
-                            bpns=db_catalog_part.bpns,
-                            materials=db_catalog_part.materials,
-                            width=db_catalog_part.width,
-                            height=db_catalog_part.height,
-                            length=db_catalog_part.length,
-                            weight=db_catalog_part.weight,
-                            description=db_catalog_part.description,
-                            customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
-                                 name=partner_catalog_part.business_partner.name,
-                                 bpnl=partner_catalog_part.business_partner.bpnl
-                             ) for partner_catalog_part in db_catalog_part.partner_catalog_parts},
-                            status=status
-                        )
-                    )
-            
-            return result
+            db_catalog_parts, next_cursor = split_page(db_catalog_parts, page_size, key=lambda row: row[0].id)
+            return Page[CatalogPartReadWithStatus](
+                items=[self._to_catalog_part_read(db_catalog_part, status) for db_catalog_part, status in db_catalog_parts],
+                next=next_cursor
+            )
+
+    async def get_catalog_parts_async(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[CatalogPartReadWithStatus]:
+        """Async variant of `get_catalog_parts` not blocking the event loop during the database round trips."""
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repos:
+            db_catalog_parts: List[tuple[CatalogPart, int]] = await repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
+                manufacturer_id, manufacturer_part_id, profile=LoadingProfile.DETAIL,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1
+            )
+
+            db_catalog_parts, next_cursor = split_page(db_catalog_parts, page_size, key=lambda row: row[0].id)
+            return Page[CatalogPartReadWithStatus](
+                items=[self._to_catalog_part_read(db_catalog_part, status) for db_catalog_part, status in db_catalog_parts],
+                next=next_cursor
+            )
     
     
+    def export_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None,
+            batch_size: int = STREAM_BATCH_SIZE) -> Iterator[List[CatalogPartReadWithStatus]]:
+        """
+        Export all catalog parts (with details) of the system in batches of `batch_size`, streamed from
+        a server-side cursor. The database session stays open until the iterator is exhausted or closed.
+        """
+        with RepositoryManagerFactory.create(read_only=True) as repos:
+            for db_catalog_parts in repos.catalog_part_repository.stream_by_manufacturer_id_manufacturer_part_id(
+                    manufacturer_id, manufacturer_part_id, profile=LoadingProfile.DETAIL, batch_size=batch_size):
+                yield [self._to_catalog_part_read(db_catalog_part, status) for db_catalog_part, status in db_catalog_parts]
+
     def get_catalog_part(self, manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartReadWithStatus]:
         """
         Retrieve a catalog part from the system.
         """
 
-        part_list = self.get_catalog_parts(manufacturer_id, manufacturer_part_id)
+        part_list = self.get_catalog_parts(manufacturer_id, manufacturer_part_id, limit=1).items
+        return part_list[0] if part_list else None
+
+    async def get_catalog_part_async(self, manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartReadWithStatus]:
+        """
+        Retrieve a catalog part from the system without blocking the event loop.
+        """
+
+        part_list = (await self.get_catalog_parts_async(manufacturer_id, manufacturer_part_id, limit=1)).items
         return part_list[0] if part_list else None
 
+    @staticmethod
+    def _to_simple_catalog_part_read(db_catalog_part: CatalogPart, status: int) -> SimpleCatalogPartReadWithStatus:
+        return SimpleCatalogPartReadWithStatus(
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            status=status
+        )
+
+    @staticmethod
+    def _record_to_simple_catalog_part_read(record: CatalogPartListRecord) -> SimpleCatalogPartReadWithStatus:
+        # The values of the record are read from the database as they are stored, so they are not validated again
+        return SimpleCatalogPartReadWithStatus.model_construct(
+            manufacturer_id=record.manufacturer_id,
+            manufacturer_part_id=record.manufacturer_part_id,
+            name=record.name,
+            category=record.category,
+            bpns=record.bpns,
+            status=SharingStatus(record.status)
+        )
+
+    @staticmethod
+    def _to_catalog_part_read(db_catalog_part: CatalogPart, status: int) -> CatalogPartReadWithStatus:
+        return CatalogPartReadWithStatus(
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            materials=db_catalog_part.materials,
+            width=db_catalog_part.width,
+            height=db_catalog_part.height,
+            length=db_catalog_part.length,
+            weight=db_catalog_part.weight,
+            description=db_catalog_part.description,
+            customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
+                    name=partner_catalog_part.business_partner.name,
+                    bpnl=partner_catalog_part.business_partner.bpnl
+                ) for partner_catalog_part in db_catalog_part.partner_catalog_parts},
+            status=status
+        )
+
     def create_batch(self, batch_create: BatchCreate) -> BatchRead:
         """
         Create a new batch in the system.
@@ -251,37 +381,144 @@ class PartManagementService():
 
         pass
 
-    def create_serialized_part(self, serialized_part_create: SerializedPartCreate) -> SerializedPartRead:
-        """
-        Create a new serialized part in the system.
-        """
-        
-        # Logic to create a serialized part
-        pass
+    def create_serialized_part(self, serialized_part_create: SerializedPartCreate, repo: Optional[RepositoryManager] = None) -> SerializedPartRead:
+        """
+        Create a new serialized part in the system, with a new twin.
+        """
+        return self.create_serialized_parts([serialized_part_create], repo=repo)[0]
+
+    def create_serialized_parts(self, serialized_part_creates: List[SerializedPartCreate], repo: Optional[RepositoryManager] = None) -> List[SerializedPartRead]:
+        """
+        Create many serialized parts at once, each with a new twin. Either all parts are created or none.
+
+        The partner catalog parts (by manufacturer ID, manufacturer part ID and business partner name) are looked
+        up and the keys of the parts claimed with set-based statements, the twins and parts are written with
+        multi-row INSERT statements: the number of round trips does not depend on the number of parts.
+        """
+        keys = [(part.manufacturer_id, part.manufacturer_part_id, part.business_partner_name, part.part_instance_id) for part in serialized_part_creates]
+        duplicates = [key for key, count in Counter(keys).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Serialized parts given more than once: {_format_keys(duplicates)}")
+
+        with RepositoryManagerFactory.use(repo) as repos:
+            partner_catalog_parts = repos.partner_catalog_part_repository.resolve_by_manufacturer_id_manufacturer_part_id_business_partner_name(
+                key[:3] for key in keys)
+            unresolved = sorted({key[:3] for key in keys if key[:3] not in partner_catalog_parts})
+            if unresolved:
+                raise ValueError(f"No customer part mapping exists for the catalog parts and business partners: {_format_keys(unresolved)}. Please create it first.")
+
+            mismatched = sorted({(*key[:3], part.customer_part_id) for key, part in zip(keys, serialized_part_creates)
+                if part.customer_part_id != partner_catalog_parts[key[:3]].customer_part_id})
+            if mismatched:
+                raise ValueError(f"The customer part IDs do not match the customer part mappings: {_format_keys(mismatched)}")
+
+            # Parts created concurrently by other requests are not claimed either: the keys stay unique
+            claimed = repos.serialized_part_repository.claim_keys(
+                (partner_catalog_parts[key[:3]].id, key[3]) for key in keys)
+            if len(claimed) < len(keys):
+                raise ValueError(f"Serialized parts already exist: {_format_keys(key for key in keys if (partner_catalog_parts[key[:3]].id, key[3]) not in claimed)}")
+
+            twin_ids = repos.twin_repository.create_many(len(serialized_part_creates))
+            repos.serialized_part_repository.bulk_insert([{
+                    "partner_catalog_part_id": partner_catalog_parts[key[:3]].id,
+                    "part_instance_id": part.part_instance_id,
+                    "van": part.van,
+                    "twin_id": twin_id,
+                } for key, part, twin_id in zip(keys, serialized_part_creates, twin_ids)])
+
+            logger.info(f"Created {len(serialized_part_creates)} serialized parts with their twins.")
+            # The values were validated with the request, so they are not validated again
+            return [SerializedPartRead.model_construct(
+                    manufacturer_id=part.manufacturer_id,
+                    manufacturer_part_id=part.manufacturer_part_id,
+                    part_instance_id=part.part_instance_id,
+                    customer_part_id=part.customer_part_id,
+                    van=part.van,
+                    business_partner=BusinessPartnerRead.model_construct(
+                        name=part.business_partner_name,
+                        bpnl=partner_catalog_parts[key[:3]].business_partner_bpnl
+                    )
+                ) for key, part in zip(keys, serialized_part_creates)]
 
-    def delete_serialized_part(self, serialized_part: SerializedPartDelete) -> None:
+    def delete_serialized_part(self, serialized_part: SerializedPartDelete, repo: Optional[RepositoryManager] = None) -> None:
         """
-        Delete a serialized part from the system.
+        Delete a serialized part from the system, together with its twin.
+        Parts whose twin has been registered or shared can not be deleted.
         """
-        
-        # Logic to delete a serialized part
-        pass
+        with RepositoryManagerFactory.use(repo) as repos:
+            repos.advisory_lock(CATALOG_PART_LOCK, serialized_part.manufacturer_id, serialized_part.manufacturer_part_id)
+
+            key = (serialized_part.manufacturer_id, serialized_part.manufacturer_part_id, serialized_part.business_partner_name)
+            partner_catalog_part = repos.partner_catalog_part_repository.resolve_by_manufacturer_id_manufacturer_part_id_business_partner_name([key]).get(key)
+            db_serialized_part = repos.serialized_part_repository.get_by_partner_catalog_part_id_part_instance_id(
+                partner_catalog_part.id, serialized_part.part_instance_id) if partner_catalog_part else None
+            if not db_serialized_part:
+                raise ValueError(f"Serialized part '{serialized_part.part_instance_id}' of the catalog part '{serialized_part.manufacturer_part_id}' for the business partner '{serialized_part.business_partner_name}' does not exist.")
+
+            twin_id = db_serialized_part.twin_id
+            if twin_id is not None and repos.twin_repository.is_in_use(twin_id):
+                raise ValueError(f"The twin of the serialized part '{serialized_part.part_instance_id}' has been registered or shared, the part can not be deleted.")
 
-    def get_serialized_part(self, manufacturer_id: str, manufacturer_part_id: str, part_instance_id: str) -> SerializedPartRead:
+            repos.serialized_part_repository.delete_obj(db_serialized_part)
+            # The part references the twin, so it is removed first
+            repos.flush()
+            if twin_id is not None:
+                repos.twin_repository.delete(twin_id)
+
+    def get_serialized_part(self, manufacturer_id: str, manufacturer_part_id: str, part_instance_id: str) -> Optional[SerializedPartRead]:
         """
         Retrieve a serialized part from the system.
         """
-        
-        # Logic to retrieve a serialized part
-        pass
 
-    def get_serialized_parts(self, manufacturer_id: str = None, manufacturer_part_id: str = None, part_instance_id: str = None) -> List[SerializedPartRead]:
+        part_list = self.get_serialized_parts(manufacturer_id, manufacturer_part_id, part_instance_id, limit=1).items
+        return part_list[0] if part_list else None
+
+    def get_serialized_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, part_instance_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[SerializedPartRead]:
         """
-        Retrieves serialized parts from the system according to given parameters.
+        Retrieve one page of serialized parts from the system according to given parameters.
+        Pass the `next` cursor of the returned page to retrieve the following page.
         """
-        
-        # Logic to retrieve all serialized parts
-        pass
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[SerializedPartRecord] = repos.serialized_part_repository.find_records(
+                manufacturer_id, manufacturer_part_id, part_instance_id,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1
+            )
+
+            records, next_cursor = split_page(records, page_size, key=lambda record: record.id)
+            return Page[SerializedPartRead](
+                items=[self._record_to_serialized_part_read(record) for record in records],
+                next=next_cursor
+            )
+
+    async def get_serialized_parts_async(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, part_instance_id: Optional[str] = None,
+            limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[SerializedPartRead]:
+        """Async variant of `get_serialized_parts` not blocking the event loop during the database round trips."""
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repos:
+            records: List[SerializedPartRecord] = await repos.serialized_part_repository.find_records(
+                manufacturer_id, manufacturer_part_id, part_instance_id,
+                after_id=decode_id_cursor(cursor), limit=page_size + 1
+            )
+
+            records, next_cursor = split_page(records, page_size, key=lambda record: record.id)
+            return Page[SerializedPartRead](
+                items=[self._record_to_serialized_part_read(record) for record in records],
+                next=next_cursor
+            )
+
+    @staticmethod
+    def _record_to_serialized_part_read(record: SerializedPartRecord) -> SerializedPartRead:
+        # The values of the record are read from the database as they are stored, so they are not validated again
+        return SerializedPartRead.model_construct(
+            manufacturer_id=record.manufacturer_id,
+            manufacturer_part_id=record.manufacturer_part_id,
+            part_instance_id=record.part_instance_id,
+            customer_part_id=record.customer_part_id,
+            van=record.van,
+            business_partner=BusinessPartnerRead.model_construct(name=record.business_partner_name, bpnl=record.business_partner_bpnl)
+        )
 
     def create_jis_part(self, jis_part_create: JISPartCreate) -> JISPartRead:
         """
@@ -315,6 +552,36 @@ class PartManagementService():
         # Logic to retrieve all JIS parts
         pass
 
+    def load_instance_parts(self, part_type: InstancePartType, rows: Iterable[Dict[str, Optional[str]]],
+                            create_twins: bool = True, chunk_size: int = COPY_CHUNK_SIZE) -> InstancePartLoadResult:
+        """
+        Bulk load instance level parts of the given type, with a new twin per part, from the rows of an extract
+        (keyed by the CSV header, e.g. partInstanceId, see `managers.metadata_database.bulk_loader`).
+        Existing parts are skipped; rows referencing unknown manufacturers, catalog parts, business partners or
+        partner catalog parts are not loaded but reported. All parts are loaded within one transaction.
+        """
+        started = perf_counter()
+        with RepositoryManagerFactory.create() as repos:
+            rows_read = repos.instance_part_loader.stage(part_type, rows, chunk_size=chunk_size)
+            staged = perf_counter()
+            merged = repos.instance_part_loader.merge(part_type, create_twins=create_twins)
+        finished = perf_counter()
+
+        result = InstancePartLoadResult(
+            partType=part_type,
+            rowsRead=rows_read,
+            partsCreated=merged["parts_created"],
+            twinsCreated=merged["twins_created"],
+            rowsSkipped=merged["rows_skipped"],
+            rowsUnresolved=merged["rows_unresolved"],
+            unresolvedLines=merged["unresolved_lines"],
+            copySeconds=round(staged - started, 3),
+            mergeSeconds=round(finished - staged, 3),
+            rowsPerSecond=round(rows_read / (finished - started), 1) if finished > started else 0.0,
+        )
+        logger.info(f"Loaded {result.parts_created} parts of type {part_type.value} from {rows_read} rows ({result.rows_per_second} rows/s).")
+        return result
+
     def create_partner_catalog_part_mapping(self, partner_catalog_part_create: PartnerCatalogPartCreate) -> CatalogPartRead:
         """
         Create a new partner catalog part in the system.
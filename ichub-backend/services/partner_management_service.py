@@ -26,18 +26,22 @@ from typing import List, Optional
 
 from models.services.partner_management import BusinessPartnerCreate, BusinessPartnerRead, DataExchangeAgreementRead
 from models.metadata_database.models import BusinessPartner, DataExchangeAgreement
-from managers.metadata_database.manager import RepositoryManagerFactory
+from models.services.pagination import Page
+from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory, AsyncRepositoryManagerFactory
+from database import instrument_queries
+from tools.cursor_tools import clamp_page_size, decode_id_cursor, split_page
 
+@instrument_queries
 class PartnerManagementService():
     """
     Service class for managing partners and exchange agreements.
     """
 
-    def create_business_partner(self, partner_create: BusinessPartnerCreate) -> BusinessPartnerRead:
+    def create_business_partner(self, partner_create: BusinessPartnerCreate, repo: Optional[RepositoryManager] = None) -> BusinessPartnerRead:
         """
         Create a new partner in the system.
         """
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.use(repo) as repo:
             
             # First create the business partner entity
             db_partner = repo.business_partner_repository.create(BusinessPartner(
@@ -46,8 +50,7 @@ class PartnerManagementService():
             ))
 
             # Needed to get the generated ID from the database into the entity
-            repo.commit()
-            repo.refresh(db_partner)
+            repo.flush()
 
             # Always create a default data exchange agreement for the partner
             # (TODO: to be replaced by an explicit API call in a later version)
@@ -64,10 +67,19 @@ class PartnerManagementService():
         Retrieve a partner by its ID.
         """
         
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.create(read_only=True) as repo:
             db_partner = repo.business_partner_repository.get_by_bpnl(partner_number)
             return BusinessPartnerRead(name=db_partner.name, bpnl=db_partner.bpnl) if db_partner else None
 
+    async def get_business_partner_async(self, partner_number: str) -> Optional[BusinessPartnerRead]:
+        """
+        Retrieve a partner by its ID without blocking the event loop.
+        """
+
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repo:
+            db_partner = await repo.business_partner_repository.get_by_bpnl(partner_number)
+            return BusinessPartnerRead(name=db_partner.name, bpnl=db_partner.bpnl) if db_partner else None
+
 
     def delete_business_partner(self, partner_name: str) -> bool:
         """
@@ -76,19 +88,32 @@ class PartnerManagementService():
         # Logic to delete a partner
         pass
 
-    def list_business_partners(self) -> List[BusinessPartnerRead]:
+    def list_business_partners(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[BusinessPartnerRead]:
+        """
+        List one page of the partners in the system.
+        Pass the `next` cursor of the returned page to retrieve the following page.
+        """
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repo:
+            db_partners = repo.business_partner_repository.find_all(after_id=decode_id_cursor(cursor), limit=page_size + 1)
+            db_partners, next_cursor = split_page(db_partners, page_size, key=lambda bp: bp.id)
+            return Page[BusinessPartnerRead](items=[BusinessPartnerRead(name=bp.name, bpnl=bp.bpnl) for bp in db_partners], next=next_cursor)
+
+    async def list_business_partners_async(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[BusinessPartnerRead]:
         """
-        List all partners in the system.
+        List one page of the partners in the system without blocking the event loop.
         """
-        with RepositoryManagerFactory.create() as repo:
-            db_partners = repo.business_partner_repository.find_all()
-            return [BusinessPartnerRead(name=bp.name, bpnl=bp.bpnl) for bp in db_partners]
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repo:
+            db_partners = await repo.business_partner_repository.find_all(after_id=decode_id_cursor(cursor), limit=page_size + 1)
+            db_partners, next_cursor = split_page(db_partners, page_size, key=lambda bp: bp.id)
+            return Page[BusinessPartnerRead](items=[BusinessPartnerRead(name=bp.name, bpnl=bp.bpnl) for bp in db_partners], next=next_cursor)
         
     def get_data_exchange_agreements(self, partner_number: str) -> List[DataExchangeAgreementRead]:
         """
         List all data exchange agreements for a given partner.
         """
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.create(read_only=True) as repo:
             db_partner = repo.business_partner_repository.get_by_bpnl(partner_number)
             if not db_partner:
                 return []
@@ -26,8 +26,11 @@ from .twin_management_service import TwinManagementService
 from datetime import datetime, timezone
 from managers.submodels.submodel_document_generator import SubmodelDocumentGenerator, SEM_ID_PART_TYPE_INFORMATION_V1
 from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager
-from models.services.twin_management import CatalogPartTwinCreate, CatalogPartTwinShare, TwinAspectCreate, CatalogPartTwinDetailsRead, TwinAspectRead
-from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, EnablementServiceStack, CatalogPart, Twin, PartnerCatalogPart
+from database import instrument_queries
+from managers.metadata_database.advisory_locks import CATALOG_PART_LOCK
+from managers.metadata_database.repositories import LoadingProfile
+from models.services.twin_management import CatalogPartTwinCreate, CatalogPartTwinShare, CatalogPartTwinDetailsRead, TwinAspectRead
+from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, EnablementServiceStack, CatalogPart, Twin, TwinAspect, TwinAspectRegistration, PartnerCatalogPart
 from models.services.sharing_management import SharedPartBase, ShareCatalogPart, SharedPartner
 from models.services.partner_management import BusinessPartnerRead
 from typing import Dict, Optional, List, Any, Tuple
@@ -37,6 +40,7 @@ from managers.config.log_manager import LoggingManager
 
 logger = LoggingManager.get_logger(__name__)
 
+@instrument_queries
 class SharingService:
     """
     Service to handle part sharing shortcuts.
@@ -49,9 +53,19 @@ class SharingService:
     def get_shared_partners(self, manufacturerId:str, manufacturerPartId:str) -> List[SharedPartner]:
         pass
     
-    def share_catalog_part(self, catalog_part_to_share: ShareCatalogPart) -> SharedPartBase:
+    def share_catalog_part(self, catalog_part_to_share: ShareCatalogPart, repo: Optional[RepositoryManager] = None) -> SharedPartBase:
+        """
+        Share a catalog part with a business partner. All steps (including the nested twin management
+        calls) run in the unit of work of the given repository manager, or of a new one if not given.
+
+        The catalog part lock is held until the owner of the unit of work ends it, including the remote
+        registrations in the DTR, submodel service and EDC: a concurrent share of the catalog part waits for
+        it and then skips the registrations already recorded as done.
+        """
         shared_at = datetime.now(timezone.utc)
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.use(repo) as repo:
+            # Step 0: Shares of the same catalog part are serialized (see create_catalog_part_twin)
+            repo.advisory_lock(CATALOG_PART_LOCK, catalog_part_to_share.manufacturer_id, catalog_part_to_share.manufacturer_part_id)
             # Step 1: Retrieve the catalog part from the repository
             db_catalog_part = self._get_catalog_part(repo, catalog_part_to_share)
             # Step 2: Get or create the enablement service stack for the manufacturer
@@ -63,18 +77,28 @@ class SharingService:
             db_data_exchange_agreement = self._get_or_create_data_exchange_agreement(repo, db_business_partner)
             # Step 5: Get or create the partner catalog part
             db_partner_catalog_parts:Dict[str, BusinessPartnerRead] = self._get_or_create_partner_catalog_parts(repo, catalog_part_to_share.customer_part_id, db_catalog_part, db_business_partner)
-            # Step 6: Create and retrieve the catalog part twin
-            db_twin = self._create_and_get_twin(repo, catalog_part_to_share)
+            # Step 6: Get or create the catalog part twin and its registration
+            db_twin, db_twin_registration, db_enablement_service_stack = self.twin_management_service.get_or_create_catalog_part_twin(
+                repo, db_catalog_part, CatalogPartTwinCreate(
+                    manufacturerId=catalog_part_to_share.manufacturer_id,
+                    manufacturerPartId=catalog_part_to_share.manufacturer_part_id,
+                ))
             # Step 7: Ensure a twin exchange exists between the twin and the data exchange agreement
             self._ensure_twin_exchange(repo, db_twin, db_data_exchange_agreement)
-            # Step 8: Create the part twin aspect with part type information
-            self._create_part_twin_aspect(db_twin, db_catalog_part, catalog_part_to_share)
-            # Step 9: Return the shared part information
+            # Step 8: Get or create the part twin aspect with part type information and its registration
+            db_twin_aspect, db_twin_aspect_registration = self.twin_management_service.get_or_create_twin_aspect(
+                repo, db_twin, SEM_ID_PART_TYPE_INFORMATION_V1, None, db_enablement_service_stack)
+            # Step 9: Register the twin in the DTR and the part type information aspect (as far as not done yet)
+            if not db_twin_registration.dtr_registered:
+                self.twin_management_service.register_catalog_part_twin(
+                    db_catalog_part, db_twin, db_twin_registration, db_enablement_service_stack)
+            self._register_part_twin_aspect(repo, db_twin, db_twin_aspect, db_twin_aspect_registration, db_enablement_service_stack, db_catalog_part, catalog_part_to_share)
+            # Step 10: Return the shared part information
             return SharedPartBase(
                 businessPartnerNumber=catalog_part_to_share.business_partner_number,
                 customerPartIds=db_partner_catalog_parts,
                 sharedAt=shared_at,
-                twin=self.twin_management_service.get_catalog_part_twin_details_id(global_id=db_twin.global_id)
+                twin=self.twin_management_service.get_catalog_part_twin_details_id(global_id=db_twin.global_id, repo=repo)
             )
 
     def _get_catalog_part(self, repo: RepositoryManager, catalog_part_to_share: ShareCatalogPart) -> CatalogPart:
@@ -86,7 +110,7 @@ class SharingService:
         db_catalog_parts: List[Tuple[CatalogPart, Any]] = repo.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
             catalog_part_to_share.manufacturer_id,
             catalog_part_to_share.manufacturer_part_id,
-            join_partner_catalog_parts=True
+            profile=LoadingProfile.SHARE
         )
         if not db_catalog_parts:
             raise ValueError("Catalog part not found.")
@@ -97,14 +121,10 @@ class SharingService:
         """
         Retrieve or create a BusinessPartner for the given business partner number.
         """
-        db_business_partner = repo.business_partner_repository.get_by_bpnl(catalog_part_to_share.business_partner_number)
-        if not db_business_partner:
-            db_business_partner = repo.business_partner_repository.create(BusinessPartner(
-                name='Partner_' + catalog_part_to_share.business_partner_number,
-                bpnl=catalog_part_to_share.business_partner_number
-            ))
-            repo.commit()
-            repo.refresh(db_business_partner)
+        db_business_partner, _ = repo.business_partner_repository.get_or_create(
+            bpnl=catalog_part_to_share.business_partner_number,
+            name='Partner_' + catalog_part_to_share.business_partner_number
+        )
         return db_business_partner
 
     def _get_or_create_data_exchange_agreement(self, repo: RepositoryManager, db_business_partner: BusinessPartner) -> DataExchangeAgreement:
@@ -112,16 +132,13 @@ class SharingService:
         Retrieve or create a DataExchangeAgreement for the given business partner.
         """
         db_data_exchange_agreements = repo.data_exchange_agreement_repository.get_by_business_partner_id(db_business_partner.id)
-        if not db_data_exchange_agreements:
-            db_data_exchange_agreement = repo.data_exchange_agreement_repository.create(
-                DataExchangeAgreement(
-                    business_partner_id=db_business_partner.id,
-                    name='Default'
-                ))
-            repo.commit()
-            repo.refresh(db_data_exchange_agreement)
-        else:
-            db_data_exchange_agreement = db_data_exchange_agreements[0]
+        if db_data_exchange_agreements:
+            return db_data_exchange_agreements[0]
+
+        db_data_exchange_agreement, _ = repo.data_exchange_agreement_repository.get_or_create(
+            business_partner_id=db_business_partner.id,
+            name='Default'
+        )
         return db_data_exchange_agreement
 
     def _get_or_create_partner_catalog_parts(self, repo: RepositoryManager, customer_part_id: str, db_catalog_part: CatalogPart, db_business_partner: BusinessPartner) -> Dict[str, BusinessPartnerRead]:
@@ -165,21 +182,9 @@ class SharingService:
             business_partner_id=db_business_partner.id,
             customer_part_id=customer_part_id,
         )
-        repo.commit()
-        repo.refresh(db_partner_catalog_part)
+        repo.flush()
         return db_partner_catalog_part
 
-    def _create_and_get_twin(self, repo: RepositoryManager, catalog_part_to_share: ShareCatalogPart) -> Twin:
-        """
-        Create a catalog part twin and retrieve its database representation.
-        """
-        twin_read = self.twin_management_service.create_catalog_part_twin(CatalogPartTwinCreate(
-            manufacturerId=catalog_part_to_share.manufacturer_id,
-            manufacturerPartId=catalog_part_to_share.manufacturer_part_id,
-        ))
-        db_twin = repo.twin_repository.find_by_global_id(twin_read.global_id)
-        return db_twin
-
     def _ensure_twin_exchange(self, repo: RepositoryManager, db_twin: Twin, db_data_exchange_agreement: DataExchangeAgreement) -> None:
         """
         Ensure a twin exchange exists between the twin and data exchange agreement.
@@ -194,11 +199,12 @@ class SharingService:
                 twin_id=db_twin.id,
                 data_exchange_agreement_id=db_data_exchange_agreement.id
             )
-            repo.commit()
+            repo.flush()
 
-    def _create_part_twin_aspect(self, db_twin: Twin, db_catalog_part: CatalogPart, catalog_part_to_share: ShareCatalogPart) -> TwinAspectRead:
+    def _register_part_twin_aspect(self, repo: RepositoryManager, db_twin: Twin, db_twin_aspect: TwinAspect, db_twin_aspect_registration: TwinAspectRegistration,
+            db_enablement_service_stack: EnablementServiceStack, db_catalog_part: CatalogPart, catalog_part_to_share: ShareCatalogPart) -> TwinAspectRead:
         """
-        Create a twin aspect representing the part type information for the catalog part twin.
+        Upload and register the twin aspect representing the part type information for the catalog part twin.
         """
         payload = self.submodel_document_generator.generate_part_type_information_v1(
             global_id=db_twin.global_id,
@@ -206,8 +212,5 @@ class SharingService:
             name=db_catalog_part.name,
             bpns=db_catalog_part.bpns
         )
-        return self.twin_management_service.create_twin_aspect(TwinAspectCreate(
-            globalId=db_twin.global_id,
-            semanticId=SEM_ID_PART_TYPE_INFORMATION_V1,
-            payload=payload
-        ), manufacturer_id=catalog_part_to_share.manufacturer_id)
+        return self.twin_management_service.register_twin_aspect(
+            repo, db_twin, db_twin_aspect, db_twin_aspect_registration, db_enablement_service_stack, payload)
@@ -26,6 +26,7 @@ from uuid import UUID
 from typing import Dict, Any, Optional
 
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from database import instrument_queries
 from tools.submodel_type_util import get_submodel_type
 
 class SubmodelNotSharedWithBusinessPartnerError(ValueError):
@@ -33,6 +34,7 @@ class SubmodelNotSharedWithBusinessPartnerError(ValueError):
     Exception raised when a requested twin is not shared with the specified business partner.
     """
 
+@instrument_queries
 class SubmodelDispatcherService:
     """
     Service class for managing submodel dispatching.
@@ -58,7 +60,7 @@ class SubmodelDispatcherService:
         # Also to be analyzed later: does the contract agreement ID (which the EDC Data Plane provides to us)
         # somehow give us more possibilities of evaluating? (drawback: in this service we should actually
         # avoid calling too many other services - especially not the EDC Control Plane)
-        # with RepositoryManagerFactory.create() as repos:
+        # with RepositoryManagerFactory.create(read_only=True) as repos:
             # db_twin_exchange = repos.twin_exchange_repository.find_by_global_id_business_partner_number(
             #     global_id, edc_bpn)
 
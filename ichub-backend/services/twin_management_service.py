@@ -22,12 +22,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import Optional, Dict, Any, List
-from uuid import UUID, uuid4
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from uuid import UUID, uuid5, NAMESPACE_OID
 import json
 
 from managers.config.config_manager import ConfigManager
-from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager
+from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager, AsyncRepositoryManagerFactory
+from database import instrument_queries
+from managers.metadata_database.advisory_locks import CATALOG_PART_LOCK, ENABLEMENT_SERVICE_STACK_LOCK
+from managers.metadata_database.repositories import LoadingProfile, STREAM_BATCH_SIZE
 from managers.enablement_services.dtr_manager import DTRManager
 from managers.enablement_services.connector_manager import ConnectorManager
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
@@ -44,7 +47,9 @@ from models.services.twin_management import (
     TwinAspectRegistrationStatus,
     TwinsAspectRegistrationMode,
 )
-from models.metadata_database.models import Twin, EnablementServiceStack
+from models.services.pagination import Page
+from models.metadata_database.models import CatalogPart, Twin, TwinAspect, TwinAspectRegistration as DbTwinAspectRegistration, TwinRegistration, EnablementServiceStack
+from tools.cursor_tools import clamp_page_size, decode_id_cursor, split_page
 
 from managers.config.log_manager import LoggingManager
 
@@ -52,6 +57,7 @@ logger = LoggingManager.get_logger(__name__)
 
 CATALOG_DIGITAL_TWIN_TYPE = "PartType"
 
+@instrument_queries
 class TwinManagementService:
     """
     Service class for managing twin-related operations (CRUD and Twin sharing).
@@ -61,85 +67,49 @@ class TwinManagementService:
         """
         Retrieve or create an EnablementServiceStack for the given manufacturer ID.
         """
-        
         db_enablement_service_stacks = repo.enablement_service_stack_repository.find_by_legal_entity_bpnl(legal_entity_bpnl=manufacturer_id)
-        if not db_enablement_service_stacks:
-            db_legal_entity = repo.legal_entity_repository.get_by_bpnl(bpnl=manufacturer_id)
-            db_enablement_service_stack = repo.enablement_service_stack_repository.create(
-                EnablementServiceStack(name=uuid4(), legal_entity_id=db_legal_entity.id))
-            repo.commit()
-            repo.refresh(db_enablement_service_stack)
-        else:
-            db_enablement_service_stack = db_enablement_service_stacks[0]
+        if db_enablement_service_stacks:
+            return db_enablement_service_stacks[0]
+
+        # Only the creation is serialized (across all backend replicas), the lock is held until the end of the transaction
+        repo.advisory_lock(ENABLEMENT_SERVICE_STACK_LOCK, manufacturer_id)
+        db_legal_entity, _ = repo.legal_entity_repository.get_or_create(bpnl=manufacturer_id)
+        # The name is derived from the manufacturer ID so that concurrent requests agree on the same stack
+        db_enablement_service_stack, _ = repo.enablement_service_stack_repository.get_or_create(
+            name=str(uuid5(NAMESPACE_OID, manufacturer_id)),
+            legal_entity_id=db_legal_entity.id
+        )
         return db_enablement_service_stack
     
-    def create_catalog_part_twin(self, create_input: CatalogPartTwinCreate) -> TwinRead:
-        with RepositoryManagerFactory.create() as repo:
+    def create_catalog_part_twin(self, create_input: CatalogPartTwinCreate, repo: Optional[RepositoryManager] = None) -> TwinRead:
+        """
+        Create the twin of a catalog part (if not there yet) and register it in the DTR.
+
+        The catalog part lock is held until the owner of the unit of work ends it, including the DTR
+        registration: a concurrent request waits for it and then reuses the twin without registering it again.
+        """
+        with RepositoryManagerFactory.use(repo) as repo:
+            # Step 0: Concurrent requests for the same catalog part (of all backend replicas) wait until the first
+            # one committed and then reuse its twin and DTR registration instead of creating and registering another
+            repo.advisory_lock(CATALOG_PART_LOCK, create_input.manufacturer_id, create_input.manufacturer_part_id)
+
             # Step 1: Retrieve the catalog part entity according to the catalog part data (manufacturer_id, manufacturer_part_id)
             db_catalog_parts = repo.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
                 create_input.manufacturer_id,
                 create_input.manufacturer_part_id,
-                join_partner_catalog_parts=True
+                profile=LoadingProfile.SHARE
             )
             if not db_catalog_parts:
                 raise ValueError("Catalog part not found.")
             else:
                 db_catalog_part, _ = db_catalog_parts[0]
 
-            # Step 2: Retrieve the enablement service stack entity from the DB according to the given name
-            # (if not there => raise error)
-            db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=create_input.manufacturer_id)
-
-            # Step 3a: Load existing twin metadata from the DB (if there)
-            if db_catalog_part.twin_id:
-                db_twin = repo.twin_repository.find_by_id(db_catalog_part.twin_id)
-                if not db_twin:
-                    raise ValueError("Twin not found.")
-            # Step 3b: If no twin was there, create it now in the DB (generating on demand a new global_id and dtr_aas_id)
-            else:
-                db_twin = repo.twin_repository.create_new(
-                    global_id=create_input.global_id,
-                    dtr_aas_id=create_input.dtr_aas_id)
-                repo.commit()
-                repo.refresh(db_twin)
-
-                db_catalog_part.twin_id = db_twin.id
-                repo.commit()
-
-            # Step 4: Try to find the twin registration for the twin id and enablement service stack id
-            # (if not there => create it now, setting the dtr_registered flag to False)
-            db_twin_registration = repo.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(
-                db_twin.id,
-                db_enablement_service_stack.id
-            )
-            if not db_twin_registration:
-                db_twin_registration = repo.twin_registration_repository.create_new(
-                    twin_id=db_twin.id,
-                    enablement_service_stack_id=db_enablement_service_stack.id
-                )
-                repo.commit()
+            # Steps 2-4: Get or create the twin and its registration
+            db_twin, db_twin_registration, db_enablement_service_stack = self.get_or_create_catalog_part_twin(repo, db_catalog_part, create_input)
 
-            # Step 6: Check the dtr_registered flag on the twin registration entity
-            # (if True => we can skip the operation from here on => nothing to do)
-            # (if False => we need to register the twin in the DTR using the industry core SDK, then
-            #  update the twin registration entity with the dtr_registered flag to True)
+            # Step 5: Register the twin in the DTR (if not done yet)
             if not db_twin_registration.dtr_registered:
-                dtr_manager = _create_dtr_manager(db_enablement_service_stack.connection_settings)
-                
-                customer_part_ids = {partner_catalog_part.customer_part_id: partner_catalog_part.business_partner.bpnl 
-                                      for partner_catalog_part in db_catalog_part.partner_catalog_parts}
-                
-                dtr_manager.create_or_update_shell_descriptor(
-                    global_id=db_twin.global_id,
-                    aas_id=db_twin.aas_id,
-                    manufacturer_id=create_input.manufacturer_id,
-                    manufacturer_part_id=create_input.manufacturer_part_id,
-                    customer_part_ids=customer_part_ids,
-                    part_category=db_catalog_part.category,
-                    digital_twin_type=CATALOG_DIGITAL_TWIN_TYPE
-                )
-
-                db_twin_registration.dtr_registered = True
+                self.register_catalog_part_twin(db_catalog_part, db_twin, db_twin_registration, db_enablement_service_stack)
 
             return TwinRead(
                 globalId=db_twin.global_id,
@@ -148,60 +118,173 @@ class TwinManagementService:
                 modifiedDate=db_twin.modified_date
             )
 
+    def get_or_create_catalog_part_twin(self, repo: RepositoryManager, db_catalog_part: CatalogPart,
+            create_input: CatalogPartTwinCreate) -> Tuple[Twin, TwinRegistration, EnablementServiceStack]:
+        """
+        Retrieve or create the twin of the catalog part and its registration for the enablement service stack
+        of the manufacturer (database only). The caller holds the catalog part lock.
+        """
+        # Step 2: Retrieve the enablement service stack entity from the DB according to the given name
+        # (if not there => raise error)
+        db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=create_input.manufacturer_id)
+
+        # Step 3a: Load existing twin metadata from the DB (if there)
+        if db_catalog_part.twin_id:
+            db_twin = db_catalog_part.twin
+            if not db_twin:
+                raise ValueError("Twin not found.")
+        # Step 3b: If no twin was there, create it now in the DB (generating on demand a new global_id and dtr_aas_id)
+        else:
+            db_twin = repo.twin_repository.create_new(
+                global_id=create_input.global_id,
+                dtr_aas_id=create_input.dtr_aas_id)
+            repo.flush()
+
+            db_catalog_part.twin_id = db_twin.id
+            repo.flush()
+
+        # Step 4: Try to find the twin registration for the twin id and enablement service stack id
+        # (if not there => create it now, setting the dtr_registered flag to False)
+        db_twin_registration = repo.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(
+            db_twin.id,
+            db_enablement_service_stack.id
+        )
+        if not db_twin_registration:
+            db_twin_registration = repo.twin_registration_repository.create_new(
+                twin_id=db_twin.id,
+                enablement_service_stack_id=db_enablement_service_stack.id
+            )
+            repo.flush()
+
+        return db_twin, db_twin_registration, db_enablement_service_stack
+
+    def register_catalog_part_twin(self, db_catalog_part: CatalogPart, db_twin: Twin, db_twin_registration: TwinRegistration,
+            db_enablement_service_stack: EnablementServiceStack) -> None:
+        """
+        Register the twin of the catalog part in the DTR and set the dtr_registered flag of its registration
+        (written with the next flush). The caller holds the catalog part lock, see `create_catalog_part_twin`.
+        """
+        dtr_manager = _create_dtr_manager(db_enablement_service_stack.connection_settings)
+
+        customer_part_ids = {partner_catalog_part.customer_part_id: partner_catalog_part.business_partner.bpnl
+                              for partner_catalog_part in db_catalog_part.partner_catalog_parts}
+
+        dtr_manager.create_or_update_shell_descriptor(
+            global_id=db_twin.global_id,
+            aas_id=db_twin.aas_id,
+            manufacturer_id=db_catalog_part.legal_entity.bpnl,
+            manufacturer_part_id=db_catalog_part.manufacturer_part_id,
+            customer_part_ids=customer_part_ids,
+            part_category=db_catalog_part.category,
+            digital_twin_type=CATALOG_DIGITAL_TWIN_TYPE
+        )
+        db_twin_registration.dtr_registered = True
+
     def get_catalog_part_twins(self,
         manufacturer_id: Optional[str] = None,
         manufacturer_part_id: Optional[str] = None,
-        include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
-        
-        with RepositoryManagerFactory.create() as repo:
+        include_data_exchange_agreements: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None) -> Page[CatalogPartTwinRead]:
+        """
+        Retrieve one page of catalog part twins.
+        Pass the `next` cursor of the returned page to retrieve the following page.
+        """
+        page_size = clamp_page_size(limit)
+        with RepositoryManagerFactory.create(read_only=True) as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 manufacturer_id=manufacturer_id,
                 manufacturer_part_id=manufacturer_part_id,
-                include_data_exchange_agreements=include_data_exchange_agreements
+                profile=LoadingProfile.SHARE if include_data_exchange_agreements else LoadingProfile.LIST,
+                after_id=decode_id_cursor(cursor),
+                limit=page_size + 1
             )
             
-            result = []
-            for db_twin in db_twins:
-                db_catalog_part = db_twin.catalog_part
-                twin_result = CatalogPartTwinRead(
-                    globalId=db_twin.global_id,
-                    dtrAasId=db_twin.aas_id,
-                    createdDate=db_twin.created_date,
-                    modifiedDate=db_twin.modified_date,
-                    manufacturerId=db_catalog_part.legal_entity.bpnl,
-                    manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                    name=db_catalog_part.name,
-                    category=db_catalog_part.category,
-                    bpns=db_catalog_part.bpns,
-                    customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
-                        name=partner_catalog_part.business_partner.name,
-                        bpnl=partner_catalog_part.business_partner.bpnl
-                    ) for partner_catalog_part in db_catalog_part.partner_catalog_parts}
-                )
-                if include_data_exchange_agreements:
-                    twin_result.shares = [
-                        DataExchangeAgreementRead(
-                            name=db_twin_exchange.data_exchange_agreement.name,
-                            businessPartner=BusinessPartnerRead(
-                                name=db_twin_exchange.data_exchange_agreement.business_partner.name,
-                                bpnl=db_twin_exchange.data_exchange_agreement.business_partner.bpnl
-                            )
-                        ) for db_twin_exchange in db_twin.twin_exchanges
-                    ]
-
-
-                result.append(twin_result)
-            
-            return result
+            db_twins, next_cursor = split_page(db_twins, page_size, key=lambda db_twin: db_twin.id)
+            return Page[CatalogPartTwinRead](
+                items=[self._to_catalog_part_twin_read(db_twin, include_data_exchange_agreements) for db_twin in db_twins],
+                next=next_cursor
+            )
+
+    async def get_catalog_part_twins_async(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        include_data_exchange_agreements: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None) -> Page[CatalogPartTwinRead]:
+        """Async variant of `get_catalog_part_twins` not blocking the event loop during the database round trips."""
+        page_size = clamp_page_size(limit)
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repo:
+            db_twins = await repo.twin_repository.find_catalog_part_twins(
+                manufacturer_id=manufacturer_id,
+                manufacturer_part_id=manufacturer_part_id,
+                profile=LoadingProfile.SHARE if include_data_exchange_agreements else LoadingProfile.LIST,
+                after_id=decode_id_cursor(cursor),
+                limit=page_size + 1
+            )
+
+            db_twins, next_cursor = split_page(db_twins, page_size, key=lambda db_twin: db_twin.id)
+            return Page[CatalogPartTwinRead](
+                items=[self._to_catalog_part_twin_read(db_twin, include_data_exchange_agreements) for db_twin in db_twins],
+                next=next_cursor
+            )
+
+    def export_catalog_part_twins(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        include_data_exchange_agreements: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE) -> Iterator[List[CatalogPartTwinRead]]:
+        """
+        Export all catalog part twins in batches of `batch_size`, streamed from a server-side cursor.
+        The database session stays open until the iterator is exhausted or closed.
+        """
+        with RepositoryManagerFactory.create(read_only=True) as repo:
+            for db_twins in repo.twin_repository.stream_catalog_part_twins(
+                    manufacturer_id=manufacturer_id,
+                    manufacturer_part_id=manufacturer_part_id,
+                    profile=LoadingProfile.SHARE if include_data_exchange_agreements else LoadingProfile.LIST,
+                    batch_size=batch_size):
+                yield [self._to_catalog_part_twin_read(db_twin, include_data_exchange_agreements) for db_twin in db_twins]
+
+    @staticmethod
+    def _to_catalog_part_twin_read(db_twin: Twin, include_data_exchange_agreements: bool) -> CatalogPartTwinRead:
+        db_catalog_part = db_twin.catalog_part
+        twin_result = CatalogPartTwinRead(
+            globalId=db_twin.global_id,
+            dtrAasId=db_twin.aas_id,
+            createdDate=db_twin.created_date,
+            modifiedDate=db_twin.modified_date,
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            customerPartIds={partner_catalog_part.customer_part_id: BusinessPartnerRead(
+                name=partner_catalog_part.business_partner.name,
+                bpnl=partner_catalog_part.business_partner.bpnl
+            ) for partner_catalog_part in db_catalog_part.partner_catalog_parts}
+        )
+        if include_data_exchange_agreements:
+            twin_result.shares = [
+                DataExchangeAgreementRead(
+                    name=db_twin_exchange.data_exchange_agreement.name,
+                    businessPartner=BusinessPartnerRead(
+                        name=db_twin_exchange.data_exchange_agreement.business_partner.name,
+                        bpnl=db_twin_exchange.data_exchange_agreement.business_partner.bpnl
+                    )
+                ) for db_twin_exchange in db_twin.twin_exchanges
+            ]
+
+        return twin_result
 
-    def create_catalog_part_twin_share(self, catalog_part_share_input: CatalogPartTwinShare) -> bool:
+    def create_catalog_part_twin_share(self, catalog_part_share_input: CatalogPartTwinShare, repo: Optional[RepositoryManager] = None) -> bool:
         
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.use(repo) as repo:
             # Step 1: Retrieve the catalog part entity according to the catalog part data (manufacturer_id, manufacturer_part_id)
             db_catalog_parts = repo.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
                 catalog_part_share_input.manufacturer_id,
                 catalog_part_share_input.manufacturer_part_id,
-                join_partner_catalog_parts=True
+                profile=LoadingProfile.SHARE
             )
             if not db_catalog_parts:
                 raise ValueError("Catalog part not found.")
@@ -221,7 +304,7 @@ class TwinManagementService:
                 raise ValueError(f"Not customer part ID existing for given business partner '{catalog_part_share_input.business_partner_number}'.")
 
             # Step 4: Retrieve the twin entity for the catalog part entity
-            db_twin = repo.twin_repository.find_by_id(db_catalog_part.twin_id)
+            db_twin = db_catalog_part.twin
             if not db_twin:
                 raise ValueError("Twin not found.")
 
@@ -244,17 +327,17 @@ class TwinManagementService:
                     twin_id=db_twin.id,
                     data_exchange_agreement_id=db_data_exchange_agreement.id
                 )
-                repo.commit()
+                repo.flush()
                 return True
             else:
                 return False
 
-    def create_twin_aspect(self, twin_aspect_create: TwinAspectCreate, manufacturer_id:str) -> TwinAspectRead:
+    def create_twin_aspect(self, twin_aspect_create: TwinAspectCreate, manufacturer_id:str, repo: Optional[RepositoryManager] = None) -> TwinAspectRead:
         """
         Create a new twin aspect for a give twin.
         """
 
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.use(repo) as repo:
             
             # Step 1: Retrieve the twin entity according to the global_id
             db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id)
@@ -267,120 +350,137 @@ class TwinManagementService:
             # (if not there => raise error)
             db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
             
-            # Step 3: Retrieve a potentially existing twin aspect entity for the given twin_id and semantic_id
-            db_twin_aspect = repo.twin_aspect_repository.get_by_twin_id_semantic_id(
-                db_twin.id,
-                twin_aspect_create.semantic_id,
-                include_registrations=True
-            )
-            if not db_twin_aspect:
-                # Step 3a: Create a new twin aspect entity in the database
-                db_twin_aspect = repo.twin_aspect_repository.create_new(
-                    twin_id=db_twin.id,
-                    semantic_id=twin_aspect_create.semantic_id,
-                    submodel_id=twin_aspect_create.submodel_id
-                )
-                repo.commit()
-                repo.refresh(db_twin_aspect)
+            # Steps 3-4: Get or create the twin aspect and its registration for the enablement service stack
+            db_twin_aspect, db_twin_aspect_registration = self.get_or_create_twin_aspect(
+                repo, db_twin, twin_aspect_create.semantic_id, twin_aspect_create.submodel_id, db_enablement_service_stack)
 
-            # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
-            db_twin_aspect_registration = db_twin_aspect.find_registration_by_stack_id(
-                db_enablement_service_stack.id
+            return self.register_twin_aspect(repo, db_twin, db_twin_aspect, db_twin_aspect_registration,
+                db_enablement_service_stack, twin_aspect_create.payload)
+            
+    def get_or_create_twin_aspect(self, repo: RepositoryManager, db_twin: Twin, semantic_id: str, submodel_id: Optional[UUID],
+            db_enablement_service_stack: EnablementServiceStack) -> Tuple[TwinAspect, DbTwinAspectRegistration]:
+        """
+        Retrieve or create the twin aspect of the twin with the semantic ID and its registration for the
+        enablement service stack (database only, see `create_twin_aspect` for the remote registrations).
+        """
+        # Step 3: Retrieve a potentially existing twin aspect entity for the given twin_id and semantic_id
+        db_twin_aspect = repo.twin_aspect_repository.get_by_twin_id_semantic_id(
+            db_twin.id,
+            semantic_id,
+            include_registrations=True
+        )
+        if not db_twin_aspect:
+            # Step 3a: Create a new twin aspect entity in the database
+            db_twin_aspect = repo.twin_aspect_repository.create_new(
+                twin_id=db_twin.id,
+                semantic_id=semantic_id,
+                submodel_id=submodel_id
             )
-            if not db_twin_aspect_registration:
-                db_twin_aspect_registration = repo.twin_aspect_registration_repository.create_new(
-                    twin_aspect_id=db_twin_aspect.id,
-                    enablement_service_stack_id=db_enablement_service_stack.id,
-                    registration_mode=TwinsAspectRegistrationMode.DISPATCHED.value, 
-                )
-                repo.commit()
-                repo.refresh(db_twin_aspect_registration)
-                repo.refresh(db_twin_aspect)
+            repo.flush()
+
+        # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
+        db_twin_aspect_registration = db_twin_aspect.find_registration_by_stack_id(
+            db_enablement_service_stack.id
+        )
+        if not db_twin_aspect_registration:
+            db_twin_aspect_registration = repo.twin_aspect_registration_repository.create_new(
+                twin_aspect_id=db_twin_aspect.id,
+                enablement_service_stack_id=db_enablement_service_stack.id,
+                registration_mode=TwinsAspectRegistrationMode.DISPATCHED.value, 
+            )
+            repo.flush()
 
-            ## Step 4b: Check if there is created a asset for the digital twin registry.
+        return db_twin_aspect, db_twin_aspect_registration
+
+    def register_twin_aspect(self, repo: RepositoryManager, db_twin: Twin, db_twin_aspect: TwinAspect,
+            db_twin_aspect_registration: DbTwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack,
+            payload: Dict[str, Any]) -> TwinAspectRead:
+        """
+        Upload the payload of the twin aspect and register it in the EDC and the DTR, as far as not done yet
+        according to the status of its registration.
+        """
+        ## Step 4b: Check if there is created a asset for the digital twin registry.
+        
+        edc_manager = _create_connector_manager(db_enablement_service_stack.connection_settings)
+        dtr_config = ConfigManager.get_config("digitalTwinRegistry")
+        asset_config = dtr_config.get("asset_config")
+        dtr_asset_id, _, _, _ = edc_manager.register_dtr_offer(
+            base_dtr_url=dtr_config.get("hostname"),
+            uri=dtr_config.get("uri"),
+            api_path=dtr_config.get("apiPath"),
+            dtr_policy_config=dtr_config.get("policy"),
+            dct_type=asset_config.get("dct_type"),
+            existing_asset_id=asset_config.get("existing_asset_id", None)
+        )
+        if(not dtr_asset_id):
+            raise Exception("The Digital Twin Registry was not able to be registered, or was not found in the Connector!")
+
+        # Step 5: Handle the submodel service
+        if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.STORED.value:
+            submodel_service_manager = _create_submodel_service_manager(db_enablement_service_stack.connection_settings)
             
-            edc_manager = _create_connector_manager(db_enablement_service_stack.connection_settings)
-            dtr_config = ConfigManager.get_config("digitalTwinRegistry")
-            asset_config = dtr_config.get("asset_config")
-            dtr_asset_id, _, _, _ = edc_manager.register_dtr_offer(
-                base_dtr_url=dtr_config.get("hostname"),
-                uri=dtr_config.get("uri"),
-                api_path=dtr_config.get("apiPath"),
-                dtr_policy_config=dtr_config.get("policy"),
-                dct_type=asset_config.get("dct_type"),
-                existing_asset_id=asset_config.get("existing_asset_id", None)
+            # Step 5a: Upload the payload to the submodel service
+            submodel_service_manager.upload_twin_aspect_document(
+                db_twin_aspect.submodel_id,
+                db_twin_aspect.semantic_id,
+                payload
             )
-            if(not dtr_asset_id):
-                raise Exception("The Digital Twin Registry was not able to be registered, or was not found in the Connector!")
-
-            # Step 5: Handle the submodel service
-            if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.STORED.value:
-                submodel_service_manager = _create_submodel_service_manager(db_enablement_service_stack.connection_settings)
-                
-                # Step 5a: Upload the payload to the submodel service
-                submodel_service_manager.upload_twin_aspect_document(
-                    db_twin_aspect.submodel_id,
-                    db_twin_aspect.semantic_id,
-                    twin_aspect_create.payload
-                )
-
-                # Step 5b: Update the registration status to STORED
-                db_twin_aspect_registration.status = TwinAspectRegistrationStatus.STORED.value
-                repo.commit()
 
-            # Step 6: Handle the EDC registration
-            if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.EDC_REGISTERED.value:
-                
-                # Step 6a: Register the aspect as asset in the EDC (if necessary) only submodel bundle allowed
-                asset_id, usage_policy_id, access_policy_id, contract_id = edc_manager.register_submodel_bundle_circular_offer(
-                    semantic_id=db_twin_aspect.semantic_id
-                )
+            # Step 5b: Update the registration status to STORED
+            db_twin_aspect_registration.status = TwinAspectRegistrationStatus.STORED.value
+            repo.flush()
 
-                # Step 6b: Update the registration status to EDC_REGISTERED
-                db_twin_aspect_registration.status = TwinAspectRegistrationStatus.EDC_REGISTERED.value
-                repo.commit()
-
-            # Step 7: Handle the DTR registration
-            if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.DTR_REGISTERED.value:
-                dtr_manager = _create_dtr_manager(db_enablement_service_stack.connection_settings)
-                
-                # Step 7a: Register the submodel in the DTR (if necessary)
-                try:
-                    dtr_manager.create_submodel_descriptor(
-                        aas_id=db_twin.aas_id,
-                        submodel_id=db_twin_aspect.submodel_id,
-                        semantic_id=db_twin_aspect.semantic_id,
-                        edc_asset_id=asset_id
-                )
-                except Exception as e:
-                    logger.error("It was not possible to create the submodel descriptor")
-
-                # Step 7b: Update the registration status to DTR_REGISTERED
-                db_twin_aspect_registration.status = TwinAspectRegistrationStatus.DTR_REGISTERED.value
-                repo.commit()
-
-            return TwinAspectRead(
-                semanticId=db_twin_aspect.semantic_id,
-                submodelId=db_twin_aspect.submodel_id,
-
-                registrations={
-                    db_enablement_service_stack.name: TwinAspectRegistration(
-                        enablementServiceStackName=db_enablement_service_stack.name,
-                        status=TwinAspectRegistrationStatus(db_twin_aspect_registration.status),
-                        mode=TwinsAspectRegistrationMode(db_twin_aspect_registration.registration_mode),
-                        createdDate=db_twin_aspect_registration.created_date,
-                        modifiedDate=db_twin_aspect_registration.modified_date
-                    )
-                }
+        # Step 6: Handle the EDC registration
+        if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.EDC_REGISTERED.value:
+            
+            # Step 6a: Register the aspect as asset in the EDC (if necessary) only submodel bundle allowed
+            asset_id, usage_policy_id, access_policy_id, contract_id = edc_manager.register_submodel_bundle_circular_offer(
+                semantic_id=db_twin_aspect.semantic_id
             )
+
+            # Step 6b: Update the registration status to EDC_REGISTERED
+            db_twin_aspect_registration.status = TwinAspectRegistrationStatus.EDC_REGISTERED.value
+            repo.flush()
+
+        # Step 7: Handle the DTR registration
+        if db_twin_aspect_registration.status < TwinAspectRegistrationStatus.DTR_REGISTERED.value:
+            dtr_manager = _create_dtr_manager(db_enablement_service_stack.connection_settings)
             
-    def get_catalog_part_twin_details_id(self, global_id:UUID) -> Optional[CatalogPartTwinDetailsRead]:
-        with RepositoryManagerFactory.create() as repo:
+            # Step 7a: Register the submodel in the DTR (if necessary)
+            try:
+                dtr_manager.create_submodel_descriptor(
+                    aas_id=db_twin.aas_id,
+                    submodel_id=db_twin_aspect.submodel_id,
+                    semantic_id=db_twin_aspect.semantic_id,
+                    edc_asset_id=asset_id
+            )
+            except Exception as e:
+                logger.error("It was not possible to create the submodel descriptor")
+
+            # Step 7b: Update the registration status to DTR_REGISTERED
+            db_twin_aspect_registration.status = TwinAspectRegistrationStatus.DTR_REGISTERED.value
+            repo.flush()
+
+        return TwinAspectRead(
+            semanticId=db_twin_aspect.semantic_id,
+            submodelId=db_twin_aspect.submodel_id,
+
+            registrations={
+                db_enablement_service_stack.name: TwinAspectRegistration(
+                    enablementServiceStackName=db_enablement_service_stack.name,
+                    status=TwinAspectRegistrationStatus(db_twin_aspect_registration.status),
+                    mode=TwinsAspectRegistrationMode(db_twin_aspect_registration.registration_mode),
+                    createdDate=db_twin_aspect_registration.created_date,
+                    modifiedDate=db_twin_aspect_registration.modified_date
+                )
+            }
+        )
+        
+    def get_catalog_part_twin_details_id(self, global_id:UUID, repo: Optional[RepositoryManager] = None) -> Optional[CatalogPartTwinDetailsRead]:
+        with RepositoryManagerFactory.use(repo) as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 global_id=global_id,
-                include_data_exchange_agreements=True,
-                include_aspects=True,
-                include_registrations=True
+                profile=LoadingProfile.DETAIL
             )
             if not db_twins:
                 return None
@@ -389,13 +489,11 @@ class TwinManagementService:
             return self.build_catalog_part_twin_details(db_twin=db_twin)
     
     def get_catalog_part_twin_details(self, manufacturerId:str, manufacturerPartId:str) -> Optional[CatalogPartTwinDetailsRead]:
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.create(read_only=True) as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 manufacturer_id=manufacturerId,
                 manufacturer_part_id=manufacturerPartId,
-                include_data_exchange_agreements=True,
-                include_aspects=True,
-                include_registrations=True
+                profile=LoadingProfile.DETAIL
             )
             if not db_twins:
                 return None
@@ -404,6 +502,31 @@ class TwinManagementService:
             return self.build_catalog_part_twin_details(db_twin=db_twin)
         
     
+    async def get_catalog_part_twin_details_id_async(self, global_id:UUID) -> Optional[CatalogPartTwinDetailsRead]:
+        """Async variant of `get_catalog_part_twin_details_id` not blocking the event loop during the database round trips."""
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repo:
+            db_twins = await repo.twin_repository.find_catalog_part_twins(
+                global_id=global_id,
+                profile=LoadingProfile.DETAIL
+            )
+            if not db_twins:
+                return None
+
+            return self.build_catalog_part_twin_details(db_twin=db_twins[0])
+
+    async def get_catalog_part_twin_details_async(self, manufacturerId:str, manufacturerPartId:str) -> Optional[CatalogPartTwinDetailsRead]:
+        """Async variant of `get_catalog_part_twin_details` not blocking the event loop during the database round trips."""
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repo:
+            db_twins = await repo.twin_repository.find_catalog_part_twins(
+                manufacturer_id=manufacturerId,
+                manufacturer_part_id=manufacturerPartId,
+                profile=LoadingProfile.DETAIL
+            )
+            if not db_twins:
+                return None
+
+            return self.build_catalog_part_twin_details(db_twin=db_twins[0])
+
     def build_catalog_part_twin_details(self, db_twin: Twin) -> Optional[CatalogPartTwinDetailsRead]:
             
             db_catalog_part = db_twin.catalog_part
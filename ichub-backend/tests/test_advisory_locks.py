@@ -0,0 +1,123 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from managers.metadata_database.advisory_locks import CATALOG_PART_LOCK, ENABLEMENT_SERVICE_STACK_LOCK, AdvisoryLockTimeoutError, advisory_lock_key
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.services.part_management import CatalogPartCreate
+from models.services.sharing_management import ShareCatalogPart
+from services.part_management_service import PartManagementService
+from services.sharing_service import SharingService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+def test_lock_keys_are_stable_signed_64_bit_integers():
+    key = advisory_lock_key(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+    assert key == advisory_lock_key(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+    assert -2**63 <= key < 2**63
+    assert key != advisory_lock_key(ENABLEMENT_SERVICE_STACK_LOCK, MANUFACTURER_ID, "part")
+    # The key parts are separated, they cannot be shifted into each other
+    assert advisory_lock_key(CATALOG_PART_LOCK, "ab", "c") != advisory_lock_key(CATALOG_PART_LOCK, "a", "bc")
+
+def test_lock_is_reentrant_within_the_transaction(database):
+    with RepositoryManagerFactory.create() as repos:
+        repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+        repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part", timeout=0)
+
+def test_lock_held_by_another_transaction_times_out_until_released(database):
+    with RepositoryManagerFactory.create() as holder:
+        holder.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+        with RepositoryManagerFactory.create() as waiter:
+            with pytest.raises(AdvisoryLockTimeoutError):
+                waiter.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part", timeout=0.05)
+
+        holder.commit()
+        with RepositoryManagerFactory.create() as waiter:
+            waiter.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part", timeout=0)
+
+def test_lock_is_released_when_the_transaction_fails(database):
+    with pytest.raises(RuntimeError):
+        with RepositoryManagerFactory.create() as repos:
+            repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+            raise RuntimeError("failed")
+
+    with RepositoryManagerFactory.create() as repos:
+        repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part", timeout=0)
+
+def test_concurrent_transactions_are_serialized(database):
+    events = []
+    first_locked = threading.Event()
+
+    def work(name: str, hold: float):
+        with RepositoryManagerFactory.create() as repos:
+            repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part", timeout=5)
+            events.append(f"{name} locked")
+            first_locked.set()
+            time.sleep(hold)
+            events.append(f"{name} done")
+
+    first = threading.Thread(target=work, args=("first", 0.2))
+    first.start()
+    first_locked.wait(5)
+    second = threading.Thread(target=work, args=("second", 0))
+    second.start()
+    first.join(10)
+    second.join(10)
+
+    assert events == ["first locked", "first done", "second locked", "second done"]
+
+def test_lock_is_not_acquired_on_the_event_loop(database):
+    async def acquire():
+        with RepositoryManagerFactory.create() as repos:
+            repos.advisory_lock(CATALOG_PART_LOCK, MANUFACTURER_ID, "part")
+
+    with pytest.raises(RuntimeError, match="event loop"):
+        asyncio.run(acquire())
+
+def test_concurrent_shares_register_the_catalog_part_once(database, remote_services):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part", name="Part"))
+    # A slow DTR: the second share waits for the lock held across the registrations of the first one
+    remote_services.dtr.create_or_update_shell_descriptor.side_effect = lambda **kwargs: time.sleep(0.2)
+    errors = []
+
+    def share(business_partner_number: str):
+        try:
+            SharingService().share_catalog_part(ShareCatalogPart(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part",
+                businessPartnerNumber=business_partner_number, customerPartId="customer-part"))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=share, args=(business_partner_number,)) for business_partner_number in ("BPNL000000000002", "BPNL000000000003")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert errors == []
+    assert remote_services.dtr.create_or_update_shell_descriptor.call_count == 1
+    assert remote_services.submodel_service.upload_twin_aspect_document.call_count == 1
+    assert remote_services.connector.register_submodel_bundle_circular_offer.call_count == 1
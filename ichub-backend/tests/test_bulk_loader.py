@@ -0,0 +1,79 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from managers.metadata_database.bulk_loader import PART_LOAD_SPECS, InstancePartLoader, SourceColumn, _validate
+from managers.metadata_database.partitioning import PARTITION_KEYS, list_partitions
+from models.services.part_management import InstancePartType
+from services.part_management_service import PartManagementService
+
+def test_every_part_type_has_a_load_spec():
+    assert set(PART_LOAD_SPECS) == set(InstancePartType)
+    for spec in PART_LOAD_SPECS.values():
+        columns = {column.column for column in spec.columns}
+        assert spec.key_column in columns
+        # The keys of the partitioned part tables are claimed in their key table
+        assert (spec.key_table is not None) == (spec.table in PARTITION_KEYS)
+
+def test_values_are_validated_with_their_line():
+    assert _validate("  SN-1 ", SourceColumn("partInstanceId", "part_instance_id", "text", required=True), 2) == "SN-1"
+    assert _validate("", SourceColumn("van", "van", "text"), 2) is None
+
+    with pytest.raises(ValueError, match="Line 3: the column 'partInstanceId' is required"):
+        _validate(" ", SourceColumn("partInstanceId", "part_instance_id", "text", required=True), 3)
+    with pytest.raises(ValueError, match="Line 4: invalid value 'nope' in the column 'globalId'"):
+        _validate("nope", SourceColumn("globalId", "global_id", "uuid"), 4)
+    with pytest.raises(ValueError, match="Line 5: invalid value '31.12.2025' in the column 'jisCallDate'"):
+        _validate("31.12.2025", SourceColumn("jisCallDate", "jis_call_date", "timestamp"), 5)
+    assert _validate("2025-12-31T08:00:00", SourceColumn("jisCallDate", "jis_call_date", "timestamp"), 5) == "2025-12-31T08:00:00"
+
+def test_bulk_load_requires_postgresql(database):
+    rows = [{"manufacturerId": "BPNL000000000001", "manufacturerPartId": "part", "businessPartnerName": "customer", "partInstanceId": "SN-1"}]
+    with pytest.raises(ValueError, match="requires a PostgreSQL database"):
+        PartManagementService().load_instance_parts(InstancePartType.SERIALIZED_PART, rows)
+
+@pytest.mark.postgresql
+def test_jis_parts_are_loaded_into_the_partitions_of_their_call_dates(postgresql_schema):
+    with Session(postgresql_schema) as session:
+        session.execute(text(
+            "WITH le AS (INSERT INTO public.legal_entity (bpnl) VALUES ('BPNL000000000001') RETURNING id), "
+            "cp AS (INSERT INTO public.catalog_part (manufacturer_part_id, legal_entity_id, name) SELECT 'part', id, 'Part' FROM le RETURNING id), "
+            "bp AS (INSERT INTO public.business_partner (name, bpnl) VALUES ('customer', 'BPNL000000000002') RETURNING id) "
+            "INSERT INTO public.partner_catalog_part (business_partner_id, catalog_part_id) SELECT bp.id, cp.id FROM bp, cp"
+        ))
+        rows = [{"manufacturerId": "BPNL000000000001", "manufacturerPartId": "part", "businessPartnerName": "customer", "jisNumber": "JIS-1", "jisCallDate": "2024-02-10T06:00:00"},
+                {"manufacturerId": "BPNL000000000001", "manufacturerPartId": "part", "businessPartnerName": "customer", "jisNumber": "JIS-2"}]
+        loader = InstancePartLoader(session)
+        assert loader.stage(InstancePartType.JIS_PART, rows) == 2
+        assert loader.merge(InstancePartType.JIS_PART)["parts_created"] == 2
+        session.commit()
+
+        call_dates = dict(session.execute(text("SELECT jis_number, jis_call_date FROM public.jis_part")).all())
+        assert call_dates["JIS-1"] == datetime(2024, 2, 10, 6)
+        # Without call date, the part is called now
+        assert call_dates["JIS-2"].date() >= date.today().replace(day=1)
+        assert date(2024, 2, 1) in list_partitions(session.connection(), "jis_part")
@@ -0,0 +1,75 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.repositories import BaseRepository
+
+@pytest.fixture(params=["on-conflict", "fallback"])
+def repos(request, database, monkeypatch):
+    """A repository manager using INSERT ... ON CONFLICT of SQLite, or the portable fallback of the other dialects."""
+    if request.param == "fallback":
+        monkeypatch.setattr(BaseRepository, "_dialect_insert", lambda self: None)
+    with RepositoryManagerFactory.create() as repos:
+        yield repos
+
+def _partners(repos):
+    return {(partner.bpnl, partner.name) for partner in repos.business_partner_repository.find_all()}
+
+def test_bulk_insert_returns_ids_in_order_of_rows(repos):
+    ids = repos.business_partner_repository.bulk_insert(
+        [{"bpnl": f"BPNL{i:012d}", "name": f"partner-{i}"} for i in range(5)], batch_size=2)
+
+    assert len(ids) == 5
+    assert ids == sorted(ids)
+    assert repos.business_partner_repository.find_by_id(ids[3]).bpnl == "BPNL000000000003"
+
+def test_bulk_upsert_updates_existing_and_inserts_new_rows(repos):
+    repos.business_partner_repository.bulk_insert([{"bpnl": "BPNL000000000001", "name": "old"}])
+
+    result = repos.business_partner_repository.bulk_upsert([
+        {"bpnl": "BPNL000000000001", "name": "renamed"},
+        {"bpnl": "BPNL000000000002", "name": "new"},
+    ], conflict_columns=["bpnl"], update_columns=["name"], returning=["bpnl"])
+
+    assert sorted(result) == ["BPNL000000000001", "BPNL000000000002"]
+    assert _partners(repos) == {("BPNL000000000001", "renamed"), ("BPNL000000000002", "new")}
+
+def test_bulk_upsert_collapses_repeated_rows_last_wins(repos):
+    repos.business_partner_repository.bulk_upsert([
+        {"bpnl": "BPNL000000000001", "name": "first"},
+        {"bpnl": "BPNL000000000001", "name": "last"},
+    ], conflict_columns=["bpnl"], update_columns=["name"])
+
+    assert _partners(repos) == {("BPNL000000000001", "last")}
+
+def test_bulk_insert_ignore_skips_conflicting_rows(repos):
+    repos.business_partner_repository.bulk_insert([{"bpnl": "BPNL000000000001", "name": "existing"}])
+
+    inserted = repos.business_partner_repository.bulk_insert_ignore([
+        {"bpnl": "BPNL000000000001", "name": "duplicate"},
+        {"bpnl": "BPNL000000000002", "name": "new"},
+    ], conflict_columns=["bpnl"], returning=["bpnl"])
+
+    assert inserted == ["BPNL000000000002"]
+    assert _partners(repos) == {("BPNL000000000001", "existing"), ("BPNL000000000002", "new")}
@@ -0,0 +1,69 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from models.metadata_database.models import Material, Measurement, Unit
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def catalog_parts(database):
+    service = PartManagementService()
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="bracket", name="Bracket",
+        materials=[Material(name="aluminum", share=80), Material(name="steel", share=20)],
+        width=Measurement(value=5, unit=Unit.cm), weight=Measurement(value=250, unit=Unit.g)))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="axle", name="Axle",
+        materials=[Material(name="steel", share=100)],
+        width=Measurement(value=1.2, unit=Unit.m), weight=Measurement(value=12, unit=Unit.kg)))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="label", name="Label"))
+
+def list_catalog_parts(api, **params):
+    response = api.get("/part-management/catalog-part", params=params)
+    assert response.status_code == 200
+    return sorted(part["manufacturerPartId"] for part in response.json())
+
+def test_catalog_parts_are_filtered_by_material(api, catalog_parts):
+    assert list_catalog_parts(api, material="steel") == ["axle", "bracket"]
+    assert list_catalog_parts(api, material="steel", minMaterialShare=50) == ["axle"]
+    assert list_catalog_parts(api, material="aluminum", minMaterialShare=80) == ["bracket"]
+    assert list_catalog_parts(api, material="Steel") == []
+
+def test_catalog_parts_are_filtered_by_normalized_dimensions(api, catalog_parts):
+    # 5 cm = 50 mm and 1.2 m = 1200 mm, 250 g = 0.25 kg
+    assert list_catalog_parts(api, minWidth=40, maxWidth=60) == ["bracket"]
+    assert list_catalog_parts(api, minWidth=100) == ["axle"]
+    assert list_catalog_parts(api, maxWeight=1) == ["bracket"]
+    assert list_catalog_parts(api, minWeight=0.25, maxWidth=1200) == ["axle", "bracket"]
+
+def test_filters_are_combined_and_exclude_parts_without_values(api, catalog_parts):
+    assert list_catalog_parts(api) == ["axle", "bracket", "label"]
+    assert list_catalog_parts(api, material="steel", maxWeight=1) == ["bracket"]
+    assert list_catalog_parts(api, minWeight=0) == ["axle", "bracket"]
+
+def test_invalid_filter_values_are_rejected(api, catalog_parts):
+    response = api.get("/part-management/catalog-part", params={"minMaterialShare": 101})
+    assert response.status_code == 422
+    response = api.get("/part-management/catalog-part", params={"minWidth": -1})
+    assert response.status_code == 422
@@ -0,0 +1,84 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.models import PartnerCatalogPart
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+from tools.cursor_tools import NEXT_CURSOR_HEADER
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def catalog_parts(database):
+    service = PartManagementService()
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="infix", name="Front Brake"))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="exact", name="Brake"))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="prefix", name="Brake Disc"))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="category", name="Pad", category="Brakes"))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="customer", name="Wheel"))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="other", name="Mirror"))
+    with RepositoryManagerFactory.create() as repos:
+        business_partner, _ = repos.business_partner_repository.get_or_create("BPNL000000000002", "customer")
+        catalog_part = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, "customer")[0][0]
+        repos.partner_catalog_part_repository.create(PartnerCatalogPart(
+            business_partner_id=business_partner.id, customer_part_id="x-brake-9", catalog_part_id=catalog_part.id))
+        repos.commit()
+
+def search(api, **params):
+    response = api.get("/part-management/catalog-part/search", params=params)
+    assert response.status_code == 200
+    return [part["manufacturerPartId"] for part in response.json()], response.headers.get(NEXT_CURSOR_HEADER)
+
+def test_search_matches_name_category_and_customer_part_id_ranked(api, catalog_parts):
+    found, cursor = search(api, q="brake")
+    assert cursor is None
+    assert found[:2] == ["exact", "prefix"]
+    assert set(found[2:]) == {"infix", "category", "customer"}
+
+    found, _ = search(api, q="INFIX")
+    assert found == ["infix"]
+
+def test_search_treats_wildcards_literally(api, catalog_parts):
+    found, _ = search(api, q="%")
+    assert found == []
+
+    found, _ = search(api, q="br_ke")
+    assert found == []
+
+def test_search_is_paged_with_ranked_cursor(api, catalog_parts):
+    ranked, _ = search(api, q="brake")
+    listed = []
+    cursor = None
+    while True:
+        found, cursor = search(api, q="brake", limit=2, **({"cursor": cursor} if cursor else {}))
+        listed.extend(found)
+        if cursor is None:
+            break
+
+    assert listed == ranked
+
+def test_search_rejects_invalid_cursor_with_400(api, catalog_parts):
+    response = api.get("/part-management/catalog-part/search", params={"q": "brake", "cursor": "%%%"})
+    assert response.status_code == 400
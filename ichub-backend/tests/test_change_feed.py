@@ -0,0 +1,101 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+
+import pytest
+from sqlmodel import Session
+
+from managers.metadata_database import change_feed
+from managers.metadata_database.change_feed import MAX_NOTIFIED_KEYS, PROCESS_ID, _CHANGES, _dispatch_notification, dispatch, record_changes, register_change_listener
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.reference_cache import reference_data_cache
+from models.metadata_database.models import LegalEntity, Twin
+
+@pytest.fixture
+def listeners(monkeypatch):
+    monkeypatch.setattr(change_feed, "_listeners", [])
+    received = []
+    register_change_listener([LegalEntity, "twin"], lambda entity_type, keys: received.append((entity_type, keys)))
+    return received
+
+def test_flushed_and_core_writes_are_recorded_per_entity_type(database):
+    with Session(database) as session:
+        legal_entity = LegalEntity(bpnl="BPNL000000000001")
+        session.add(legal_entity)
+        session.flush()
+        record_changes(session, Twin, [1, 2])
+        record_changes(session, "twin", [2, 3])
+        assert session.info[_CHANGES] == {"legal_entity": {legal_entity.id}, "twin": {1, 2, 3}}
+
+        # Without keys, or with too many, any row of the type may have changed
+        record_changes(session, "twin")
+        record_changes(session, "twin", [4])
+        record_changes(session, "catalog_part", range(MAX_NOTIFIED_KEYS + 1))
+        assert session.info[_CHANGES]["twin"] is None
+        assert session.info[_CHANGES]["catalog_part"] is None
+
+        session.commit()
+        assert _CHANGES not in session.info
+
+def test_rolled_back_changes_are_discarded(database):
+    with Session(database) as session:
+        session.add(LegalEntity(bpnl="BPNL000000000001"))
+        session.flush()
+        assert "legal_entity" in session.info[_CHANGES]
+        session.rollback()
+        assert _CHANGES not in session.info
+
+        # Changes of a savepoint are kept until the end of the transaction
+        with session.begin_nested():
+            record_changes(session, "twin", [1])
+        assert session.info[_CHANGES] == {"twin": {1}}
+
+def test_changes_are_dispatched_to_the_listeners_of_their_type(listeners):
+    dispatch("legal_entity", [1])
+    dispatch("catalog_part", None)
+    dispatch("twin", None)
+    assert listeners == [("legal_entity", [1]), ("twin", None)]
+
+def test_failing_listener_does_not_stop_the_dispatch(listeners):
+    def fail(entity_type, keys):
+        raise RuntimeError("failed")
+    register_change_listener(["twin"], fail)
+    register_change_listener(["twin"], lambda entity_type, keys: listeners.append(("second", keys)))
+
+    dispatch("twin", [7])
+    assert listeners == [("twin", [7]), ("second", [7])]
+
+def test_only_notifications_of_other_processes_are_dispatched(listeners):
+    _dispatch_notification(json.dumps({"origin": PROCESS_ID, "type": "twin", "keys": [1]}))
+    _dispatch_notification("not json")
+    _dispatch_notification(json.dumps({"origin": "other", "type": "twin", "keys": [2]}))
+    assert listeners == [("twin", [2])]
+
+def test_notification_of_another_process_invalidates_the_reference_cache(database):
+    for _ in range(2):
+        with RepositoryManagerFactory.create() as repos:
+            repos.legal_entity_repository.get_or_create("BPNL000000000001")
+    assert reference_data_cache.snapshot()["entries"] > 0
+
+    _dispatch_notification(json.dumps({"origin": "other", "type": "legal_entity", "keys": None}))
+    assert reference_data_cache.snapshot()["entries"] == 0
@@ -0,0 +1,78 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+
+import pytest
+
+from database import query_statistics
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, Twin, TwinExchange
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+from services.twin_management_service import TwinManagementService
+from tools.export_tools import NDJSON_MEDIA_TYPE
+
+MANUFACTURER_ID = "BPNL000000000001"
+PARTS = [f"part-{i}" for i in range(5)]
+
+@pytest.fixture
+def catalog_parts(database):
+    """Five catalog parts with a twin each, the twins shared with one business partner."""
+    for manufacturer_part_id in PARTS:
+        PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=manufacturer_part_id, name="Part"))
+    with RepositoryManagerFactory.create() as repos:
+        business_partner = repos.business_partner_repository.create(BusinessPartner(name="partner", bpnl="BPNL000000000002"))
+        agreement = repos.data_exchange_agreement_repository.create(DataExchangeAgreement(name="default", business_partner=business_partner))
+        for db_catalog_part, _ in repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, None):
+            db_catalog_part.twin = repos.twin_repository.create(Twin())
+            repos.twin_exchange_repository.create(TwinExchange(twin=db_catalog_part.twin, data_exchange_agreement=agreement))
+
+def test_catalog_parts_are_exported_in_batches(catalog_parts):
+    batches = list(PartManagementService().export_catalog_parts(batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(part.manufacturer_part_id for batch in batches for part in batch) == PARTS
+
+def test_catalog_part_twins_are_exported_in_batches(catalog_parts):
+    batches = list(TwinManagementService().export_catalog_part_twins(include_data_exchange_agreements=True, batch_size=3))
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert all(twin.shares[0].business_partner.bpnl == "BPNL000000000002" for batch in batches for twin in batch)
+
+def test_export_statements_are_attributed_to_the_export(catalog_parts):
+    query_statistics.reset()
+    list(PartManagementService().export_catalog_parts(batch_size=2))
+    assert query_statistics.snapshot()["services"]["PartManagementService.export_catalog_parts"]["statements"] > 0
+
+def test_catalog_part_export_endpoint(api, catalog_parts):
+    response = api.get("/part-management/catalog-part/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+    lines = response.text.splitlines()
+    assert sorted(json.loads(line)["manufacturerPartId"] for line in lines) == PARTS
+
+def test_catalog_part_twin_export_endpoint(api, catalog_parts):
+    lines = api.get("/twin-management/catalog-part-twin/export", params={"include_data_exchange_agreements": True}).text.splitlines()
+    assert len(lines) == len(PARTS)
+    assert all(json.loads(line)["shares"] for line in lines)
+
+def test_export_of_an_empty_database(api, database):
+    assert api.get("/part-management/catalog-part/export").text == ""
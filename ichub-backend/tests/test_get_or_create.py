@@ -0,0 +1,65 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.repositories import BaseRepository
+
+@pytest.fixture(params=["on-conflict", "fallback"])
+def dialect_insert(request, database, monkeypatch):
+    """Use INSERT ... ON CONFLICT of SQLite, or the select-then-insert fallback of the other dialects."""
+    if request.param == "fallback":
+        monkeypatch.setattr(BaseRepository, "_dialect_insert", lambda self: None)
+    return request.param
+
+def test_get_or_create_creates_once_and_then_retrieves(dialect_insert):
+    with RepositoryManagerFactory.create() as repos:
+        legal_entity, created = repos.legal_entity_repository.get_or_create(bpnl="BPNL000000000001")
+        assert created
+        again, created_again = repos.legal_entity_repository.get_or_create(bpnl="BPNL000000000001")
+        assert not created_again
+        assert again.id == legal_entity.id
+
+def test_get_or_create_retrieves_row_committed_by_another_unit_of_work(dialect_insert):
+    with RepositoryManagerFactory.create() as repos:
+        business_partner, created = repos.business_partner_repository.get_or_create(bpnl="BPNL000000000001", name="partner")
+        assert created
+        business_partner_id = business_partner.id
+
+    with RepositoryManagerFactory.create() as repos:
+        # The given name only applies to a new business partner
+        existing, created = repos.business_partner_repository.get_or_create(bpnl="BPNL000000000001", name="other name")
+        assert not created
+        assert existing.id == business_partner_id
+        assert existing.name == "partner"
+        assert len(repos.business_partner_repository.find_all()) == 1
+
+def test_get_or_create_on_composite_natural_key(dialect_insert):
+    with RepositoryManagerFactory.create() as repos:
+        business_partner, _ = repos.business_partner_repository.get_or_create(bpnl="BPNL000000000001", name="partner")
+        agreement, created = repos.data_exchange_agreement_repository.get_or_create(business_partner_id=business_partner.id, name="Default")
+        other, created_other = repos.data_exchange_agreement_repository.get_or_create(business_partner_id=business_partner.id, name="Other")
+        again, created_again = repos.data_exchange_agreement_repository.get_or_create(business_partner_id=business_partner.id, name="Default")
+
+        assert created and created_other and not created_again
+        assert again.id == agreement.id != other.id
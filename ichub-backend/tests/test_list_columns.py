@@ -0,0 +1,81 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, inspect
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.repositories import LoadingProfile
+from models.metadata_database.models import Twin
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+from services.twin_management_service import TwinManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+WIDE_COLUMNS = {"description", "materials", "width", "height", "length", "weight"}
+
+@pytest.fixture
+def catalog_part(database):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part",
+        name="Part", category="category", description="A long description", materials=[{"name": "aluminum", "share": 20}]))
+    with RepositoryManagerFactory.create() as repos:
+        db_catalog_part, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, "part")[0]
+        db_catalog_part.twin = repos.twin_repository.create(Twin(additional_context="context"))
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+def test_list_profile_does_not_load_the_wide_columns(catalog_part):
+    with RepositoryManagerFactory.create() as repos:
+        db_catalog_part, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
+            MANUFACTURER_ID, "part", profile=LoadingProfile.LIST)[0]
+        assert WIDE_COLUMNS.intersection(inspect(db_catalog_part).mapper.column_attrs.keys()) <= inspect(db_catalog_part).unloaded
+
+        db_twin = repos.twin_repository.find_catalog_part_twins(manufacturer_id=MANUFACTURER_ID, profile=LoadingProfile.LIST)[0]
+        assert {"asset_class", "additional_context"} <= inspect(db_twin).unloaded
+        assert "description" in inspect(db_twin.catalog_part).unloaded
+
+def test_detail_profile_loads_full_rows(catalog_part):
+    with RepositoryManagerFactory.create() as repos:
+        db_catalog_part, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
+            MANUFACTURER_ID, "part", profile=LoadingProfile.DETAIL)[0]
+        assert not inspect(db_catalog_part).unloaded.intersection(inspect(db_catalog_part).mapper.column_attrs.keys())
+        assert db_catalog_part.description == "A long description"
+
+def test_listings_do_not_load_the_deferred_columns(catalog_part, database):
+    with count_statements(database) as statements:
+        parts = PartManagementService().get_simple_catalog_parts(MANUFACTURER_ID).items
+        twins = TwinManagementService().get_catalog_part_twins(manufacturer_id=MANUFACTURER_ID).items
+    assert [(part.manufacturer_part_id, part.name, part.category) for part in parts] == [("part", "Part", "category")]
+    assert [twin.manufacturer_part_id for twin in twins] == ["part"]
+    # Neither by the listing statements nor lazily by the mapping
+    assert not [statement for statement in statements if "catalog_part.description" in statement or "twin.additional_context" in statement]
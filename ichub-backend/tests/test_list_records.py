@@ -0,0 +1,93 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+
+import pytest
+
+from managers.metadata_database.manager import AsyncRepositoryManagerFactory, RepositoryManagerFactory
+from managers.metadata_database.repositories import CatalogPartListRecord, LoadingProfile
+from models.metadata_database.models import Material
+from models.services.part_management import CatalogPartCreate, CatalogPartFilter
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def catalog_parts(database):
+    service = PartManagementService()
+    for i in range(5):
+        service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=f"part-{i}", name=f"Bracket {i}",
+            category="brackets" if i % 2 else None, materials=[Material(name="steel", share=20 * i)]))
+    service.create_catalog_part(CatalogPartCreate(manufacturerId="BPNL000000000002", manufacturerPartId="other", name="Axle"))
+
+def orm_rows(**criteria):
+    """The rows of the ORM listing in the shape of list records."""
+    with RepositoryManagerFactory.create() as repos:
+        return [CatalogPartListRecord(db_catalog_part.id, db_catalog_part.legal_entity.bpnl, db_catalog_part.manufacturer_part_id,
+                db_catalog_part.name, db_catalog_part.category, db_catalog_part.bpns, status)
+            for db_catalog_part, status in repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
+                profile=LoadingProfile.LIST, **criteria)]
+
+def list_records(**criteria):
+    with RepositoryManagerFactory.create() as repos:
+        return repos.catalog_part_repository.find_list_records(**criteria)
+
+@pytest.mark.parametrize("criteria", [
+    {"manufacturer_id": None, "manufacturer_part_id": None},
+    {"manufacturer_id": MANUFACTURER_ID, "manufacturer_part_id": None},
+    {"manufacturer_id": MANUFACTURER_ID, "manufacturer_part_id": "part-3"},
+    {"manufacturer_id": None, "manufacturer_part_id": None, "limit": 2},
+    {"manufacturer_id": None, "manufacturer_part_id": None, "status": 0},
+    {"manufacturer_id": None, "manufacturer_part_id": None, "filters": CatalogPartFilter(material="steel", minMaterialShare=40)},
+])
+def test_list_records_match_the_orm_listing(catalog_parts, criteria):
+    records = list_records(**criteria)
+    assert records and all(type(record) is CatalogPartListRecord for record in records)
+    assert records == orm_rows(**criteria)
+
+def test_list_records_are_paginated_by_id(catalog_parts):
+    first = list_records(limit=3)
+    second = list_records(after_id=first[-1].id, limit=3)
+    assert [record.manufacturer_part_id for record in first + second] == [f"part-{i}" for i in range(5)] + ["other"]
+
+def test_async_list_records(catalog_parts):
+    async def read():
+        async with AsyncRepositoryManagerFactory.create() as repos:
+            return await repos.catalog_part_repository.find_list_records(MANUFACTURER_ID, limit=4)
+    assert asyncio.run(read()) == list_records(manufacturer_id=MANUFACTURER_ID, limit=4)
+
+def test_search_list_records_carry_their_score(catalog_parts):
+    with RepositoryManagerFactory.create() as repos:
+        records = repos.catalog_part_repository.search_list_records("bracket", limit=10)
+        orm = repos.catalog_part_repository.search("bracket", limit=10)
+    assert [record.id for record in records] == [db_catalog_part.id for db_catalog_part, _, _ in orm]
+    assert [record.score for record in records] == [score for _, _, score in orm]
+    assert all(record.score is not None for record in records)
+
+def test_listing_responses_are_mapped_from_the_records(api, catalog_parts):
+    response = api.get("/part-management/catalog-part", params={"manufacturerId": MANUFACTURER_ID, "limit": 2})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"manufacturerId": MANUFACTURER_ID, "manufacturerPartId": "part-0", "name": "Bracket 0", "category": None, "bpns": None, "status": 0},
+        {"manufacturerId": MANUFACTURER_ID, "manufacturerPartId": "part-1", "name": "Bracket 1", "category": "brackets", "bpns": None, "status": 0},
+    ]
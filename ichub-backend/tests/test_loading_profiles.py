@@ -0,0 +1,110 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, inspect
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.repositories import LoadingProfile
+from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, PartnerCatalogPart, Twin, TwinExchange
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+from services.twin_management_service import TwinManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def create_catalog_parts(database):
+    """Create catalog parts, each with a twin shared with and mapped to the same two business partners."""
+    created = []
+
+    def create(count: int):
+        service = PartManagementService()
+        for i in range(len(created), len(created) + count):
+            service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=f"part-{i}", name=f"Part {i}"))
+            created.append(f"part-{i}")
+        with RepositoryManagerFactory.create() as repos:
+            agreements = repos.data_exchange_agreement_repository.find_all()
+            if not agreements:
+                for i in range(2):
+                    business_partner = repos.business_partner_repository.create(BusinessPartner(name=f"partner-{i}", bpnl=f"BPNL00000000000{i + 2}"))
+                    agreements.append(repos.data_exchange_agreement_repository.create(DataExchangeAgreement(name=f"agreement-{i}", business_partner=business_partner)))
+            for manufacturer_part_id in created[-count:]:
+                db_catalog_part, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, manufacturer_part_id)[0]
+                db_twin = repos.twin_repository.create(Twin())
+                db_catalog_part.twin = db_twin
+                for agreement in agreements:
+                    repos.partner_catalog_part_repository.create(PartnerCatalogPart(
+                        business_partner=agreement.business_partner, customer_part_id=f"{agreement.name}-{manufacturer_part_id}", catalog_part=db_catalog_part))
+                    repos.twin_exchange_repository.create(TwinExchange(twin=db_twin, data_exchange_agreement=agreement))
+
+    return create
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+def statements_of(engine, read):
+    with count_statements(engine) as statements:
+        read()
+    return len(statements)
+
+@pytest.mark.parametrize("read", [
+    lambda: PartManagementService().get_simple_catalog_parts(),
+    lambda: PartManagementService().get_catalog_parts(),
+    lambda: TwinManagementService().get_catalog_part_twins(),
+    lambda: TwinManagementService().get_catalog_part_twins(include_data_exchange_agreements=True),
+], ids=["simple catalog parts", "catalog parts", "twins", "twins with shares"])
+def test_listing_takes_a_constant_number_of_statements(database, create_catalog_parts, read):
+    create_catalog_parts(1)
+    one_part = statements_of(database, read)
+
+    create_catalog_parts(4)
+    assert statements_of(database, read) == one_part
+
+def test_mappings_read_only_loaded_relationships(create_catalog_parts):
+    create_catalog_parts(2)
+    page = TwinManagementService().get_catalog_part_twins(include_data_exchange_agreements=True)
+    assert [twin.manufacturer_part_id for twin in page.items] == ["part-0", "part-1"]
+    assert page.items[0].customer_part_ids.keys() == {"agreement-0-part-0", "agreement-1-part-0"}
+    assert [share.business_partner.bpnl for share in page.items[0].shares] == ["BPNL000000000002", "BPNL000000000003"]
+
+def test_profiles_load_only_their_relationships(create_catalog_parts):
+    create_catalog_parts(1)
+    with RepositoryManagerFactory.create() as repos:
+        listed, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, "part-0", profile=LoadingProfile.LIST)[0]
+        assert {"partner_catalog_parts", "twin"} <= inspect(listed).unloaded
+        assert "legal_entity" not in inspect(listed).unloaded
+
+    with RepositoryManagerFactory.create() as repos:
+        shared, _ = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, "part-0", profile=LoadingProfile.SHARE)[0]
+        assert not {"legal_entity", "partner_catalog_parts", "twin"} & inspect(shared).unloaded
+        assert "business_partner" not in inspect(shared.partner_catalog_parts[0]).unloaded
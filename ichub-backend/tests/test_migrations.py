@@ -0,0 +1,110 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import os
+import re
+
+import pytest
+from sqlalchemy import text
+
+from managers.metadata_database.migrations import (
+    BASELINE_VERSION, Migration, _prepare_history, applied_migrations, apply_migrations, check_server_version, load_migrations,
+)
+
+DDL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "docs", "database", "Metadata-DDL-public.sql")
+
+def test_migrations_are_loaded_in_the_order_of_their_versions(tmp_path):
+    (tmp_path / "0010_later_change.sql").write_text("SELECT 10;")
+    (tmp_path / "0002_indexes.sql").write_text("SELECT 2;")
+    (tmp_path / "0001_baseline.sql").write_text("")
+
+    migrations = load_migrations(tmp_path)
+    assert [(migration.version, migration.description) for migration in migrations] == [(1, "baseline"), (2, "indexes"), (10, "later change")]
+    # The checksum does not depend on the line endings of the checkout
+    assert Migration(2, "indexes", "SELECT 2;\r\n").checksum == Migration(2, "indexes", "SELECT 2;\n").checksum
+
+def test_invalid_migration_scripts_are_rejected(tmp_path):
+    (tmp_path / "indexes.sql").write_text("SELECT 1;")
+    with pytest.raises(ValueError, match="Invalid name of the migration script indexes.sql"):
+        load_migrations(tmp_path)
+
+    (tmp_path / "indexes.sql").unlink()
+    (tmp_path / "0002_indexes.sql").write_text("SELECT 1;")
+    (tmp_path / "002_other_indexes.sql").write_text("SELECT 2;")
+    with pytest.raises(ValueError, match="Several migration scripts have the version 2"):
+        load_migrations(tmp_path)
+
+def test_ddl_records_the_checksums_of_all_migrations():
+    with open(DDL_PATH, encoding="utf-8") as ddl:
+        recorded = {int(version): (description, checksum)
+            for version, description, checksum in re.findall(r"\((\d+), '([^']*)', '([0-9a-f]{64})'\)", ddl.read())}
+
+    migrations = load_migrations()
+    assert [migration.version for migration in migrations] == list(range(1, len(migrations) + 1))
+    assert recorded == {migration.version: (migration.description, migration.checksum) for migration in migrations}
+
+def test_migrations_are_skipped_on_sqlite(database):
+    assert apply_migrations(database) == []
+    check_server_version(database)
+
+@pytest.mark.postgresql
+def test_database_without_schema_is_not_migrated(postgresql, caplog):
+    with postgresql.connect() as connection:
+        assert _prepare_history(connection, load_migrations()) is None
+    with caplog.at_level(logging.WARNING):
+        assert apply_migrations(postgresql) == []
+    assert "has no schema yet" in caplog.text
+
+@pytest.mark.postgresql
+def test_database_created_from_the_ddl_is_up_to_date(postgresql_schema):
+    check_server_version(postgresql_schema)
+    assert apply_migrations(postgresql_schema) == []
+
+@pytest.mark.postgresql
+def test_database_created_before_the_migrations_is_recorded_at_the_baseline(postgresql_schema):
+    with postgresql_schema.begin() as connection:
+        connection.execute(text("DROP TABLE public.schema_migration"))
+
+    migrations = load_migrations()
+    with postgresql_schema.connect() as connection:
+        assert _prepare_history(connection, migrations) == {BASELINE_VERSION: migrations[0].checksum}
+    # The index pack is idempotent, the indexes of the DDL are kept
+    assert apply_migrations(postgresql_schema, target_version=2) == [2]
+
+    with postgresql_schema.connect() as connection:
+        assert applied_migrations(connection) == {migration.version: migration.checksum for migration in migrations[:2]}
+
+@pytest.mark.postgresql
+def test_changed_scripts_of_applied_migrations_are_not_applied_again(postgresql_schema, caplog):
+    with postgresql_schema.begin() as connection:
+        connection.execute(text("UPDATE public.schema_migration SET checksum = 'changed' WHERE version = 2"))
+    with caplog.at_level(logging.WARNING):
+        assert apply_migrations(postgresql_schema) == []
+    assert "The script of the applied migration 2 (performance indexes) has been changed since." in caplog.text
+
+@pytest.mark.postgresql
+def test_migrations_up_to_a_target_version(postgresql_schema):
+    with postgresql_schema.begin() as connection:
+        connection.execute(text("DELETE FROM public.schema_migration WHERE version = 2"))
+    assert apply_migrations(postgresql_schema, target_version=1) == []
+    assert apply_migrations(postgresql_schema, target_version=2) == [2]
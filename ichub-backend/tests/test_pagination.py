@@ -0,0 +1,84 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+from tools.cursor_tools import NEXT_CURSOR_HEADER, decode_id_cursor, encode_cursor, split_page
+from tools.exceptions import InvalidCursorError
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def catalog_parts(database):
+    service = PartManagementService()
+    manufacturer_part_ids = [f"part-{i}" for i in range(5)]
+    for manufacturer_part_id in manufacturer_part_ids:
+        service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=manufacturer_part_id, name=manufacturer_part_id))
+    return manufacturer_part_ids
+
+def test_split_page_returns_cursor_of_last_row_only_if_more_rows():
+    page, cursor = split_page([1, 2, 3], 2, key=lambda row: row)
+    assert page == [1, 2]
+    assert decode_id_cursor(cursor) == 2
+
+    page, cursor = split_page([1, 2], 2, key=lambda row: row)
+    assert page == [1, 2]
+    assert cursor is None
+
+def test_decode_id_cursor_rejects_malformed_cursors():
+    assert decode_id_cursor(None) is None
+    assert decode_id_cursor(encode_cursor(42)) == 42
+    with pytest.raises(InvalidCursorError):
+        decode_id_cursor("not a cursor")
+    with pytest.raises(InvalidCursorError):
+        decode_id_cursor(encode_cursor("42"))
+
+def test_catalog_parts_are_paged_with_next_cursor_header(api, catalog_parts):
+    listed = []
+    cursor = None
+    pages = 0
+    while True:
+        response = api.get("/part-management/catalog-part", params={"limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages += 1
+        listed.extend(part["manufacturerPartId"] for part in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert listed == catalog_parts
+
+def test_catalog_parts_last_page_has_no_next_cursor(api, catalog_parts):
+    response = api.get("/part-management/catalog-part", params={"limit": len(catalog_parts)})
+    assert response.status_code == 200
+    assert len(response.json()) == len(catalog_parts)
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+def test_invalid_cursor_is_rejected_with_400(api, catalog_parts):
+    response = api.get("/part-management/catalog-part", params={"cursor": "%%%"})
+    assert response.status_code == 400
+
+    response = api.get("/partner-management/business-partner", params={"cursor": encode_cursor("not an id")})
+    assert response.status_code == 400
@@ -0,0 +1,138 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from managers.metadata_database.migrations import apply_migrations
+from managers.metadata_database.partitioning import (
+    add_months, create_partitions, drop_partitions, list_partitions, maintain_partitions, month_start, partition_name,
+)
+
+def test_month_arithmetic():
+    assert month_start(date(2025, 3, 31)) == date(2025, 3, 1)
+    assert add_months(date(2025, 11, 1), 2) == date(2026, 1, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert add_months(date(2025, 6, 1), -18) == date(2023, 12, 1)
+    assert partition_name("serialized_part", date(2025, 4, 1)) == "serialized_part_2025_04"
+
+def test_only_partitioned_tables_are_accepted(database):
+    with database.connect() as connection:
+        with pytest.raises(ValueError):
+            create_partitions(connection, "catalog_part; DROP TABLE twin", [date(2025, 1, 1)])
+
+def test_partitioning_is_skipped_on_sqlite(database):
+    with database.connect() as connection:
+        assert create_partitions(connection, "serialized_part", [date(2025, 1, 1)]) == []
+    assert maintain_partitions(database) == {}
+
+@pytest.fixture
+def partner_catalog_part_id(postgresql_schema):
+    with postgresql_schema.begin() as connection:
+        return connection.execute(text(
+            "WITH le AS (INSERT INTO public.legal_entity (bpnl) VALUES ('BPNL000000000001') RETURNING id), "
+            "cp AS (INSERT INTO public.catalog_part (manufacturer_part_id, legal_entity_id, name) SELECT 'part', id, 'Part' FROM le RETURNING id), "
+            "bp AS (INSERT INTO public.business_partner (name, bpnl) VALUES ('customer', 'BPNL000000000002') RETURNING id) "
+            "INSERT INTO public.partner_catalog_part (business_partner_id, catalog_part_id) SELECT bp.id, cp.id FROM bp, cp RETURNING id"
+        )).scalar_one()
+
+def insert_jis_part(connection, partner_catalog_part_id: int, jis_number: str, jis_call_date: datetime) -> int:
+    return connection.execute(text(
+        "INSERT INTO public.jis_part (partner_catalog_part_id, jis_number, jis_call_date) VALUES (:owner, :jis_number, :jis_call_date) RETURNING id"
+    ), {"owner": partner_catalog_part_id, "jis_number": jis_number, "jis_call_date": jis_call_date}).scalar_one()
+
+@pytest.mark.postgresql
+def test_partitions_are_created_for_the_months_of_the_jis_call_dates(postgresql_schema, partner_catalog_part_id):
+    with postgresql_schema.begin() as connection:
+        assert create_partitions(connection, "jis_part", [date(2025, 1, 15), date(2025, 1, 31), date(2025, 3, 1)]) == ["jis_part_2025_01", "jis_part_2025_03"]
+        assert create_partitions(connection, "jis_part", [date(2025, 1, 1)]) == []
+        assert {date(2025, 1, 1), date(2025, 3, 1)} <= set(list_partitions(connection, "jis_part"))
+
+        insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 1, 20, 8))
+        assert connection.execute(text("SELECT count(*) FROM public.jis_part_2025_01")).scalar_one() == 1
+        # No default partition: a call date without partition is rejected instead of being stored aside
+        with pytest.raises(IntegrityError, match="no partition of relation"):
+            with connection.begin_nested():
+                insert_jis_part(connection, partner_catalog_part_id, "JIS-2", datetime(2025, 2, 3))
+
+@pytest.mark.postgresql
+def test_keys_are_unique_across_the_partitions(postgresql_schema, partner_catalog_part_id):
+    with postgresql_schema.begin() as connection:
+        create_partitions(connection, "jis_part", [date(2025, 1, 1), date(2025, 2, 1)])
+        jis_part_id = insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 1, 20))
+        with pytest.raises(IntegrityError, match="pk_jis_part_key"):
+            with connection.begin_nested():
+                insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 2, 20))
+
+        # A renamed part releases its previous key
+        connection.execute(text("UPDATE public.jis_part SET jis_number = 'JIS-2' WHERE id = :id"), {"id": jis_part_id})
+        other_jis_part_id = insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 2, 20))
+        assert connection.execute(text("SELECT jis_number, jis_part_id FROM public.jis_part_key ORDER BY jis_number")).all() == [
+            ("JIS-1", other_jis_part_id), ("JIS-2", jis_part_id)]
+
+@pytest.mark.postgresql
+def test_expired_partitions_are_detached_and_dropped_with_their_keys(postgresql_schema, partner_catalog_part_id):
+    with postgresql_schema.begin() as connection:
+        create_partitions(connection, "jis_part", [date(2025, 1, 1), date(2025, 2, 1)])
+        insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 1, 20))
+        insert_jis_part(connection, partner_catalog_part_id, "JIS-2", datetime(2025, 2, 20))
+
+    with postgresql_schema.connect() as connection:
+        # DETACH PARTITION ... CONCURRENTLY is refused within a transaction
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        assert drop_partitions(connection, "jis_part", date(2025, 2, 1)) == ["jis_part_2025_01"]
+        assert date(2025, 1, 1) not in list_partitions(connection, "jis_part")
+        assert connection.execute(text("SELECT to_regclass('public.jis_part_2025_01')")).scalar() is None
+        assert connection.execute(text("SELECT jis_number FROM public.jis_part_key")).scalars().all() == ["JIS-2"]
+
+    # The key of a dropped part can be used again
+    with postgresql_schema.begin() as connection:
+        create_partitions(connection, "jis_part", [date(2025, 1, 1)])
+        insert_jis_part(connection, partner_catalog_part_id, "JIS-1", datetime(2025, 1, 21))
+
+@pytest.mark.postgresql
+def test_migration_keeps_the_jis_call_dates(postgresql_schema, partner_catalog_part_id):
+    # The JIS parts and key tables as before the migration 0003 (not partitioned, optional call date)
+    with postgresql_schema.begin() as connection:
+        connection.execute(text(
+            "DROP TABLE public.jis_part, public.jis_part_key, public.serialized_part_key; "
+            "DROP FUNCTION public.maintain_jis_part_key(), public.maintain_serialized_part_key() CASCADE; "
+            "DELETE FROM public.schema_migration WHERE version = 3; "
+            "CREATE TABLE public.jis_part (id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY, partner_catalog_part_id integer NOT NULL, "
+            "jis_number character varying NOT NULL, parent_order_number character varying, jis_call_date timestamp without time zone, twin_id integer)"
+        ))
+        twin_created_date = connection.execute(text("INSERT INTO public.twin (created_date) VALUES ('2024-11-05 10:00') RETURNING created_date")).scalar_one()
+        connection.execute(text(
+            "INSERT INTO public.jis_part (partner_catalog_part_id, jis_number, jis_call_date, twin_id) VALUES "
+            "(:owner, 'JIS-1', '2024-06-30 23:00', NULL), (:owner, 'JIS-2', NULL, (SELECT max(id) FROM public.twin))"
+        ), {"owner": partner_catalog_part_id})
+
+    assert apply_migrations(postgresql_schema) == [3]
+
+    with postgresql_schema.connect() as connection:
+        assert connection.execute(text("SELECT jis_number, jis_call_date FROM public.jis_part ORDER BY jis_number")).all() == [
+            ("JIS-1", datetime(2024, 6, 30, 23)), ("JIS-2", twin_created_date)]
+        assert {date(2024, 6, 1), date(2024, 11, 1)} <= set(list_partitions(connection, "jis_part"))
+        assert connection.execute(text("SELECT count(*) FROM public.jis_part_key WHERE jis_part_id IS NOT NULL")).scalar_one() == 2
@@ -0,0 +1,113 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from managers.metadata_database.manager import AsyncRepositoryManagerFactory, RepositoryManagerFactory
+from models.metadata_database.models import (
+    BusinessPartner,
+    DataExchangeAgreement,
+    EnablementServiceStack,
+    LegalEntity,
+    Twin,
+    TwinAspect,
+    TwinAspectRegistration,
+    TwinExchange,
+    TwinRegistration,
+)
+
+@pytest.fixture
+def keys(database):
+    """Two of each entity, so that the lookups have to tell them apart by their parameters."""
+    keys = []
+    with RepositoryManagerFactory.create() as repos:
+        for i in range(2):
+            legal_entity = repos.legal_entity_repository.create(LegalEntity(bpnl=f"BPNL00000000000{i}"))
+            business_partner = repos.business_partner_repository.create(BusinessPartner(name=f"partner-{i}", bpnl=f"BPNL00000000010{i}"))
+            twin = repos.twin_repository.create(Twin(global_id=uuid4(), dtr_aas_id=uuid4()))
+            repos.flush()
+            agreement = repos.data_exchange_agreement_repository.create(DataExchangeAgreement(name="default", business_partner_id=business_partner.id))
+            stack = repos.enablement_service_stack_repository.create(EnablementServiceStack(name=f"stack-{i}", legal_entity_id=legal_entity.id))
+            aspect = repos.twin_aspect_repository.create(TwinAspect(twin_id=twin.id, semantic_id=f"urn:test#Aspect{i}"))
+            repos.flush()
+            repos.twin_exchange_repository.create(TwinExchange(twin_id=twin.id, data_exchange_agreement_id=agreement.id))
+            repos.twin_registration_repository.create(TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id))
+            repos.twin_aspect_registration_repository.create(TwinAspectRegistration(twin_aspect_id=aspect.id, enablement_service_stack_id=stack.id))
+            keys.append({"bpnl": legal_entity.bpnl, "partner_bpnl": business_partner.bpnl, "global_id": twin.global_id, "twin_id": twin.id,
+                         "semantic_id": aspect.semantic_id, "aspect_id": aspect.id, "dea_id": agreement.id, "ess_id": stack.id})
+    return keys
+
+def lookups(repos, k):
+    """The results of the lookups with pre-built statements, as comparable keys."""
+    return {
+        "legal entity": repos.legal_entity_repository.get_by_bpnl(k["bpnl"]).id,
+        "business partner": repos.business_partner_repository.get_by_bpnl(k["partner_bpnl"]).name,
+        "twin": repos.twin_repository.find_by_global_id(k["global_id"]).id,
+        "twin aspect": repos.twin_aspect_repository.get_by_twin_id_semantic_id(k["twin_id"], k["semantic_id"]).id,
+        "twin exchange": repos.twin_exchange_repository.get_by_twin_id_data_exchange_agreement_id(k["twin_id"], k["dea_id"]).twin_id,
+        "twin registration": repos.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(k["twin_id"], k["ess_id"]).twin_id,
+        "twin aspect registration": repos.twin_aspect_registration_repository.get_by_twin_aspect_id_enablement_service_stack_id(
+            k["aspect_id"], k["ess_id"]).twin_aspect_id,
+    }
+
+async def lookups_async(repos, k):
+    return {
+        "legal entity": (await repos.legal_entity_repository.get_by_bpnl(k["bpnl"])).id,
+        "business partner": (await repos.business_partner_repository.get_by_bpnl(k["partner_bpnl"])).name,
+        "twin": (await repos.twin_repository.find_by_global_id(k["global_id"])).id,
+        "twin aspect": (await repos.twin_aspect_repository.get_by_twin_id_semantic_id(k["twin_id"], k["semantic_id"])).id,
+        "twin exchange": (await repos.twin_exchange_repository.get_by_twin_id_data_exchange_agreement_id(k["twin_id"], k["dea_id"])).twin_id,
+        "twin registration": (await repos.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(k["twin_id"], k["ess_id"])).twin_id,
+        "twin aspect registration": (await repos.twin_aspect_registration_repository.get_by_twin_aspect_id_enablement_service_stack_id(
+            k["aspect_id"], k["ess_id"])).twin_aspect_id,
+    }
+
+def test_lookups_bind_their_parameters(keys):
+    with RepositoryManagerFactory.create() as repos:
+        results = [lookups(repos, k) for k in keys]
+    assert results[0] != results[1]
+    assert results[0]["business partner"] == "partner-0"
+    assert results[1]["business partner"] == "partner-1"
+
+def test_async_lookups_share_the_statements(keys):
+    async def read():
+        async with AsyncRepositoryManagerFactory.create() as repos:
+            return [await lookups_async(repos, k) for k in keys]
+
+    with RepositoryManagerFactory.create() as repos:
+        assert asyncio.run(read()) == [lookups(repos, k) for k in keys]
+
+def test_lookups_of_unknown_keys(keys):
+    with RepositoryManagerFactory.create() as repos:
+        assert repos.legal_entity_repository.get_by_bpnl("BPNL000000000999") is None
+        assert repos.twin_repository.find_by_global_id(uuid4()) is None
+        assert repos.twin_aspect_repository.get_by_twin_id_semantic_id(keys[0]["twin_id"], keys[1]["semantic_id"]) is None
+        assert repos.twin_exchange_repository.get_by_twin_id_data_exchange_agreement_id(keys[0]["twin_id"], keys[1]["dea_id"]) is None
+
+def test_twin_aspect_lookup_with_registrations(keys):
+    with RepositoryManagerFactory.create() as repos:
+        aspect = repos.twin_aspect_repository.get_by_twin_id_semantic_id(keys[1]["twin_id"], keys[1]["semantic_id"], include_registrations=True)
+        assert "twin_aspect_registrations" in aspect.__dict__
+        assert [registration.enablement_service_stack_id for registration in aspect.twin_aspect_registrations] == [keys[1]["ess_id"]]
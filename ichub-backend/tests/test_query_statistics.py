@@ -0,0 +1,55 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import database as database_module
+from database import query_statistics
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+def test_statements_are_attributed_to_the_service_method(database):
+    query_statistics.reset()
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part", name="Part"))
+
+    statistics = query_statistics.snapshot()
+    assert statistics["services"]["PartManagementService.create_catalog_part"]["statements"] == statistics["statements"] > 0
+
+def test_statements_are_attributed_to_the_route_of_the_request(api):
+    for manufacturer_part_id in ("part-1", "part-2"):
+        PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=manufacturer_part_id, name="Part"))
+    query_statistics.reset()
+    for manufacturer_part_id in ("part-1", "part-2"):
+        assert api.get(f"/part-management/catalog-part/{MANUFACTURER_ID}/{manufacturer_part_id}").status_code == 200
+
+    requests = api.get("/health/database-queries").json()["requests"]
+    endpoint = requests["GET /part-management/catalog-part/{manufacturer_id}/{manufacturer_part_id}"]
+    assert endpoint["requests"] == 2
+    assert endpoint["statements"] == 2 * endpoint["statementsPerRequestMax"] > 0
+
+def test_slow_statements_are_counted(database, monkeypatch):
+    query_statistics.reset()
+    monkeypatch.setattr(database_module, "slow_query_threshold", 1e-9)
+    PartManagementService().get_catalog_parts(MANUFACTURER_ID)
+
+    statistics = query_statistics.snapshot()
+    assert statistics["slowStatements"] == statistics["statements"] > 0
@@ -0,0 +1,113 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+from sqlmodel import SQLModel
+
+import database as database_module
+from database import Replica, ReplicaRouter, db_pool_config
+from managers.metadata_database.manager import AsyncRepositoryManagerFactory, RepositoryManagerFactory
+from models.metadata_database.models import LegalEntity
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+def create_replica(lag=0.0) -> Replica:
+    """A replica on its own SQLite database with a fixed replication lag."""
+    replica = Replica(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ichub-replica-'), 'metadata.db')}", db_pool_config)
+    SQLModel.metadata.create_all(replica.engine)
+    replica.lag = lag
+    # Keep the lag of the test instead of checking it in the background
+    replica.check_lag = lambda: None
+    return replica
+
+@pytest.fixture
+def replica(database, monkeypatch):
+    replica = create_replica()
+    monkeypatch.setattr(database_module, "replica_router", ReplicaRouter([replica]))
+    return replica
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError, match="Unknown database replica strategy"):
+        ReplicaRouter([], strategy="random")
+
+def test_round_robin_alternates_between_the_fresh_replicas():
+    replicas = [create_replica(), create_replica(), create_replica()]
+    router = ReplicaRouter(replicas)
+    assert [router.select() for _ in range(6)] == replicas + replicas
+
+def test_least_loaded_chooses_the_replica_with_the_fewest_checked_out_connections():
+    busy, idle = create_replica(), create_replica()
+    router = ReplicaRouter([busy, idle], strategy="leastLoaded")
+    with busy.engine.connect():
+        assert router.select() is idle
+    with idle.engine.connect():
+        assert router.select() is busy
+
+def test_lagging_and_unreachable_replicas_are_skipped():
+    fresh, lagging, unknown = create_replica(lag=1), create_replica(lag=60), create_replica(lag=None)
+    router = ReplicaRouter([lagging, fresh, unknown], max_lag=10)
+    assert {router.select() for _ in range(4)} == {fresh}
+
+    fresh.lag = 11
+    assert router.select() is None
+
+def test_lag_check_of_a_sqlite_replica():
+    replica = Replica(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ichub-replica-'), 'metadata.db')}", db_pool_config)
+    assert replica.lag is None
+    ReplicaRouter([replica]).check_lag()
+    assert replica.lag == 0.0
+    assert replica.snapshot()["lagSeconds"] == 0.0
+
+def test_reads_use_the_replica(replica):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="primary-part", name="Part"))
+
+    # The replica has not (yet) received the part written to the primary
+    assert PartManagementService().get_catalog_parts(MANUFACTURER_ID).items == []
+    assert asyncio.run(PartManagementService().get_catalog_parts_async(MANUFACTURER_ID)).items == []
+
+def test_reads_fall_back_to_the_primary_without_a_fresh_replica(replica):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="primary-part", name="Part"))
+    replica.lag = None
+
+    assert [part.manufacturer_part_id for part in PartManagementService().get_catalog_parts(MANUFACTURER_ID).items] == ["primary-part"]
+
+def test_read_only_repository_managers_refuse_writes(database):
+    with pytest.raises(RuntimeError, match="read-only"):
+        with RepositoryManagerFactory.create(read_only=True) as repos:
+            repos.legal_entity_repository.create(LegalEntity(bpnl=MANUFACTURER_ID))
+            repos.commit()
+
+    async def write_async():
+        async with AsyncRepositoryManagerFactory.create(read_only=True) as repos:
+            repos.legal_entity_repository.create(LegalEntity(bpnl=MANUFACTURER_ID))
+            await repos.commit()
+    with pytest.raises(RuntimeError, match="read-only"):
+        asyncio.run(write_async())
+
+    with RepositoryManagerFactory.create() as repos:
+        assert repos.legal_entity_repository.get_by_bpnl(MANUFACTURER_ID) is None
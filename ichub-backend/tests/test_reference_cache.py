@@ -0,0 +1,135 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from managers.metadata_database.manager import AsyncRepositoryManagerFactory, RepositoryManagerFactory
+from managers.metadata_database.reference_cache import reference_data_cache
+from models.metadata_database.models import BusinessPartner
+
+PARTNER_BPNL = "BPNL000000000002"
+
+@pytest.fixture
+def business_partner(database):
+    with RepositoryManagerFactory.create() as repos:
+        repos.business_partner_repository.create(BusinessPartner(name="partner", bpnl=PARTNER_BPNL))
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+def partner_name(bpnl=PARTNER_BPNL):
+    with RepositoryManagerFactory.create() as repos:
+        business_partner = repos.business_partner_repository.get_by_bpnl(bpnl)
+        return business_partner.name if business_partner else None
+
+def test_committed_lookups_are_served_from_the_cache(business_partner, database):
+    assert partner_name() == "partner"
+    with count_statements(database) as statements:
+        assert partner_name() == "partner"
+    assert statements == []
+
+    statistics = reference_data_cache.snapshot()["models"]["BusinessPartner"]
+    assert (statistics["hits"], statistics["misses"]) >= (1, 1)
+
+def test_async_lookups_use_the_cache(business_partner, database):
+    assert partner_name() == "partner"
+
+    async def read():
+        async with AsyncRepositoryManagerFactory.create() as repos:
+            return (await repos.business_partner_repository.get_by_bpnl(PARTNER_BPNL)).name
+    assert asyncio.run(read()) == "partner"
+
+def test_lookups_are_only_published_on_commit(business_partner, database):
+    with RepositoryManagerFactory.create() as repos:
+        assert repos.business_partner_repository.get_by_bpnl(PARTNER_BPNL).name == "partner"
+        # Staged for the transaction, but not visible to other sessions before the commit
+        assert reference_data_cache.snapshot()["entries"] == 0
+        repos.rollback()
+    assert reference_data_cache.snapshot()["entries"] == 0
+
+    partner_name()
+    assert reference_data_cache.snapshot()["entries"] == 1
+
+def test_uncommitted_rows_do_not_leak_to_other_sessions(database):
+    with RepositoryManagerFactory.create() as repos:
+        repos.business_partner_repository.get_or_create(bpnl=PARTNER_BPNL, name="uncommitted")
+        assert repos.business_partner_repository.get_by_bpnl(PARTNER_BPNL).name == "uncommitted"
+        repos.rollback()
+
+    assert partner_name() is None
+
+def test_writes_invalidate_the_cached_entries(business_partner, database):
+    assert partner_name() == "partner"
+    with RepositoryManagerFactory.create() as repos:
+        repos.business_partner_repository.get_by_bpnl(PARTNER_BPNL).name = "renamed"
+    assert partner_name() == "renamed"
+
+    # Core writes bypassing the session are invalidated as well
+    with RepositoryManagerFactory.create() as repos:
+        repos.business_partner_repository.bulk_upsert([{"name": "upserted", "bpnl": PARTNER_BPNL}],
+            conflict_columns=["bpnl"], update_columns=["name"])
+    assert partner_name() == "upserted"
+
+def test_least_recently_used_entries_are_evicted(database, monkeypatch):
+    monkeypatch.setattr(reference_data_cache, "max_size", 2)
+    with RepositoryManagerFactory.create() as repos:
+        for i in range(3):
+            repos.legal_entity_repository.get_or_create(bpnl=f"BPNL00000000000{i}")
+    with RepositoryManagerFactory.create() as repos:
+        for i in range(3):
+            repos.legal_entity_repository.get_by_bpnl(f"BPNL00000000000{i}")
+    assert reference_data_cache.snapshot()["entries"] == 2
+
+    with count_statements(database) as statements:
+        with RepositoryManagerFactory.create() as repos:
+            repos.legal_entity_repository.get_by_bpnl("BPNL000000000002")
+            repos.legal_entity_repository.get_by_bpnl("BPNL000000000000")
+    assert len(statements) == 1
+
+def test_expired_entries_are_reloaded(business_partner, database, monkeypatch):
+    monkeypatch.setattr(reference_data_cache, "ttl", -1)
+    partner_name()
+    with count_statements(database) as statements:
+        assert partner_name() == "partner"
+    assert len(statements) == 1
+
+def test_cache_statistics_endpoint(api, business_partner):
+    def counters():
+        statistics = api.get("/health/reference-data-cache").json()["models"].get("BusinessPartner", {})
+        return statistics.get("hits", 0), statistics.get("misses", 0)
+
+    hits, misses = counters()
+    partner_name()
+    partner_name()
+    assert counters() == (hits + 1, misses + 1)
@@ -0,0 +1,117 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.models import PartnerCatalogPart
+from models.services.part_management import CatalogPartCreate
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+BUSINESS_PARTNER_NAME = "customer"
+
+@pytest.fixture
+def partner_catalog_parts(database):
+    service = PartManagementService()
+    for manufacturer_part_id in ("part-a", "part-b"):
+        service.create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId=manufacturer_part_id, name=manufacturer_part_id))
+    with RepositoryManagerFactory.create() as repos:
+        business_partner, _ = repos.business_partner_repository.get_or_create("BPNL000000000002", BUSINESS_PARTNER_NAME)
+        for manufacturer_part_id in ("part-a", "part-b"):
+            catalog_part = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, manufacturer_part_id)[0][0]
+            repos.partner_catalog_part_repository.create(PartnerCatalogPart(
+                business_partner_id=business_partner.id, customer_part_id=f"customer-{manufacturer_part_id}", catalog_part_id=catalog_part.id))
+        repos.commit()
+
+def serialized_part(manufacturer_part_id: str, part_instance_id: str, **values):
+    return {
+        "manufacturerId": MANUFACTURER_ID,
+        "manufacturerPartId": manufacturer_part_id,
+        "partInstanceId": part_instance_id,
+        "customerPartId": f"customer-{manufacturer_part_id}",
+        "businessPartnerName": BUSINESS_PARTNER_NAME,
+        **values,
+    }
+
+def stored_parts(api):
+    response = api.get("/part-management/serialized-part")
+    assert response.status_code == 200
+    return sorted((part["manufacturerPartId"], part["partInstanceId"]) for part in response.json())
+
+def twin_count():
+    with RepositoryManagerFactory.create() as repos:
+        return len(repos.twin_repository.find_all())
+
+def test_serialized_parts_are_created_in_bulk_with_a_twin_each(api, partner_catalog_parts):
+    parts = [serialized_part("part-a", f"SN-{i}") for i in range(3)] + [serialized_part("part-b", "SN-0", van="VAN-1")]
+    response = api.post("/part-management/serialized-part/bulk", json=parts)
+    assert response.status_code == 200
+    created = response.json()
+    assert [(part["manufacturerPartId"], part["partInstanceId"]) for part in created] == [(part["manufacturerPartId"], part["partInstanceId"]) for part in parts]
+    assert created[3]["van"] == "VAN-1"
+    assert created[3]["businessPartner"] == {"name": BUSINESS_PARTNER_NAME, "bpnl": "BPNL000000000002"}
+
+    assert stored_parts(api) == [("part-a", "SN-0"), ("part-a", "SN-1"), ("part-a", "SN-2"), ("part-b", "SN-0")]
+    assert twin_count() == 4
+
+def test_parts_given_twice_are_rejected(api, partner_catalog_parts):
+    with pytest.raises(ValueError, match="given more than once"):
+        api.post("/part-management/serialized-part/bulk", json=[serialized_part("part-a", "SN-1"), serialized_part("part-a", "SN-1")])
+    assert stored_parts(api) == []
+
+def test_no_part_is_created_if_one_already_exists(api, partner_catalog_parts):
+    response = api.post("/part-management/serialized-part", json=serialized_part("part-a", "SN-1"))
+    assert response.status_code == 200
+
+    with pytest.raises(ValueError, match="already exist: .*SN-1"):
+        api.post("/part-management/serialized-part/bulk", json=[serialized_part("part-a", "SN-2"), serialized_part("part-a", "SN-1")])
+    assert stored_parts(api) == [("part-a", "SN-1")]
+    assert twin_count() == 1
+
+def test_parts_without_customer_part_mapping_are_rejected(api, partner_catalog_parts):
+    with pytest.raises(ValueError, match="No customer part mapping exists"):
+        api.post("/part-management/serialized-part/bulk", json=[serialized_part("part-a", "SN-1"), serialized_part("part-a", "SN-2", businessPartnerName="nobody")])
+    with pytest.raises(ValueError, match="No customer part mapping exists"):
+        api.post("/part-management/serialized-part", json=serialized_part("part-c", "SN-1"))
+    assert stored_parts(api) == []
+
+def test_parts_with_another_customer_part_id_are_rejected(api, partner_catalog_parts):
+    with pytest.raises(ValueError, match="do not match the customer part mappings"):
+        api.post("/part-management/serialized-part/bulk", json=[serialized_part("part-a", "SN-1"), serialized_part("part-b", "SN-1", customerPartId="customer-part-a")])
+    assert stored_parts(api) == []
+
+def test_deleted_part_and_its_twin_are_removed(api, partner_catalog_parts):
+    api.post("/part-management/serialized-part/bulk", json=[serialized_part("part-a", "SN-1"), serialized_part("part-a", "SN-2")])
+
+    response = api.request("DELETE", "/part-management/serialized-part", json=serialized_part("part-a", "SN-1"))
+    assert response.status_code == 204
+    assert stored_parts(api) == [("part-a", "SN-2")]
+    assert twin_count() == 1
+
+    with pytest.raises(ValueError, match="does not exist"):
+        api.request("DELETE", "/part-management/serialized-part", json=serialized_part("part-a", "SN-1"))
+
+    # The key of a deleted part can be used again
+    response = api.post("/part-management/serialized-part", json=serialized_part("part-a", "SN-1"))
+    assert response.status_code == 200
+    assert stored_parts(api) == [("part-a", "SN-1"), ("part-a", "SN-2")]
@@ -0,0 +1,93 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+from sqlmodel import Session, select
+
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.sharing_status import refresh_catalog_part_status
+from models.metadata_database.models import CatalogPart
+from models.services.part_management import CatalogPartCreate, SharingStatus
+from services.part_management_service import PartManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+
+@pytest.fixture
+def catalog_part_id(database):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part", name="part"))
+    with Session(database) as session:
+        return session.exec(select(CatalogPart.id)).one()
+
+def _stored_status(database, catalog_part_id: int) -> SharingStatus:
+    with Session(database) as session:
+        return SharingStatus(session.exec(select(CatalogPart.status).where(CatalogPart.id == catalog_part_id)).one())
+
+def test_status_column_follows_twin_registration_and_exchange(database, catalog_part_id):
+    assert _stored_status(database, catalog_part_id) == SharingStatus.DRAFT
+
+    with RepositoryManagerFactory.create() as repos:
+        legal_entity, _ = repos.legal_entity_repository.get_or_create(bpnl=MANUFACTURER_ID)
+        stack, _ = repos.enablement_service_stack_repository.get_or_create(name="stack", legal_entity_id=legal_entity.id)
+        twin = repos.twin_repository.create_new()
+        repos.flush()
+        repos.catalog_part_repository.find_by_id(catalog_part_id).twin_id = twin.id
+        repos.twin_registration_repository.create_new(twin_id=twin.id, enablement_service_stack_id=stack.id)
+    assert _stored_status(database, catalog_part_id) == SharingStatus.PENDING
+
+    with RepositoryManagerFactory.create() as repos:
+        repos.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(twin.id, stack.id).dtr_registered = True
+    assert _stored_status(database, catalog_part_id) == SharingStatus.REGISTERED
+
+    with RepositoryManagerFactory.create() as repos:
+        business_partner, _ = repos.business_partner_repository.get_or_create(bpnl="BPNL000000000002", name="partner")
+        agreement, _ = repos.data_exchange_agreement_repository.get_or_create(business_partner_id=business_partner.id, name="Default")
+        repos.twin_exchange_repository.create_new(twin_id=twin.id, data_exchange_agreement_id=agreement.id)
+    assert _stored_status(database, catalog_part_id) == SharingStatus.SHARED
+
+    with RepositoryManagerFactory.create() as repos:
+        repos.twin_exchange_repository.delete_obj(repos.twin_exchange_repository.get_by_twin_id_data_exchange_agreement_id(twin.id, agreement.id))
+    assert _stored_status(database, catalog_part_id) == SharingStatus.REGISTERED
+
+def test_status_column_follows_core_bulk_writes(database, catalog_part_id):
+    with RepositoryManagerFactory.create() as repos:
+        legal_entity, _ = repos.legal_entity_repository.get_or_create(bpnl=MANUFACTURER_ID)
+        stack, _ = repos.enablement_service_stack_repository.get_or_create(name="stack", legal_entity_id=legal_entity.id)
+        twin = repos.twin_repository.create_new()
+        repos.flush()
+        repos.catalog_part_repository.find_by_id(catalog_part_id).twin_id = twin.id
+        repos.twin_registration_repository.create_new(twin_id=twin.id, enablement_service_stack_id=stack.id, dtr_registered=True)
+        business_partner, _ = repos.business_partner_repository.get_or_create(bpnl="BPNL000000000002", name="partner")
+        agreement, _ = repos.data_exchange_agreement_repository.get_or_create(business_partner_id=business_partner.id, name="Default")
+        repos.flush()
+        repos.twin_exchange_repository.bulk_insert([{"twin_id": twin.id, "data_exchange_agreement_id": agreement.id}])
+    assert _stored_status(database, catalog_part_id) == SharingStatus.SHARED
+
+def test_refresh_recomputes_stale_status(database, catalog_part_id):
+    with Session(database) as session:
+        session.get(CatalogPart, catalog_part_id).status = SharingStatus.SHARED.value
+        session.commit()
+    assert _stored_status(database, catalog_part_id) == SharingStatus.SHARED
+
+    with Session(database) as session:
+        assert refresh_catalog_part_status(session) == 1
+        session.commit()
+    assert _stored_status(database, catalog_part_id) == SharingStatus.DRAFT
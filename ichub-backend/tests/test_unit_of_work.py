@@ -0,0 +1,106 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from contextlib import contextmanager
+import inspect
+
+import pytest
+from sqlalchemy import event
+
+from managers.metadata_database.manager import RepositoryManagerFactory, get_repository_manager
+from models.services.part_management import CatalogPartCreate
+from models.services.sharing_management import ShareCatalogPart
+from models.services.twin_management import CatalogPartTwinCreate
+from services.part_management_service import PartManagementService
+from services.sharing_service import SharingService
+from services.twin_management_service import TwinManagementService
+
+MANUFACTURER_ID = "BPNL000000000001"
+SHARE = {"manufacturerId": MANUFACTURER_ID, "manufacturerPartId": "part", "businessPartnerNumber": "BPNL000000000002", "customerPartId": "customer-part"}
+
+@pytest.fixture
+def catalog_part(database):
+    PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part", name="Part"))
+
+@contextmanager
+def count_commits(engine):
+    commits = []
+    def record(connection):
+        commits.append(connection)
+    event.listen(engine, "commit", record)
+    try:
+        yield commits
+    finally:
+        event.remove(engine, "commit", record)
+
+def business_partner_numbers():
+    with RepositoryManagerFactory.create() as repos:
+        return [business_partner.bpnl for business_partner in repos.business_partner_repository.find_all()]
+
+def test_use_shares_the_ambient_repository_manager(database):
+    with RepositoryManagerFactory.create() as repos:
+        with RepositoryManagerFactory.use(repos) as nested:
+            assert nested is repos
+        with RepositoryManagerFactory.use() as own:
+            assert own is not repos
+
+def test_nested_service_calls_are_rolled_back_with_the_ambient_unit_of_work(database):
+    with RepositoryManagerFactory.create() as repos:
+        PartManagementService().create_catalog_part(CatalogPartCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part", name="Part"), repo=repos)
+        assert repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(MANUFACTURER_ID, "part")
+        repos.rollback()
+
+    assert PartManagementService().get_catalog_part(MANUFACTURER_ID, "part") is None
+
+def test_share_request_is_one_transaction(api, catalog_part, remote_services, database):
+    with count_commits(database) as commits:
+        response = api.post("/share/catalog-part", json=SHARE)
+    assert response.status_code == 200
+    assert response.json()["customerPartIds"] == {"customer-part": {"name": "Partner_BPNL000000000002", "bpnl": "BPNL000000000002"}}
+    assert len(commits) == 1
+    assert business_partner_numbers() == ["BPNL000000000002"]
+
+def test_failed_share_request_is_rolled_back_completely(api, catalog_part, remote_services):
+    remote_services.connector.register_dtr_offer.return_value = (None, None, None, None)
+    with pytest.raises(Exception, match="Digital Twin Registry was not able to be registered"):
+        api.post("/share/catalog-part", json=SHARE)
+
+    # The business partner, partner mapping and twin created before the failure are not kept
+    assert business_partner_numbers() == []
+    assert PartManagementService().get_catalog_part(MANUFACTURER_ID, "part").customer_part_ids == {}
+
+def test_share_leaves_the_injected_unit_of_work_to_its_owner(catalog_part, remote_services, database):
+    with count_commits(database) as commits:
+        with RepositoryManagerFactory.create() as repos:
+            SharingService().share_catalog_part(ShareCatalogPart(**SHARE), repo=repos)
+            TwinManagementService().create_catalog_part_twin(CatalogPartTwinCreate(manufacturerId=MANUFACTURER_ID, manufacturerPartId="part"), repo=repos)
+            assert commits == []
+            repos.rollback()
+
+    assert business_partner_numbers() == []
+    assert PartManagementService().get_catalog_part(MANUFACTURER_ID, "part").customer_part_ids == {}
+
+def test_endpoints_injecting_the_repository_manager_are_not_async(api):
+    endpoints = [route.endpoint for route in api.app.routes if hasattr(route, "dependant")
+        and any(dependency.call is get_repository_manager for dependency in route.dependant.dependencies)]
+    assert endpoints
+    assert [endpoint.__name__ for endpoint in endpoints if inspect.iscoroutinefunction(endpoint)] == []
@@ -0,0 +1,125 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import time
+from threading import Event
+
+import pytest
+from fastapi.testclient import TestClient
+
+import warmup
+from database import engine, prefill_pools
+from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.metadata_database.reference_cache import preload_reference_data, reference_data_cache
+from models.metadata_database.models import BusinessPartner, DataExchangeAgreement, LegalEntity
+
+@pytest.fixture
+def application(database, monkeypatch):
+    """The application with a fresh warm-up state, connecting to no remote endpoint."""
+    monkeypatch.setattr(warmup, "_state", {"status": "pending", "durationSeconds": None, "steps": {}})
+    monkeypatch.setattr(warmup, "_task", None)
+    monkeypatch.setattr(warmup, "warmup_config", {"retryDelay": 0, "timeout": 1})
+    monkeypatch.setattr(warmup, "_remote_endpoints", lambda: [("edcControlPlane", "https://connector.example")])
+    connected = []
+    async def connect(url):
+        connected.append(url)
+        return 200
+    monkeypatch.setattr(warmup, "_connect", connect)
+    from controllers.fastapi.app import app
+    return app
+
+def wait_until_ready(client, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/health/ready")
+        if response.status_code == 200:
+            return response.json()
+        time.sleep(0.01)
+    raise AssertionError(f"Not ready after {timeout} s: {response.json()}")
+
+def test_not_ready_until_the_warmup_has_completed(application, monkeypatch):
+    database_reachable = Event()
+    def prefill(connections):
+        database_reachable.wait(5)
+        return prefill_pools(connections)
+    monkeypatch.setattr(warmup, "prefill_pools", prefill)
+
+    with TestClient(application) as client:
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+        assert response.json()["status"] == "running"
+
+        database_reachable.set()
+        status = wait_until_ready(client)
+    assert status["status"] == "completed"
+    assert set(status["steps"]) == {"databasePool", "referenceDataCache", "remoteEndpoint:edcControlPlane"}
+    assert all(step["status"] == "completed" for step in status["steps"].values())
+
+def test_warmup_waits_for_the_database(application, monkeypatch):
+    attempts = []
+    def prefill(connections):
+        attempts.append(connections)
+        if len(attempts) < 3:
+            raise ConnectionError("database not reachable")
+        return prefill_pools(connections)
+    monkeypatch.setattr(warmup, "prefill_pools", prefill)
+
+    with TestClient(application) as client:
+        status = wait_until_ready(client)
+    assert len(attempts) == 3
+    assert status["steps"]["databasePool"]["status"] == "completed"
+
+def test_unreachable_remote_endpoints_do_not_prevent_readiness(application, monkeypatch):
+    async def connect(url):
+        raise ConnectionError(f"{url} not reachable")
+    monkeypatch.setattr(warmup, "_connect", connect)
+
+    with TestClient(application) as client:
+        status = wait_until_ready(client)
+    assert status["steps"]["remoteEndpoint:edcControlPlane"] == {
+        "status": "failed", "durationSeconds": status["steps"]["remoteEndpoint:edcControlPlane"]["durationSeconds"],
+        "error": "https://connector.example not reachable"}
+
+def test_ready_without_warmup(application, monkeypatch):
+    monkeypatch.setattr(warmup, "warmup_enabled", False)
+    with TestClient(application) as client:
+        response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "disabled"
+
+def test_pools_are_prefilled_up_to_their_size(database):
+    engine.dispose()
+    assert prefill_pools(3) == 3
+    assert engine.pool.checkedin() == 3
+    assert prefill_pools(100) == engine.pool.size()
+
+def test_reference_data_is_preloaded(database):
+    with RepositoryManagerFactory.create() as repos:
+        repos.legal_entity_repository.create(LegalEntity(bpnl="BPNL000000000001"))
+        business_partner = repos.business_partner_repository.create(BusinessPartner(name="partner", bpnl="BPNL000000000002"))
+        repos.data_exchange_agreement_repository.create(DataExchangeAgreement(name="default", business_partner=business_partner))
+    reference_data_cache.clear()
+
+    # Legal entity and business partner by BPNL, agreements by business partner
+    assert preload_reference_data() == 3
+    assert reference_data_cache.snapshot()["entries"] == 3
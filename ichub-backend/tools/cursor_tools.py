@@ -0,0 +1,84 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import json
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from tools.exceptions import InvalidCursorError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Response header carrying the cursor of the next page for list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+def encode_cursor(key: Any) -> str:
+    """Encode the keyset position of the last returned row as an opaque cursor."""
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Any]:
+    """Decode a cursor created by `encode_cursor`. Returns None if no cursor was given."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(cursor) from e
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode a cursor whose keyset position is a single integer id."""
+    key = decode_cursor(cursor)
+    if key is not None and (not isinstance(key, int) or isinstance(key, bool)):
+        raise InvalidCursorError(cursor)
+    return key
+
+def decode_ranked_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """Decode a cursor whose keyset position is the (score, id) pair of a row of a ranked result."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return None
+    if (not isinstance(key, list) or len(key) != 2
+            or not isinstance(key[0], (int, float)) or isinstance(key[0], bool)
+            or not isinstance(key[1], int) or isinstance(key[1], bool)):
+        raise InvalidCursorError(cursor)
+    return float(key[0]), key[1]
+
+def clamp_page_size(page_size: Optional[int]) -> int:
+    """Return the page size to use, falling back to the default and capped at the maximum."""
+    if page_size is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+def split_page(rows: List[T], page_size: int, key: Callable[[T], Any]) -> Tuple[List[T], Optional[str]]:
+    """
+    Split the rows of a keyset query fetched with a limit of `page_size + 1`
+    into the rows of the page and the cursor of the next page (None if it is the last page).
+    """
+    if len(rows) <= page_size:
+        return list(rows), None
+    page = list(rows[:page_size])
+    return page, encode_cursor(key(page[-1]))
@@ -24,3 +24,8 @@ class InvalidUUIDError(Exception):
     def __init__(self, global_id: str):
         self.global_id = global_id
         super().__init__(f"Invalid UUID: {global_id}")
+
+class InvalidCursorError(Exception):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor}")
@@ -0,0 +1,38 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from typing import Iterable, Iterator, List
+
+from pydantic import BaseModel
+
+# Media type of the streamed exports: one JSON document per line
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def to_ndjson(batches: Iterable[List[BaseModel]]) -> Iterator[str]:
+    """
+    Serialize batches of models as newline delimited JSON (with the camelCase aliases of the API).
+    One chunk is produced per batch, so a streaming response does not switch threads for every single row.
+    """
+    for batch in batches:
+        if batch:
+            yield "".join(item.model_dump_json(by_alias=True) + "\n" for item in batch)
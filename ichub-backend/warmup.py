@@ -0,0 +1,119 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Warm-up of a backend process at startup, before it reports ready to serve requests (`/health/ready`).
+
+The warm-up opens the connections of the database pools (see `prefill_pools`), loads the reference data
+cache (see `preload_reference_data`) and connects to the remote endpoints (EDC control plane and Digital Twin
+Registry), so that the first requests routed to a new replica do not pay for it. It runs in the background
+on the event loop of the application (see `start_warmup`), the process is alive but not ready meanwhile.
+
+The database pools are required: the warm-up is retried until the database can be reached. The other steps
+only fail with a warning (e.g. an unreachable connector must not keep the backend from serving its own data).
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from database import prefill_async_pools, prefill_pools
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.change_feed import wait_for_change_feed
+from managers.metadata_database.reference_cache import preload_reference_data
+
+logger = LoggingManager.get_logger(__name__)
+
+warmup_config = ConfigManager.get_config("warmup", default={}) or {}
+warmup_enabled = bool(warmup_config.get("enabled", True))
+
+_state: Dict[str, Any] = {"status": "pending", "durationSeconds": None, "steps": {}}
+_task: Optional[asyncio.Task] = None
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Return whether the warm-up has completed, with the outcome and duration of its steps."""
+    return {
+        "ready": not warmup_enabled or _state["status"] == "completed",
+        "status": _state["status"] if warmup_enabled else "disabled",
+        "durationSeconds": _state["durationSeconds"],
+        "steps": {name: dict(step) for name, step in _state["steps"].items()},
+    }
+
+def start_warmup() -> None:
+    """Start the warm-up in the background on the running event loop, unless disabled."""
+    global _task
+    if warmup_enabled and _task is None:
+        _task = asyncio.get_running_loop().create_task(_warm_up(), name="warmup")
+
+async def _warm_up() -> None:
+    _state["status"] = "running"
+    start = perf_counter()
+    retry_delay = float(warmup_config.get("retryDelay", 5))
+    # The database is required, the warm-up waits for it
+    while not await _run_step("databasePool", _prefill_pools):
+        logger.warning(f"The metadata database is not reachable, retrying the warm-up in {retry_delay} s.")
+        await asyncio.sleep(retry_delay)
+    steps: List[Tuple[str, Callable[[], Awaitable[Any]]]] = []
+    if warmup_config.get("referenceData", True):
+        steps.append(("referenceDataCache", _preload_reference_data))
+    if warmup_config.get("remoteEndpoints", True):
+        steps.extend((f"remoteEndpoint:{name}", lambda url=url: _connect(url)) for name, url in _remote_endpoints())
+    await asyncio.gather(*(_run_step(name, step) for name, step in steps))
+    _state["durationSeconds"] = round(perf_counter() - start, 3)
+    _state["status"] = "completed"
+    logger.info(f"Warm-up completed in {_state['durationSeconds']} s, ready to serve requests.")
+
+async def _run_step(name: str, step: Callable[[], Awaitable[Any]]) -> bool:
+    start = perf_counter()
+    try:
+        result = await step()
+    except Exception as e:
+        logger.warning(f"Warm-up step {name} failed: {e}")
+        _state["steps"][name] = {"status": "failed", "durationSeconds": round(perf_counter() - start, 3), "error": str(e)}
+        return False
+    _state["steps"][name] = {"status": "completed", "durationSeconds": round(perf_counter() - start, 3), "result": result}
+    return True
+
+async def _prefill_pools() -> int:
+    connections = int(warmup_config.get("poolConnections", 5))
+    return await asyncio.to_thread(prefill_pools, connections) + await prefill_async_pools(connections)
+
+async def _preload_reference_data() -> int:
+    # Loaded before the change feed listens, the cache would be invalidated again when it connects
+    if not await asyncio.to_thread(wait_for_change_feed, float(warmup_config.get("timeout", 10))):
+        logger.warning("The change feed is not listening yet, loading the reference data cache anyway.")
+    return await asyncio.to_thread(preload_reference_data)
+
+def _remote_endpoints() -> List[Tuple[str, str]]:
+    endpoints = [
+        ("edcControlPlane", ConfigManager.get_config("edc.controlplane.hostname")),
+        ("digitalTwinRegistry", ConfigManager.get_config("digitalTwinRegistry.hostname")),
+    ]
+    return [(name, url) for name, url in endpoints if url]
+
+async def _connect(url: str) -> int:
+    """Connect to a remote endpoint (DNS, TCP and TLS), returning the HTTP status; any response means reachable."""
+    async with httpx.AsyncClient(timeout=float(warmup_config.get("timeout", 10))) as client:
+        return (await client.head(url)).status_code
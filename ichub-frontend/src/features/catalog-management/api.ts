@@ -22,6 +22,7 @@
 
 import axios from 'axios';
 import { getIchubBackendUrl } from '../../services/EnvironmentService';
+import { fetchAllPages } from '../../services/PaginationService';
 import { ApiPartData } from '../../types/product';
 import { CatalogPartTwinCreateType, TwinReadType } from '../../types/twin';
 
@@ -31,8 +32,7 @@ const TWIN_MANAGEMENT_BASE_PATH = '/twin-management/catalog-part-twin';
 const backendUrl = getIchubBackendUrl();
 
 export const fetchCatalogParts = async (): Promise<ApiPartData[]> => {
-  const response = await axios.get<ApiPartData[]>(`${backendUrl}${CATALOG_PART_MANAGEMENT_BASE_PATH}`);
-  return response.data;
+  return fetchAllPages<ApiPartData>(`${backendUrl}${CATALOG_PART_MANAGEMENT_BASE_PATH}`);
 };
 
 export const fetchCatalogPart = async (
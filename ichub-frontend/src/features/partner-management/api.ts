@@ -22,6 +22,7 @@
 
 import axios from 'axios';
 import { getIchubBackendUrl } from '../../services/EnvironmentService';
+import { fetchAllPages } from '../../services/PaginationService';
 import { PartnerInstance } from '../../types/partner';
 import { ApiPartData } from '../../types/product';
 
@@ -30,8 +31,7 @@ const PART_MANAGEMENT_BASE_PATH = '/part-management/catalog-part'; // New base p
 const backendUrl = getIchubBackendUrl();
 
 export const fetchPartners = async (): Promise<PartnerInstance[]> => {
-  const response = await axios.get<PartnerInstance[]>(`${backendUrl}${PARTNER_MANAGEMENT_BASE_PATH}`);
-  return response.data;
+  return fetchAllPages<PartnerInstance>(`${backendUrl}${PARTNER_MANAGEMENT_BASE_PATH}`);
 };
 
 export const createPartner = async (partnerData: { name: string; bpnl: string }): Promise<PartnerInstance> => {